@@ -0,0 +1,69 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Precompile the runtime instruction and adapter files for one role profile
+# into a content-hashed bundle. Runs at image build time; init-workstation.sh
+# copies bundled files at startup while the inputs key in manifest.tsv still
+# matches its environment, and renders them itself otherwise.
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+
+usage() {
+  cat <<'EOF'
+Usage:
+  build-runtime-instruction-bundle.sh [options]
+
+Options:
+  --output-dir <dir>     Bundle directory (default: RUNTIME_INSTRUCTION_BUNDLE_DIR
+                         or /etc/codex/runtime-instruction-bundle)
+  --role-profile <slug>  Role profile to render (default: ROLE_PROFILE,
+                         IMAGE_ROLE_PROFILE, or implementation-specialist)
+  --help
+
+Notes:
+  - Inputs use the same defaults as init-workstation.sh (WORKSPACE_REPO_*,
+    RUNTIME_* instruction paths), so build with the runtime defaults.
+  - An existing bundle directory is replaced.
+EOF
+}
+
+OUTPUT_DIR="${RUNTIME_INSTRUCTION_BUNDLE_DIR:-/etc/codex/runtime-instruction-bundle}"
+RUNTIME_INSTRUCTION_RENDERERS_LIB="${RUNTIME_INSTRUCTION_RENDERERS_LIB:-${SCRIPT_DIR}/runtime-instruction-renderers.sh}"
+
+while [ $# -gt 0 ]; do
+  case "$1" in
+    --output-dir)
+      OUTPUT_DIR="${2:-}"
+      shift 2
+      ;;
+    --role-profile)
+      ROLE_PROFILE="${2:-}"
+      shift 2
+      ;;
+    --help|-h)
+      usage
+      exit 0
+      ;;
+    *)
+      echo "Unknown argument: $1" >&2
+      usage >&2
+      exit 1
+      ;;
+  esac
+done
+
+if [ -z "$OUTPUT_DIR" ]; then
+  echo "--output-dir must not be empty." >&2
+  exit 1
+fi
+
+# shellcheck source=runtime-instruction-renderers.sh
+source "$RUNTIME_INSTRUCTION_RENDERERS_LIB"
+apply_runtime_instruction_input_defaults
+
+rm -rf "$OUTPUT_DIR"
+mkdir -p "$OUTPUT_DIR"
+build_runtime_instruction_bundle "$OUTPUT_DIR"
+
+echo "Built runtime instruction bundle for '${ROLE_PROFILE}' at ${OUTPUT_DIR}:"
+cat "${OUTPUT_DIR}/manifest.tsv"
@@ -2,6 +2,7 @@
 set -euo pipefail
 
 REMINT_HELPER="${REMINT_HELPER:-/usr/local/bin/remint-role-github-app-auth.sh}"
+ROLE_GITHUB_TOKEN_BROKER="${ROLE_GITHUB_TOKEN_BROKER:-/usr/local/bin/role-github-token-broker}"
 MODE="${ROLE_GITHUB_AUTH_MODE:-${RUNTIME_ROLE_GITHUB_AUTH_MODE:-}}"
 
 gh_cmd() {
@@ -16,6 +17,14 @@ auth_api_ok() {
   gh_cmd api graphql -f query='query { viewer { login } }' --jq '.data.viewer.login' >/dev/null 2>&1
 }
 
+# Fast path: a running token broker hands out a cached, proactively refreshed
+# installation token over its local socket, so no status probe or re-mint is needed.
+if [ "$MODE" = "app" ] && [ -x "$ROLE_GITHUB_TOKEN_BROKER" ]; then
+  if broker_token="$("$ROLE_GITHUB_TOKEN_BROKER" token --broker-only 2>/dev/null)" && [ -n "$broker_token" ]; then
+    exec env -u GITHUB_TOKEN GH_TOKEN="$broker_token" gh "$@"
+  fi
+fi
+
 if [ "$MODE" = "app" ] && [ -x "$REMINT_HELPER" ]; then
   if ! auth_status_ok || ! auth_api_ok; then
     "$REMINT_HELPER" >/dev/null
@@ -13,28 +13,30 @@ SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 CODEX_HOME_DIR="${CODEX_HOME:-/root/.codex}"
 DEFAULT_CONFIG="${DEFAULT_CONFIG:-/etc/codex/config.toml}"
 TARGET_CONFIG="${CODEX_HOME_DIR}/config.toml"
-ROLE_PROFILE="${ROLE_PROFILE:-${IMAGE_ROLE_PROFILE:-implementation-specialist}}"
+RUNTIME_INSTRUCTION_RENDERERS_LIB="${RUNTIME_INSTRUCTION_RENDERERS_LIB:-${SCRIPT_DIR}/runtime-instruction-renderers.sh}"
+if [ ! -f "$RUNTIME_INSTRUCTION_RENDERERS_LIB" ]; then
+  RUNTIME_INSTRUCTION_RENDERERS_LIB="/usr/local/lib/workstation/runtime-instruction-renderers.sh"
+fi
+# shellcheck source=runtime-instruction-renderers.sh
+source "$RUNTIME_INSTRUCTION_RENDERERS_LIB"
+# ROLE_PROFILE, WORKSPACE_REPO_* and RUNTIME_* instruction paths feed the
+# prebuilt bundle's inputs key, so their defaults live in the shared lib.
+apply_runtime_instruction_input_defaults
 ROLE_PROFILES_DIR="${ROLE_PROFILES_DIR:-/etc/codex/role-profiles}"
 ROLE_INSTRUCTIONS_DIR_REL="${ROLE_INSTRUCTIONS_DIR_REL:-10-templates/agent-instructions}"
 BAKED_ROLE_INSTRUCTIONS_DIR="${BAKED_ROLE_INSTRUCTIONS_DIR:-/etc/codex/agent-instructions}"
 BAKED_COMPILED_ROLE_INSTRUCTIONS_DIR="${BAKED_COMPILED_ROLE_INSTRUCTIONS_DIR:-/etc/codex/runtime-role-instructions}"
+RUNTIME_INSTRUCTION_BUNDLE_DIR="${RUNTIME_INSTRUCTION_BUNDLE_DIR:-/etc/codex/runtime-instruction-bundle}"
 COMPLIANCE_REVIEW_BRIEF_WORKSPACE_REL="${COMPLIANCE_REVIEW_BRIEF_WORKSPACE_REL:-10-templates/compliance-officer-pr-review-brief.md}"
 COMPLIANCE_REVIEW_BRIEF_BAKED="${COMPLIANCE_REVIEW_BRIEF_BAKED:-/etc/codex/agent-instructions/references/compliance-officer-pr-review-brief.md}"
-RUNTIME_ROLE_INSTRUCTIONS_FILE="${RUNTIME_ROLE_INSTRUCTIONS_FILE:-/workspace/instructions/role-instructions.md}"
-RUNTIME_AGENTS_ADAPTER_FILE="${RUNTIME_AGENTS_ADAPTER_FILE:-/workspace/instructions/AGENTS.md}"
-RUNTIME_COPILOT_INSTRUCTIONS_FILE="${RUNTIME_COPILOT_INSTRUCTIONS_FILE:-/workspace/instructions/copilot-instructions.md}"
-RUNTIME_CONTINUE_INSTRUCTIONS_FILE="${RUNTIME_CONTINUE_INSTRUCTIONS_FILE:-/workspace/instructions/continue-instructions.md}"
-RUNTIME_AGENT_RUNTIME_POLICY_FILE="${RUNTIME_AGENT_RUNTIME_POLICY_FILE:-/workspace/instructions/agent-runtime-policy.md}"
 RUNTIME_VSCODE_SETTINGS_FILE="${RUNTIME_VSCODE_SETTINGS_FILE:-/workspace/settings/vscode/settings.json}"
 RUNTIME_VSCODE_MACHINE_SETTINGS_FILE="${RUNTIME_VSCODE_MACHINE_SETTINGS_FILE:-/root/.vscode-server/data/Machine/settings.json}"
 RUNTIME_GITHUB_APP_AUTH_METADATA_FILE="${RUNTIME_GITHUB_APP_AUTH_METADATA_FILE:-/workspace/instructions/role-github-app-auth.env}"
-WORKSPACE_REPO_OWNER="${WORKSPACE_REPO_OWNER:-Josh-Phillips-LLC}"
-WORKSPACE_REPO_NAME_DEFAULT="${WORKSPACE_REPO_NAME_DEFAULT:-context-engineering-role-${ROLE_PROFILE}}"
-WORKSPACE_REPO_URL="${WORKSPACE_REPO_URL:-https://github.com/${WORKSPACE_REPO_OWNER}/${WORKSPACE_REPO_NAME_DEFAULT}.git}"
-WORKSPACE_REPO_DIR="${WORKSPACE_REPO_DIR:-/workspace/Projects/${WORKSPACE_REPO_NAME_DEFAULT}}"
 AUTO_CLONE_WORKSPACE_REPO="${AUTO_CLONE_WORKSPACE_REPO:-true}"
 ALLOW_FALLBACK_INSTRUCTIONS="${ALLOW_FALLBACK_INSTRUCTIONS:-false}"
 ROLE_GITHUB_APP_AUTH_SCRIPT="${ROLE_GITHUB_APP_AUTH_SCRIPT:-${SCRIPT_DIR}/setup-role-github-app-auth.sh}"
+ROLE_GITHUB_TOKEN_BROKER="${ROLE_GITHUB_TOKEN_BROKER:-$(command -v role-github-token-broker || echo "${SCRIPT_DIR}/role-github-token-broker.py")}"
+ROLE_GITHUB_TOKEN_BROKER_LOG="${ROLE_GITHUB_TOKEN_BROKER_LOG:-/tmp/role-github-token-broker.log}"
 GH_BOOTSTRAP_TOKEN="${GH_BOOTSTRAP_TOKEN:-}"
 ROLE_GITHUB_AUTH_MODE_RUNTIME="${ROLE_GITHUB_AUTH_MODE:-}"
 ROLE_GITHUB_APP_ID_RUNTIME="${ROLE_GITHUB_APP_ID:-}"
@@ -42,6 +44,9 @@ ROLE_GITHUB_APP_INSTALLATION_ID_RUNTIME="${ROLE_GITHUB_APP_INSTALLATION_ID:-}"
 ROLE_GITHUB_APP_PRIVATE_KEY_PATH_RUNTIME="${ROLE_GITHUB_APP_PRIVATE_KEY_PATH:-}"
 ROLE_GIT_IDENTITY_NAME_RUNTIME="${ROLE_GIT_IDENTITY_NAME:-}"
 ROLE_GIT_IDENTITY_EMAIL_RUNTIME="${ROLE_GIT_IDENTITY_EMAIL:-}"
+INIT_PARALLEL="${INIT_PARALLEL:-true}"
+INIT_MAX_JOBS="${INIT_MAX_JOBS:-4}"
+INIT_STARTUP_PROFILE_FILE="${INIT_STARTUP_PROFILE_FILE:-/tmp/workstation-startup-profile.json}"
 
 replace_string_setting() {
   local key="$1"
@@ -149,69 +154,57 @@ apply_role_git_identity() {
   echo "Applied global git identity '${ROLE_GIT_IDENTITY_NAME} <${ROLE_GIT_IDENTITY_EMAIL}>'."
 }
 
+# Install instruction files from "entry=target" pairs. Bundled objects are
+# copied when the prebuilt bundle matches the current inputs; otherwise (env
+# overrides, no bundle) the files are rendered now. Sets
+# RUNTIME_INSTRUCTION_SOURCE to "prebuilt bundle" or "rendered".
+install_runtime_instruction_files() {
+  local pair i
+  local objects_text=""
+  local -a entries=() targets=() objects=()
+
+  for pair in "$@"; do
+    entries+=("${pair%%=*}")
+    targets+=("${pair#*=}")
+  done
+
+  RUNTIME_INSTRUCTION_SOURCE="rendered"
+  if objects_text="$(runtime_instruction_bundle_objects "$RUNTIME_INSTRUCTION_BUNDLE_DIR" "${entries[@]}")"; then
+    mapfile -t objects <<<"$objects_text"
+    RUNTIME_INSTRUCTION_SOURCE="prebuilt bundle"
+  fi
+
+  for i in "${!entries[@]}"; do
+    mkdir -p "$(dirname "${targets[$i]}")"
+    if [ "$RUNTIME_INSTRUCTION_SOURCE" = "prebuilt bundle" ]; then
+      cmp -s "${objects[$i]}" "${targets[$i]}" || cp -f "${objects[$i]}" "${targets[$i]}"
+    else
+      render_runtime_instruction_entry "${entries[$i]}" > "${targets[$i]}"
+    fi
+    chmod 444 "${targets[$i]}"
+  done
+}
+
 render_runtime_role_instructions() {
   local workspace_agents_file="${WORKSPACE_REPO_DIR}/AGENTS.md"
   local target_file="${RUNTIME_ROLE_INSTRUCTIONS_FILE}"
   local allow_fallback_normalized
-  local agents_status="available"
-  local fallback_note=""
-
-  mkdir -p "$(dirname "$target_file")"
+  local variant="available"
 
   allow_fallback_normalized="$(printf '%s' "$ALLOW_FALLBACK_INSTRUCTIONS" | tr '[:upper:]' '[:lower:]')"
 
   if [ ! -r "$workspace_agents_file" ]; then
-    agents_status="missing"
-  fi
-
-  if [ "$agents_status" = "missing" ]; then
     if [ "$allow_fallback_normalized" = "true" ]; then
-      fallback_note="Break-glass note: ALLOW_FALLBACK_INSTRUCTIONS=true is enabled for operators, but role-repo AGENTS.md remains canonical."
+      variant="missing-break-glass"
     else
+      variant="missing"
       echo "Warning: required role-repo AGENTS.md is missing or unreadable: ${workspace_agents_file}" >&2
       echo "Runtime instructions will remain in bootstrap-only mode until role-repo AGENTS.md is available." >&2
     fi
   fi
 
-  cat > "$target_file" <<EOF
-# Runtime Role Instructions (Bootstrap Loader)
-
-Generated by .devcontainer-workstation/scripts/init-workstation.sh
-
-- Role profile: ${ROLE_PROFILE}
-- Role workspace repo: ${WORKSPACE_REPO_DIR}
-- Canonical role contract: ${workspace_agents_file}
-- AGENTS availability: ${agents_status}
-
-## Required behavior
-
-1. Treat role-repo AGENTS.md as canonical instructions for role mission, authority boundaries, and workflow execution.
-2. If AGENTS.md is missing/unreadable, perform bootstrap actions only until it is restored.
-3. Once AGENTS.md is available, follow it and treat this file as a loader/adapter only.
-
-## Allowed bootstrap-only actions (before AGENTS is available)
-
-- Clone/fetch/sync the role workspace repo at ${WORKSPACE_REPO_URL}
-- Resolve role GitHub auth issues (including deterministic app-auth re-mint)
-- Verify AGENTS.md readability and source metadata
-- Report blockers preventing AGENTS.md availability
-
-## Prohibited until AGENTS is available
-
-- Do not execute normal role work beyond bootstrap/recovery actions.
-- Do not reinterpret role authority boundaries without canonical AGENTS.md.
-
-## Recovery hint
-
-If AGENTS.md is unavailable, restore it by ensuring the role repo exists and is up to date at:
-
-- ${WORKSPACE_REPO_DIR}
-
-${fallback_note}
-EOF
-
-  chmod 444 "$target_file"
-  echo "Generated runtime role bootstrap instructions at ${target_file}."
+  install_runtime_instruction_files "role-instructions.${variant}=${target_file}"
+  echo "Generated runtime role bootstrap instructions at ${target_file} (${RUNTIME_INSTRUCTION_SOURCE})."
 }
 
 render_instruction_adapter_files() {
@@ -221,80 +214,17 @@ render_instruction_adapter_files() {
   local continue_file="${RUNTIME_CONTINUE_INSTRUCTIONS_FILE}"
   local runtime_policy_file="${RUNTIME_AGENT_RUNTIME_POLICY_FILE}"
 
-  mkdir -p "$(dirname "$agents_file")"
-  mkdir -p "$(dirname "$copilot_file")"
-  mkdir -p "$(dirname "$continue_file")"
-  mkdir -p "$(dirname "$runtime_policy_file")"
-
-  {
-    echo "# Runtime Agent Access Policy"
-    echo
-    echo "Generated by .devcontainer-workstation/scripts/init-workstation.sh"
-    echo
-    echo "Role workstations intentionally run all in-container agent runtimes with full container-local access."
-    echo
-    echo "Policy applies to:"
-    echo "- Codex"
-    echo "- Copilot"
-    echo "- Continue"
-    echo "- Future in-container integrations"
-    echo
-    echo "Expected behavior: routine operations do not require approval prompts, including temp-path operations such as /tmp and mktemp."
-    echo
-    echo "Safety model: role-scoped isolated containers + role-attributed execution."
-  } > "$runtime_policy_file"
-
-  {
-    echo "# Runtime Agent Instructions Adapter"
-    echo
-    echo "Generated by .devcontainer-workstation/scripts/init-workstation.sh"
-    echo
-    echo "Use the canonical runtime role instructions in \`${RUNTIME_ROLE_INSTRUCTIONS_FILE}\`."
-    echo
-    echo "Apply runtime access policy from \`${runtime_policy_file}\`."
-    echo
-    echo "- Role profile: ${ROLE_PROFILE}"
-    echo "- Canonical instructions file: \`${RUNTIME_ROLE_INSTRUCTIONS_FILE}\`"
-    echo "- Runtime access policy file: \`${runtime_policy_file}\`"
-    echo
-    echo "If \`${RUNTIME_ROLE_INSTRUCTIONS_FILE}\` is missing or unreadable, escalate."
-  } > "$agents_file"
-
-  {
-    echo "# Runtime Copilot Instructions Adapter"
-    echo
-    echo "Generated by .devcontainer-workstation/scripts/init-workstation.sh"
-    echo
-    echo "Use the canonical runtime role instructions at:"
-    echo
-    echo "- \`${RUNTIME_ROLE_INSTRUCTIONS_FILE}\`"
-    echo "- \`${runtime_policy_file}\`"
-    echo "- Role profile: ${ROLE_PROFILE}"
-    echo
-    echo "Do not reinterpret or override role authority boundaries defined there."
-  } > "$copilot_file"
-
-  {
-    echo "# Runtime Continue Instructions Adapter"
-    echo
-    echo "Generated by .devcontainer-workstation/scripts/init-workstation.sh"
-    echo
-    echo "Use the canonical runtime role instructions at:"
-    echo
-    echo "- \`${RUNTIME_ROLE_INSTRUCTIONS_FILE}\`"
-    echo "- \`${runtime_policy_file}\`"
-    echo "- Role profile: ${ROLE_PROFILE}"
-    echo
-    echo "Do not reinterpret or override role authority boundaries defined there."
-  } > "$continue_file"
-
-  chmod 444 "$runtime_policy_file" "$agents_file" "$copilot_file" "$continue_file"
+  install_runtime_instruction_files \
+    "agent-runtime-policy=${runtime_policy_file}" \
+    "agents-adapter=${agents_file}" \
+    "copilot-adapter=${copilot_file}" \
+    "continue-adapter=${continue_file}"
 
   if [ ! -f "$target_file" ]; then
     echo "Warning: canonical runtime role instructions file '${target_file}' was not found when generating adapter files." >&2
   fi
 
-  echo "Generated runtime access policy at ${runtime_policy_file}."
+  echo "Generated runtime access policy at ${runtime_policy_file} (${RUNTIME_INSTRUCTION_SOURCE})."
   echo "Generated instruction adapter files at ${agents_file}, ${copilot_file}, and ${continue_file}."
 }
 
@@ -367,6 +297,30 @@ ensure_vscode_machine_settings() {
   echo "Ensured VS Code machine settings at ${settings_file}."
 }
 
+start_role_github_token_broker() {
+  if [ ! -x "$ROLE_GITHUB_TOKEN_BROKER" ]; then
+    echo "Warning: role GitHub token broker not found at ${ROLE_GITHUB_TOKEN_BROKER}; tokens will be minted per call." >&2
+    return 0
+  fi
+
+  # Detached so it outlives init and keeps serving after exec "$@".
+  setsid "$ROLE_GITHUB_TOKEN_BROKER" \
+    --app-id "$ROLE_GITHUB_APP_ID" \
+    --installation-id "$ROLE_GITHUB_APP_INSTALLATION_ID" \
+    --private-key-path "$ROLE_GITHUB_APP_PRIVATE_KEY_PATH" \
+    serve </dev/null >>"$ROLE_GITHUB_TOKEN_BROKER_LOG" 2>&1 &
+
+  local attempt
+  for attempt in 1 2 3 4 5 6 7 8 9 10; do
+    if "$ROLE_GITHUB_TOKEN_BROKER" status >/dev/null 2>&1; then
+      echo "Started role GitHub token broker (log: ${ROLE_GITHUB_TOKEN_BROKER_LOG})."
+      return 0
+    fi
+    sleep 0.5
+  done
+  echo "Warning: role GitHub token broker did not become ready; see ${ROLE_GITHUB_TOKEN_BROKER_LOG}." >&2
+}
+
 write_runtime_github_app_auth_metadata() {
   local metadata_file="${RUNTIME_GITHUB_APP_AUTH_METADATA_FILE}"
   mkdir -p "$(dirname "$metadata_file")"
@@ -386,57 +340,52 @@ write_runtime_github_app_auth_metadata() {
 }
 
 
-mkdir -p "$CODEX_HOME_DIR"
-
-# Seed CODEX_HOME with repo-defined defaults when no config exists yet.
-if [ ! -f "$TARGET_CONFIG" ]; then
-  cp "$DEFAULT_CONFIG" "$TARGET_CONFIG"
-  chmod 600 "$TARGET_CONFIG"
-fi
-
-apply_role_profile
-apply_role_git_identity
-write_runtime_github_app_auth_metadata
-
-if [ "${ROLE_GITHUB_AUTH_MODE:-}" = "app" ]; then
-  missing_vars=()
-  if [ -z "${ROLE_GITHUB_APP_ID:-}" ]; then
-    missing_vars+=("ROLE_GITHUB_APP_ID")
-  fi
-  if [ -z "${ROLE_GITHUB_APP_INSTALLATION_ID:-}" ]; then
-    missing_vars+=("ROLE_GITHUB_APP_INSTALLATION_ID")
-  fi
-  if [ -z "${ROLE_GITHUB_APP_PRIVATE_KEY_PATH:-}" ]; then
-    missing_vars+=("ROLE_GITHUB_APP_PRIVATE_KEY_PATH")
-  fi
+setup_role_github_auth() {
+  if [ "${ROLE_GITHUB_AUTH_MODE:-}" = "app" ]; then
+    local missing_vars=()
+    if [ -z "${ROLE_GITHUB_APP_ID:-}" ]; then
+      missing_vars+=("ROLE_GITHUB_APP_ID")
+    fi
+    if [ -z "${ROLE_GITHUB_APP_INSTALLATION_ID:-}" ]; then
+      missing_vars+=("ROLE_GITHUB_APP_INSTALLATION_ID")
+    fi
+    if [ -z "${ROLE_GITHUB_APP_PRIVATE_KEY_PATH:-}" ]; then
+      missing_vars+=("ROLE_GITHUB_APP_PRIVATE_KEY_PATH")
+    fi
 
-  if [ "${#missing_vars[@]}" -gt 0 ]; then
-    printf 'Warning: ROLE_GITHUB_AUTH_MODE=app but missing %s; skipping role app auth.\n' "${missing_vars[*]}" >&2
-  else
-    if [ -x "$ROLE_GITHUB_APP_AUTH_SCRIPT" ]; then
-      "$ROLE_GITHUB_APP_AUTH_SCRIPT"
+    if [ "${#missing_vars[@]}" -gt 0 ]; then
+      printf 'Warning: ROLE_GITHUB_AUTH_MODE=app but missing %s; skipping role app auth.\n' "${missing_vars[*]}" >&2
     else
-      echo "Warning: role GitHub App auth helper not found at ${ROLE_GITHUB_APP_AUTH_SCRIPT}; skipping." >&2
+      start_role_github_token_broker
+      if [ -x "$ROLE_GITHUB_APP_AUTH_SCRIPT" ]; then
+        "$ROLE_GITHUB_APP_AUTH_SCRIPT"
+      else
+        echo "Warning: role GitHub App auth helper not found at ${ROLE_GITHUB_APP_AUTH_SCRIPT}; skipping." >&2
+      fi
     fi
   fi
-fi
 
-if [ "${ROLE_GITHUB_AUTH_MODE:-}" = "app" ] && [ -n "${GH_BOOTSTRAP_TOKEN:-}" ]; then
-  echo "Warning: GH_BOOTSTRAP_TOKEN is ignored when ROLE_GITHUB_AUTH_MODE=app to preserve role-attributed GitHub App identity." >&2
-fi
+  if [ "${ROLE_GITHUB_AUTH_MODE:-}" = "app" ] && [ -n "${GH_BOOTSTRAP_TOKEN:-}" ]; then
+    echo "Warning: GH_BOOTSTRAP_TOKEN is ignored when ROLE_GITHUB_AUTH_MODE=app to preserve role-attributed GitHub App identity." >&2
+  fi
 
-if [ "${ROLE_GITHUB_AUTH_MODE:-}" != "app" ] && [ -n "${GH_BOOTSTRAP_TOKEN:-}" ] && command -v gh >/dev/null 2>&1; then
-  if ! gh auth status --hostname github.com >/dev/null 2>&1; then
-    if printf '%s' "$GH_BOOTSTRAP_TOKEN" | env -u GH_TOKEN -u GITHUB_TOKEN gh auth login --hostname github.com --git-protocol https --with-token >/dev/null 2>&1; then
-      gh auth setup-git >/dev/null 2>&1 || true
-      echo "Initialized GitHub auth from GH_BOOTSTRAP_TOKEN."
-    else
-      echo "Warning: failed to initialize GitHub auth from GH_BOOTSTRAP_TOKEN." >&2
+  if [ "${ROLE_GITHUB_AUTH_MODE:-}" != "app" ] && [ -n "${GH_BOOTSTRAP_TOKEN:-}" ] && command -v gh >/dev/null 2>&1; then
+    if ! gh auth status --hostname github.com >/dev/null 2>&1; then
+      if printf '%s' "$GH_BOOTSTRAP_TOKEN" | env -u GH_TOKEN -u GITHUB_TOKEN gh auth login --hostname github.com --git-protocol https --with-token >/dev/null 2>&1; then
+        gh auth setup-git >/dev/null 2>&1 || true
+        echo "Initialized GitHub auth from GH_BOOTSTRAP_TOKEN."
+      else
+        echo "Warning: failed to initialize GitHub auth from GH_BOOTSTRAP_TOKEN." >&2
+      fi
     fi
   fi
-fi
+}
+
+clone_workspace_repo() {
+  if [ "$AUTO_CLONE_WORKSPACE_REPO" != "true" ]; then
+    return 0
+  fi
 
-if [ "$AUTO_CLONE_WORKSPACE_REPO" = "true" ]; then
   mkdir -p "$(dirname "$WORKSPACE_REPO_DIR")"
   if [ ! -d "$WORKSPACE_REPO_DIR/.git" ]; then
     if [ -d "$WORKSPACE_REPO_DIR" ] && [ -n "$(ls -A "$WORKSPACE_REPO_DIR" 2>/dev/null || true)" ]; then
@@ -449,11 +398,207 @@ if [ "$AUTO_CLONE_WORKSPACE_REPO" = "true" ]; then
       fi
     fi
   fi
+}
+
+# Init steps as a dependency graph: "name|function|space-separated deps".
+# Steps run in subshells, so they may only produce side effects; anything that
+# sets shell state for later steps (apply_role_profile) runs before the graph.
+# Ordering constraints:
+#   - gh auth setup-git and git config --global both write ~/.gitconfig.
+#   - the clone needs role auth; runtime instructions inspect the cloned AGENTS.md.
+INIT_STEPS=(
+  "git_identity|apply_role_git_identity|"
+  "github_app_auth_metadata|write_runtime_github_app_auth_metadata|"
+  "vscode_workspace_settings|ensure_workspace_vscode_settings|"
+  "vscode_machine_settings|ensure_vscode_machine_settings|"
+  "github_auth|setup_role_github_auth|git_identity"
+  "workspace_clone|clone_workspace_repo|github_auth"
+  "runtime_role_instructions|render_runtime_role_instructions|workspace_clone"
+  "instruction_adapters|render_instruction_adapter_files|runtime_role_instructions"
+)
+
+INIT_PROFILE_ENTRIES=()
+
+now_ms() {
+  local now="${EPOCHREALTIME/./}"
+  printf '%s' "$(( ${now:0:-3} ))"
+}
+
+record_step_profile() {
+  local name="$1" deps="$2" start_ms="$3" end_ms="$4" rc="$5" mode="$6"
+  local status="ok"
+  if [ "$rc" -ne 0 ]; then
+    status="failed"
+  fi
+  local deps_json=""
+  local dep
+  for dep in $deps; do
+    deps_json+="${deps_json:+,}\"${dep}\""
+  done
+  INIT_PROFILE_ENTRIES+=("$(printf '{"step":"%s","mode":"%s","deps":[%s],"start_ms":%s,"end_ms":%s,"duration_ms":%s,"exit_code":%s,"status":"%s"}' \
+    "$name" "$mode" "$deps_json" "$(( start_ms - INIT_STARTED_MS ))" "$(( end_ms - INIT_STARTED_MS ))" "$(( end_ms - start_ms ))" "$rc" "$status")")
+}
+
+write_startup_profile() {
+  local rc="$1"
+  local end_ms
+  end_ms="$(now_ms)"
+  mkdir -p "$(dirname "$INIT_STARTUP_PROFILE_FILE")"
+  {
+    printf '{\n'
+    printf '  "role_profile": "%s",\n' "$ROLE_PROFILE"
+    printf '  "started_at_utc": "%s",\n' "$INIT_STARTED_AT_UTC"
+    printf '  "parallel": %s,\n' "$([ "$INIT_SCHEDULER_MODE" = "parallel" ] && echo true || echo false)"
+    printf '  "max_jobs": %s,\n' "$INIT_MAX_JOBS"
+    printf '  "total_ms": %s,\n' "$(( end_ms - INIT_STARTED_MS ))"
+    printf '  "exit_code": %s,\n' "$rc"
+    printf '  "steps": [\n'
+    local i
+    for i in "${!INIT_PROFILE_ENTRIES[@]}"; do
+      printf '    %s%s\n' "${INIT_PROFILE_ENTRIES[$i]}" "$([ "$i" -lt $(( ${#INIT_PROFILE_ENTRIES[@]} - 1 )) ] && echo ,)"
+    done
+    printf '  ]\n'
+    printf '}\n'
+  } > "$INIT_STARTUP_PROFILE_FILE"
+  echo "Workstation init finished in $(( end_ms - INIT_STARTED_MS )) ms (${INIT_SCHEDULER_MODE}); profile at ${INIT_STARTUP_PROFILE_FILE}."
+}
+
+# Steps run inline keep set -e semantics: a failure exits the script and the
+# EXIT trap (on_init_exit) records the step and writes the profile.
+run_timed_inline() {
+  INIT_CURRENT_STEP="$1"
+  INIT_CURRENT_STEP_DEPS="$3"
+  INIT_CURRENT_STEP_STARTED="$(now_ms)"
+  "$2"
+  record_step_profile "$1" "$3" "$INIT_CURRENT_STEP_STARTED" "$(now_ms)" 0 "inline"
+  INIT_CURRENT_STEP=""
+}
+
+run_init_steps_sequential() {
+  local entry name func deps
+  for entry in "${INIT_STEPS[@]}"; do
+    IFS='|' read -r name func deps <<<"$entry"
+    run_timed_inline "$name" "$func" "$deps"
+  done
+}
+
+on_init_exit() {
+  local rc=$?
+  if [ -n "$INIT_CURRENT_STEP" ]; then
+    record_step_profile "$INIT_CURRENT_STEP" "$INIT_CURRENT_STEP_DEPS" "$INIT_CURRENT_STEP_STARTED" "$(now_ms)" "$rc" "inline"
+    echo "Error: init step '${INIT_CURRENT_STEP}' failed with exit code ${rc}." >&2
+  fi
+  write_startup_profile "$rc"
+}
+
+# Runs INIT_STEPS concurrently as their deps complete. Each step's stdout and
+# stderr are buffered and replayed whole when it finishes, so output from
+# concurrent steps never interleaves. The first failure stops new launches;
+# running steps are drained and that failure's exit code is returned. Do not
+# call it from an if/|| context: that would disable set -e inside the steps.
+run_init_steps_parallel() {
+  local log_dir
+  log_dir="$(mktemp -d /tmp/init-workstation-steps.XXXXXX)"
+
+  local -A step_func=() step_deps=() step_state=() step_started=() pid_step=()
+  local -a order=()
+  local entry name func deps
+  for entry in "${INIT_STEPS[@]}"; do
+    IFS='|' read -r name func deps <<<"$entry"
+    order+=("$name")
+    step_func[$name]="$func"
+    step_deps[$name]="$deps"
+    step_state[$name]="pending"
+  done
+
+  local running=0 remaining="${#order[@]}" failed_rc=0
+  local dep ready finished_pid rc
+  while [ "$remaining" -gt 0 ]; do
+    if [ "$failed_rc" -eq 0 ]; then
+      for name in "${order[@]}"; do
+        [ "${step_state[$name]}" = "pending" ] || continue
+        [ "$running" -lt "$INIT_MAX_JOBS" ] || break
+        ready="true"
+        for dep in ${step_deps[$name]}; do
+          if [ "${step_state[$dep]:-}" != "done" ]; then
+            ready="false"
+            break
+          fi
+        done
+        [ "$ready" = "true" ] || continue
+
+        step_started[$name]="$(now_ms)"
+        (
+          trap 'now_ms >"${log_dir}/${name}.end"' EXIT
+          "${step_func[$name]}"
+        ) >"${log_dir}/${name}.out" 2>"${log_dir}/${name}.err" &
+        pid_step[$!]="$name"
+        step_state[$name]="running"
+        running=$(( running + 1 ))
+      done
+    fi
+
+    if [ "$running" -eq 0 ]; then
+      if [ "$failed_rc" -eq 0 ]; then
+        echo "Error: init step graph cannot make progress (unknown or cyclic dependency)." >&2
+        failed_rc=1
+      fi
+      break
+    fi
+
+    rc=0
+    wait -n -p finished_pid || rc=$?
+    name="${pid_step[$finished_pid]}"
+    unset "pid_step[$finished_pid]"
+    running=$(( running - 1 ))
+    remaining=$(( remaining - 1 ))
+    record_step_profile "$name" "${step_deps[$name]}" "${step_started[$name]}" "$(cat "${log_dir}/${name}.end" 2>/dev/null || now_ms)" "$rc" "parallel"
+    cat "${log_dir}/${name}.out"
+    cat "${log_dir}/${name}.err" >&2
+    if [ "$rc" -eq 0 ]; then
+      step_state[$name]="done"
+    else
+      step_state[$name]="failed"
+      echo "Error: init step '${name}' failed with exit code ${rc}." >&2
+      if [ "$failed_rc" -eq 0 ]; then
+        failed_rc="$rc"
+      fi
+    fi
+  done
+
+  rm -rf "$log_dir"
+  return "$failed_rc"
+}
+
+INIT_STARTED_MS="$(now_ms)"
+INIT_STARTED_AT_UTC="$(date -u +%Y-%m-%dT%H:%M:%SZ)"
+INIT_SCHEDULER_MODE="parallel"
+if [ "$INIT_PARALLEL" != "true" ] || [ "${BASH_VERSINFO[0]}" -lt 5 ] || { [ "${BASH_VERSINFO[0]}" -eq 5 ] && [ "${BASH_VERSINFO[1]}" -lt 1 ]; }; then
+  # wait -n -p needs bash 5.1+.
+  INIT_SCHEDULER_MODE="sequential"
+fi
+
+mkdir -p "$CODEX_HOME_DIR"
+
+# Seed CODEX_HOME with repo-defined defaults when no config exists yet.
+if [ ! -f "$TARGET_CONFIG" ]; then
+  cp "$DEFAULT_CONFIG" "$TARGET_CONFIG"
+  chmod 600 "$TARGET_CONFIG"
+fi
+
+INIT_CURRENT_STEP=""
+trap on_init_exit EXIT
+
+# Sets ROLE_* shell variables consumed by later steps, so it runs inline first.
+run_timed_inline "role_profile" apply_role_profile ""
+
+if [ "$INIT_SCHEDULER_MODE" = "parallel" ]; then
+  run_init_steps_parallel
+else
+  run_init_steps_sequential
 fi
 
-render_runtime_role_instructions
-render_instruction_adapter_files
-ensure_workspace_vscode_settings
-ensure_vscode_machine_settings
+trap - EXIT
+write_startup_profile 0
 
 exec "$@"
@@ -80,6 +80,7 @@ ROLE_GITHUB_AUTH_MODE="$ROLE_GITHUB_AUTH_MODE_RESOLVED" \
 ROLE_GITHUB_APP_ID="$ROLE_GITHUB_APP_ID_RESOLVED" \
 ROLE_GITHUB_APP_INSTALLATION_ID="$ROLE_GITHUB_APP_INSTALLATION_ID_RESOLVED" \
 ROLE_GITHUB_APP_PRIVATE_KEY_PATH="$ROLE_GITHUB_APP_PRIVATE_KEY_PATH_RESOLVED" \
+ROLE_GITHUB_APP_FORCE_MINT=true \
 "$ROLE_GITHUB_APP_AUTH_SCRIPT"
 
 if command -v gh >/dev/null 2>&1; then
@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+"""
+Cached GitHub App installation-token broker for role workstations.
+
+`serve` keeps one installation token in memory, refreshes it in the background
+before it expires and hands it out over a Unix socket (mode 0600 inside a
+0700 directory). Server and clients refuse a socket whose directory is not a
+real directory owned by the current user without group/other access, so a
+pre-created path under /tmp cannot serve or collect tokens. `token` prints a token from the broker, or mints one
+in-process when no broker is running. JWTs are signed in-process with the
+`cryptography` package when available, falling back to `openssl dgst`.
+
+Protocol: one JSON request line per connection, one JSON response line.
+  {"op": "token", "force": false} -> {"ok": true, "token": "...", "expires_at": "..."}
+  {"op": "status"}                -> {"ok": true, "expires_at": "...", "mints": N, ...}
+
+Configuration (flags override environment):
+  ROLE_GITHUB_APP_ID / ROLE_GITHUB_APP_INSTALLATION_ID / ROLE_GITHUB_APP_PRIVATE_KEY_PATH
+  ROLE_GITHUB_API_URL               API base URL (default: https://api.github.com)
+  ROLE_GITHUB_TOKEN_BROKER_SOCKET   Socket path (default: /tmp/role-github-token-broker-<uid>/broker.sock)
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import json
+import os
+import signal
+import socket
+import socketserver
+import stat
+import subprocess
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from datetime import datetime
+from typing import Any
+
+DEFAULT_API_URL = "https://api.github.com"
+DEFAULT_PRIVATE_KEY_PATH = "/run/secrets/role_github_app_private_key"
+JWT_LIFETIME_SECONDS = 540
+JWT_CLOCK_SKEW_SECONDS = 30
+# Installation tokens live for one hour; refresh well before expiry and never
+# hand out a token with less than MIN_VALIDITY_SECONDS left.
+REFRESH_MARGIN_SECONDS = 600
+MIN_VALIDITY_SECONDS = 120
+RETRY_DELAY_SECONDS = 30
+CLIENT_TIMEOUT_SECONDS = 15.0
+
+
+class BrokerError(RuntimeError):
+    pass
+
+
+def default_socket_path() -> str:
+    override = os.getenv("ROLE_GITHUB_TOKEN_BROKER_SOCKET", "").strip()
+    if override:
+        return override
+    return f"/tmp/role-github-token-broker-{os.getuid()}/broker.sock"
+
+
+def check_socket_dir(socket_path: str) -> None:
+    """Raise BrokerError unless the socket directory is private to the current user."""
+    socket_dir = os.path.dirname(os.path.abspath(socket_path))
+    info = os.lstat(socket_dir)
+    if not stat.S_ISDIR(info.st_mode):
+        raise BrokerError(f"socket directory is not a directory: {socket_dir}")
+    if info.st_uid != os.getuid():
+        raise BrokerError(f"socket directory {socket_dir} is owned by uid {info.st_uid}, not {os.getuid()}")
+    if info.st_mode & 0o077:
+        raise BrokerError(f"socket directory {socket_dir} is accessible to other users (mode {stat.S_IMODE(info.st_mode):o})")
+
+
+def base64url(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def parse_expires_at(value: str) -> float:
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+
+class JwtSigner:
+    """RS256 signer; the private key is read and parsed once."""
+
+    def __init__(self, private_key_path: str) -> None:
+        self.private_key_path = private_key_path
+        self._key: Any = None
+        try:
+            from cryptography.hazmat.primitives import serialization
+        except ImportError:
+            self.backend = "openssl"
+        else:
+            with open(private_key_path, "rb") as handle:
+                self._key = serialization.load_pem_private_key(handle.read(), password=None)
+            self.backend = "cryptography"
+
+    def sign(self, message: bytes) -> bytes:
+        if self._key is not None:
+            from cryptography.hazmat.primitives import hashes
+            from cryptography.hazmat.primitives.asymmetric import padding
+
+            return self._key.sign(message, padding.PKCS1v15(), hashes.SHA256())
+
+        completed = subprocess.run(
+            ["openssl", "dgst", "-sha256", "-sign", self.private_key_path],
+            input=message,
+            capture_output=True,
+            check=False,
+        )
+        if completed.returncode != 0:
+            raise BrokerError(f"openssl signing failed: {completed.stderr.decode('utf-8', 'replace').strip()}")
+        return completed.stdout
+
+    def app_jwt(self, app_id: str) -> str:
+        now = int(time.time())
+        header = base64url(json.dumps({"alg": "RS256", "typ": "JWT"}, separators=(",", ":")).encode("utf-8"))
+        payload = base64url(
+            json.dumps(
+                {"iat": now - JWT_CLOCK_SKEW_SECONDS, "exp": now + JWT_LIFETIME_SECONDS, "iss": app_id},
+                separators=(",", ":"),
+            ).encode("utf-8")
+        )
+        unsigned = f"{header}.{payload}"
+        return f"{unsigned}.{base64url(self.sign(unsigned.encode('ascii')))}"
+
+
+class TokenSource:
+    """Mints installation tokens and caches the current one until near expiry."""
+
+    def __init__(self, app_id: str, installation_id: str, private_key_path: str, api_url: str) -> None:
+        self.app_id = app_id
+        self.installation_id = installation_id
+        self.api_url = api_url.rstrip("/")
+        self.signer = JwtSigner(private_key_path)
+        self.mints = 0
+        self.last_error = ""
+        self._token = ""
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    def _mint(self) -> None:
+        request = urllib.request.Request(
+            f"{self.api_url}/app/installations/{self.installation_id}/access_tokens",
+            method="POST",
+            headers={
+                "Authorization": f"Bearer {self.signer.app_jwt(self.app_id)}",
+                "Accept": "application/vnd.github+json",
+                "User-Agent": "role-github-token-broker",
+            },
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=20) as response:
+                document = json.load(response)
+        except urllib.error.HTTPError as exc:
+            detail = exc.read().decode("utf-8", "replace").strip()[:300]
+            raise BrokerError(f"token endpoint returned HTTP {exc.code}: {detail}") from exc
+        except (urllib.error.URLError, OSError, ValueError) as exc:
+            raise BrokerError(f"token endpoint request failed: {exc}") from exc
+
+        token = document.get("token")
+        expires_at = document.get("expires_at")
+        if not token or not expires_at:
+            raise BrokerError("token endpoint response is missing token or expires_at")
+        self._token = token
+        self._expires_at = parse_expires_at(expires_at)
+        self.mints += 1
+        self.last_error = ""
+
+    def token(self, force: bool = False, min_validity: float = MIN_VALIDITY_SECONDS) -> tuple[str, float]:
+        with self._lock:
+            if force or not self._token or self._expires_at - time.time() < min_validity:
+                self._mint()
+            return self._token, self._expires_at
+
+    def seconds_until_refresh(self) -> float:
+        with self._lock:
+            if not self._token:
+                return 0.0
+            return self._expires_at - time.time() - REFRESH_MARGIN_SECONDS
+
+    def status(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "expires_at": format_timestamp(self._expires_at) if self._token else None,
+                "mints": self.mints,
+                "signer": self.signer.backend,
+                "last_error": self.last_error,
+            }
+
+
+def format_timestamp(value: float) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(value))
+
+
+def refresh_loop(source: TokenSource, stop: threading.Event) -> None:
+    while not stop.is_set():
+        delay = source.seconds_until_refresh()
+        if delay > 0:
+            stop.wait(delay)
+            continue
+        try:
+            source.token(force=True)
+        except BrokerError as exc:
+            source.last_error = str(exc)
+            print(f"role-github-token-broker: background refresh failed: {exc}", file=sys.stderr)
+            stop.wait(RETRY_DELAY_SECONDS)
+
+
+def make_handler(source: TokenSource) -> type[socketserver.StreamRequestHandler]:
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            try:
+                request = json.loads(self.rfile.readline() or b"{}")
+                op = request.get("op")
+                if op == "token":
+                    token, expires_at = source.token(force=bool(request.get("force")))
+                    response = {"ok": True, "token": token, "expires_at": format_timestamp(expires_at)}
+                elif op == "status":
+                    response = {"ok": True, **source.status()}
+                else:
+                    response = {"ok": False, "error": f"unknown op: {op!r}"}
+            except (BrokerError, ValueError) as exc:
+                response = {"ok": False, "error": str(exc)}
+            self.wfile.write((json.dumps(response) + "\n").encode("utf-8"))
+
+    return Handler
+
+
+class BrokerServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def request_broker(socket_path: str, payload: dict[str, Any]) -> dict[str, Any]:
+    check_socket_dir(socket_path)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+        conn.settimeout(CLIENT_TIMEOUT_SECONDS)
+        conn.connect(socket_path)
+        conn.sendall((json.dumps(payload) + "\n").encode("utf-8"))
+        with conn.makefile("rb") as reader:
+            line = reader.readline()
+    response = json.loads(line or b"{}")
+    if not response.get("ok"):
+        raise BrokerError(response.get("error") or "broker returned an empty response")
+    return response
+
+
+def build_source(args: argparse.Namespace) -> TokenSource:
+    missing = [
+        name
+        for name, value in (
+            ("ROLE_GITHUB_APP_ID", args.app_id),
+            ("ROLE_GITHUB_APP_INSTALLATION_ID", args.installation_id),
+            ("ROLE_GITHUB_APP_PRIVATE_KEY_PATH", args.private_key_path),
+        )
+        if not value
+    ]
+    if missing:
+        raise BrokerError(f"missing required values: {' '.join(missing)}")
+    if not os.access(args.private_key_path, os.R_OK):
+        raise BrokerError(f"GitHub App private key path is not readable: {args.private_key_path}")
+    return TokenSource(args.app_id, args.installation_id, args.private_key_path, args.api_url)
+
+
+def serve(args: argparse.Namespace) -> int:
+    try:
+        request_broker(args.socket, {"op": "status"})
+    except (OSError, ValueError, BrokerError):
+        pass
+    else:
+        print(f"role-github-token-broker: already serving on {args.socket}", file=sys.stderr)
+        return 0
+
+    socket_dir = os.path.dirname(os.path.abspath(args.socket))
+    os.makedirs(socket_dir, mode=0o700, exist_ok=True)
+    try:
+        check_socket_dir(args.socket)
+    except BrokerError as exc:
+        print(f"role-github-token-broker: refusing to serve on {args.socket}: {exc}", file=sys.stderr)
+        return 1
+
+    source = build_source(args)
+    # Mint up front so configuration errors surface at startup, not on first use.
+    source.token()
+
+    if os.path.lexists(args.socket):
+        os.unlink(args.socket)
+
+    previous_umask = os.umask(0o177)
+    try:
+        server = BrokerServer(args.socket, make_handler(source))
+    finally:
+        os.umask(previous_umask)
+
+    stop = threading.Event()
+    refresher = threading.Thread(target=refresh_loop, args=(source, stop), daemon=True)
+    refresher.start()
+
+    def shutdown(signum: int, frame: Any) -> None:
+        stop.set()
+        threading.Thread(target=server.shutdown, daemon=True).start()
+
+    signal.signal(signal.SIGTERM, shutdown)
+    signal.signal(signal.SIGINT, shutdown)
+
+    print(f"role-github-token-broker: serving on {args.socket} (signer: {source.signer.backend})", file=sys.stderr)
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
+        if os.path.exists(args.socket):
+            os.unlink(args.socket)
+    return 0
+
+
+def print_token(args: argparse.Namespace) -> int:
+    try:
+        response = request_broker(args.socket, {"op": "token", "force": args.force_refresh})
+    except (OSError, ValueError, BrokerError) as exc:
+        if args.broker_only:
+            print(f"role-github-token-broker: broker unavailable at {args.socket}: {exc}", file=sys.stderr)
+            return 1
+        # No broker running: mint in-process (still avoids the shell JWT pipeline).
+        token, _ = build_source(args).token()
+    else:
+        token = response["token"]
+    sys.stdout.write(token)
+    if sys.stdout.isatty():
+        sys.stdout.write("\n")
+    return 0
+
+
+def print_status(args: argparse.Namespace) -> int:
+    try:
+        response = request_broker(args.socket, {"op": "status"})
+    except (OSError, ValueError, BrokerError) as exc:
+        print(f"role-github-token-broker: broker unavailable at {args.socket}: {exc}", file=sys.stderr)
+        return 1
+    response.pop("ok", None)
+    print(json.dumps(response, indent=2, sort_keys=True))
+    return 0
+
+
+def env_first(*names: str, default: str = "") -> str:
+    for name in names:
+        value = os.getenv(name, "").strip()
+        if value:
+            return value
+    return default
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Cached GitHub App installation-token broker.")
+    parser.add_argument("--socket", default=default_socket_path(), help="Broker Unix socket path.")
+    parser.add_argument(
+        "--app-id",
+        default=env_first("ROLE_GITHUB_APP_ID", "RUNTIME_ROLE_GITHUB_APP_ID"),
+    )
+    parser.add_argument(
+        "--installation-id",
+        default=env_first("ROLE_GITHUB_APP_INSTALLATION_ID", "RUNTIME_ROLE_GITHUB_APP_INSTALLATION_ID"),
+    )
+    parser.add_argument(
+        "--private-key-path",
+        default=env_first(
+            "ROLE_GITHUB_APP_PRIVATE_KEY_PATH",
+            "RUNTIME_ROLE_GITHUB_APP_PRIVATE_KEY_PATH",
+            default=DEFAULT_PRIVATE_KEY_PATH,
+        ),
+    )
+    parser.add_argument(
+        "--api-url",
+        default=env_first("ROLE_GITHUB_API_URL", default=DEFAULT_API_URL),
+        help="GitHub API base URL (point at a local fake token endpoint for testing).",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    subparsers.add_parser("serve", help="Run the broker in the foreground.")
+
+    token_parser = subparsers.add_parser("token", help="Print an installation token.")
+    token_parser.add_argument("--force-refresh", action="store_true", help="Mint a new token even if cached.")
+    token_parser.add_argument(
+        "--broker-only",
+        action="store_true",
+        help="Fail instead of minting in-process when the broker is not running.",
+    )
+
+    subparsers.add_parser("status", help="Print broker token expiry and mint count (no token).")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    try:
+        if args.command == "serve":
+            return serve(args)
+        if args.command == "token":
+            return print_token(args)
+        return print_status(args)
+    except (BrokerError, OSError) as exc:
+        print(f"role-github-token-broker: {exc}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
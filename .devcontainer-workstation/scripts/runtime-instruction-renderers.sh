@@ -0,0 +1,245 @@
+#!/usr/bin/env bash
+# Shared renderers for the runtime instruction and adapter files.
+#
+# Sourced by init-workstation.sh (container start) and
+# build-runtime-instruction-bundle.sh (image build), so a prebuilt bundle and a
+# startup re-render produce identical bytes. Renderers print to stdout and only
+# read the variables listed in RUNTIME_INSTRUCTION_INPUT_VARS.
+#
+# Bundle layout (RUNTIME_INSTRUCTION_BUNDLE_DIR):
+#   manifest.tsv          format, inputs_key, role_profile, and one
+#                         "entry <name> <sha256>" line per rendered output
+#   objects/<sha256>      rendered file contents, named by content hash
+
+RUNTIME_INSTRUCTION_BUNDLE_FORMAT=1
+RUNTIME_INSTRUCTION_INPUT_VARS=(
+  ROLE_PROFILE
+  WORKSPACE_REPO_DIR
+  WORKSPACE_REPO_URL
+  RUNTIME_ROLE_INSTRUCTIONS_FILE
+  RUNTIME_AGENTS_ADAPTER_FILE
+  RUNTIME_COPILOT_INSTRUCTIONS_FILE
+  RUNTIME_CONTINUE_INSTRUCTIONS_FILE
+  RUNTIME_AGENT_RUNTIME_POLICY_FILE
+)
+# Bundle entries. The role-instructions variant is chosen at startup from
+# AGENTS.md availability and ALLOW_FALLBACK_INSTRUCTIONS.
+RUNTIME_INSTRUCTION_ENTRIES=(
+  role-instructions.available
+  role-instructions.missing
+  role-instructions.missing-break-glass
+  agent-runtime-policy
+  agents-adapter
+  copilot-adapter
+  continue-adapter
+)
+
+apply_runtime_instruction_input_defaults() {
+  ROLE_PROFILE="${ROLE_PROFILE:-${IMAGE_ROLE_PROFILE:-implementation-specialist}}"
+  WORKSPACE_REPO_OWNER="${WORKSPACE_REPO_OWNER:-Josh-Phillips-LLC}"
+  WORKSPACE_REPO_NAME_DEFAULT="${WORKSPACE_REPO_NAME_DEFAULT:-context-engineering-role-${ROLE_PROFILE}}"
+  WORKSPACE_REPO_URL="${WORKSPACE_REPO_URL:-https://github.com/${WORKSPACE_REPO_OWNER}/${WORKSPACE_REPO_NAME_DEFAULT}.git}"
+  WORKSPACE_REPO_DIR="${WORKSPACE_REPO_DIR:-/workspace/Projects/${WORKSPACE_REPO_NAME_DEFAULT}}"
+  RUNTIME_ROLE_INSTRUCTIONS_FILE="${RUNTIME_ROLE_INSTRUCTIONS_FILE:-/workspace/instructions/role-instructions.md}"
+  RUNTIME_AGENTS_ADAPTER_FILE="${RUNTIME_AGENTS_ADAPTER_FILE:-/workspace/instructions/AGENTS.md}"
+  RUNTIME_COPILOT_INSTRUCTIONS_FILE="${RUNTIME_COPILOT_INSTRUCTIONS_FILE:-/workspace/instructions/copilot-instructions.md}"
+  RUNTIME_CONTINUE_INSTRUCTIONS_FILE="${RUNTIME_CONTINUE_INSTRUCTIONS_FILE:-/workspace/instructions/continue-instructions.md}"
+  RUNTIME_AGENT_RUNTIME_POLICY_FILE="${RUNTIME_AGENT_RUNTIME_POLICY_FILE:-/workspace/instructions/agent-runtime-policy.md}"
+}
+
+# Digest of every input that can change rendered bytes, including this file.
+runtime_instruction_inputs_key() {
+  local var
+  {
+    printf 'format=%s\n' "$RUNTIME_INSTRUCTION_BUNDLE_FORMAT"
+    printf 'renderers=%s\n' "$(sha256sum <"${BASH_SOURCE[0]}" | cut -d' ' -f1)"
+    for var in "${RUNTIME_INSTRUCTION_INPUT_VARS[@]}"; do
+      printf '%s=%s\n' "$var" "${!var:-}"
+    done
+  } | sha256sum | cut -d' ' -f1
+}
+
+render_runtime_role_instructions_document() {
+  local variant="$1"
+  local workspace_agents_file="${WORKSPACE_REPO_DIR}/AGENTS.md"
+  local agents_status="missing"
+  local fallback_note=""
+
+  case "$variant" in
+    available) agents_status="available" ;;
+    missing) ;;
+    missing-break-glass)
+      fallback_note="Break-glass note: ALLOW_FALLBACK_INSTRUCTIONS=true is enabled for operators, but role-repo AGENTS.md remains canonical."
+      ;;
+    *)
+      echo "Unknown runtime role instructions variant: ${variant}" >&2
+      return 1
+      ;;
+  esac
+
+  cat <<EOF
+# Runtime Role Instructions (Bootstrap Loader)
+
+Generated by .devcontainer-workstation/scripts/init-workstation.sh
+
+- Role profile: ${ROLE_PROFILE}
+- Role workspace repo: ${WORKSPACE_REPO_DIR}
+- Canonical role contract: ${workspace_agents_file}
+- AGENTS availability: ${agents_status}
+
+## Required behavior
+
+1. Treat role-repo AGENTS.md as canonical instructions for role mission, authority boundaries, and workflow execution.
+2. If AGENTS.md is missing/unreadable, perform bootstrap actions only until it is restored.
+3. Once AGENTS.md is available, follow it and treat this file as a loader/adapter only.
+
+## Allowed bootstrap-only actions (before AGENTS is available)
+
+- Clone/fetch/sync the role workspace repo at ${WORKSPACE_REPO_URL}
+- Resolve role GitHub auth issues (including deterministic app-auth re-mint)
+- Verify AGENTS.md readability and source metadata
+- Report blockers preventing AGENTS.md availability
+
+## Prohibited until AGENTS is available
+
+- Do not execute normal role work beyond bootstrap/recovery actions.
+- Do not reinterpret role authority boundaries without canonical AGENTS.md.
+
+## Recovery hint
+
+If AGENTS.md is unavailable, restore it by ensuring the role repo exists and is up to date at:
+
+- ${WORKSPACE_REPO_DIR}
+
+${fallback_note}
+EOF
+}
+
+render_agent_runtime_policy_document() {
+  echo "# Runtime Agent Access Policy"
+  echo
+  echo "Generated by .devcontainer-workstation/scripts/init-workstation.sh"
+  echo
+  echo "Role workstations intentionally run all in-container agent runtimes with full container-local access."
+  echo
+  echo "Policy applies to:"
+  echo "- Codex"
+  echo "- Copilot"
+  echo "- Continue"
+  echo "- Future in-container integrations"
+  echo
+  echo "Expected behavior: routine operations do not require approval prompts, including temp-path operations such as /tmp and mktemp."
+  echo
+  echo "Safety model: role-scoped isolated containers + role-attributed execution."
+}
+
+render_agents_adapter_document() {
+  echo "# Runtime Agent Instructions Adapter"
+  echo
+  echo "Generated by .devcontainer-workstation/scripts/init-workstation.sh"
+  echo
+  echo "Use the canonical runtime role instructions in \`${RUNTIME_ROLE_INSTRUCTIONS_FILE}\`."
+  echo
+  echo "Apply runtime access policy from \`${RUNTIME_AGENT_RUNTIME_POLICY_FILE}\`."
+  echo
+  echo "- Role profile: ${ROLE_PROFILE}"
+  echo "- Canonical instructions file: \`${RUNTIME_ROLE_INSTRUCTIONS_FILE}\`"
+  echo "- Runtime access policy file: \`${RUNTIME_AGENT_RUNTIME_POLICY_FILE}\`"
+  echo
+  echo "If \`${RUNTIME_ROLE_INSTRUCTIONS_FILE}\` is missing or unreadable, escalate."
+}
+
+# Copilot and Continue adapters differ only in their title.
+render_tool_adapter_document() {
+  local tool_name="$1"
+
+  echo "# Runtime ${tool_name} Instructions Adapter"
+  echo
+  echo "Generated by .devcontainer-workstation/scripts/init-workstation.sh"
+  echo
+  echo "Use the canonical runtime role instructions at:"
+  echo
+  echo "- \`${RUNTIME_ROLE_INSTRUCTIONS_FILE}\`"
+  echo "- \`${RUNTIME_AGENT_RUNTIME_POLICY_FILE}\`"
+  echo "- Role profile: ${ROLE_PROFILE}"
+  echo
+  echo "Do not reinterpret or override role authority boundaries defined there."
+}
+
+render_runtime_instruction_entry() {
+  local entry="$1"
+
+  case "$entry" in
+    role-instructions.*) render_runtime_role_instructions_document "${entry#role-instructions.}" ;;
+    agent-runtime-policy) render_agent_runtime_policy_document ;;
+    agents-adapter) render_agents_adapter_document ;;
+    copilot-adapter) render_tool_adapter_document "Copilot" ;;
+    continue-adapter) render_tool_adapter_document "Continue" ;;
+    *)
+      echo "Unknown runtime instruction entry: ${entry}" >&2
+      return 1
+      ;;
+  esac
+}
+
+# Render every entry into bundle_dir/objects and write bundle_dir/manifest.tsv.
+build_runtime_instruction_bundle() {
+  local bundle_dir="$1"
+  local objects_dir="${bundle_dir}/objects"
+  local manifest_tmp
+  local entry tmp_file digest
+
+  mkdir -p "$objects_dir"
+  manifest_tmp="$(mktemp "${bundle_dir}/manifest.XXXXXX")"
+  {
+    printf 'format\t%s\n' "$RUNTIME_INSTRUCTION_BUNDLE_FORMAT"
+    printf 'inputs_key\t%s\n' "$(runtime_instruction_inputs_key)"
+    printf 'role_profile\t%s\n' "$ROLE_PROFILE"
+  } >"$manifest_tmp"
+
+  for entry in "${RUNTIME_INSTRUCTION_ENTRIES[@]}"; do
+    tmp_file="$(mktemp "${objects_dir}/render.XXXXXX")"
+    render_runtime_instruction_entry "$entry" >"$tmp_file"
+    digest="$(sha256sum "$tmp_file" | cut -d' ' -f1)"
+    mv -f "$tmp_file" "${objects_dir}/${digest}"
+    chmod 444 "${objects_dir}/${digest}"
+    printf 'entry\t%s\t%s\n' "$entry" "$digest" >>"$manifest_tmp"
+  done
+
+  chmod 644 "$manifest_tmp"
+  mv -f "$manifest_tmp" "${bundle_dir}/manifest.tsv"
+}
+
+# Print the bundled object path for each requested entry, one per line.
+# Returns 1 (printing nothing) when the bundle is absent, was built from
+# different inputs, or an object does not match its recorded digest.
+runtime_instruction_bundle_objects() {
+  local bundle_dir="$1"
+  shift
+  local manifest="${bundle_dir}/manifest.tsv"
+  local -A digests=()
+  local kind name digest format="" inputs_key=""
+  local -a objects=() check_lines=()
+
+  [ -r "$manifest" ] || return 1
+  while IFS=$'\t' read -r kind name digest; do
+    case "$kind" in
+      format) format="$name" ;;
+      inputs_key) inputs_key="$name" ;;
+      entry) digests[$name]="$digest" ;;
+    esac
+  done <"$manifest"
+
+  [ "$format" = "$RUNTIME_INSTRUCTION_BUNDLE_FORMAT" ] || return 1
+  [ "$inputs_key" = "$(runtime_instruction_inputs_key)" ] || return 1
+
+  for name in "$@"; do
+    digest="${digests[$name]:-}"
+    [ -n "$digest" ] || return 1
+    objects+=("${bundle_dir}/objects/${digest}")
+    check_lines+=("${digest}  ${bundle_dir}/objects/${digest}")
+  done
+
+  printf '%s\n' "${check_lines[@]}" | sha256sum --check --status - 2>/dev/null || return 1
+  printf '%s\n' "${objects[@]}"
+}
@@ -5,6 +5,8 @@ ROLE_GITHUB_AUTH_MODE="${ROLE_GITHUB_AUTH_MODE:-}"
 ROLE_GITHUB_APP_ID="${ROLE_GITHUB_APP_ID:-}"
 ROLE_GITHUB_APP_INSTALLATION_ID="${ROLE_GITHUB_APP_INSTALLATION_ID:-}"
 ROLE_GITHUB_APP_PRIVATE_KEY_PATH="${ROLE_GITHUB_APP_PRIVATE_KEY_PATH:-}"
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+ROLE_GITHUB_TOKEN_BROKER="${ROLE_GITHUB_TOKEN_BROKER:-$(command -v role-github-token-broker || echo "${SCRIPT_DIR}/role-github-token-broker.py")}"
 
 if [ "$ROLE_GITHUB_AUTH_MODE" != "app" ]; then
   echo "ROLE_GITHUB_AUTH_MODE is not set to app; skipping role GitHub App auth."
@@ -32,33 +34,25 @@ if [ ! -r "$ROLE_GITHUB_APP_PRIVATE_KEY_PATH" ]; then
   exit 1
 fi
 
-base64url() {
-  openssl base64 -e -A | tr '+/' '-_' | tr -d '='
-}
-
-now="$(date +%s)"
-iat="$((now - 30))"
-exp="$((now + 540))"
-header='{"alg":"RS256","typ":"JWT"}'
-payload="{\"iat\":${iat},\"exp\":${exp},\"iss\":\"${ROLE_GITHUB_APP_ID}\"}"
-
-header_b64="$(printf '%s' "$header" | base64url)"
-payload_b64="$(printf '%s' "$payload" | base64url)"
-unsigned_token="${header_b64}.${payload_b64}"
-signature="$(printf '%s' "$unsigned_token" | openssl dgst -sha256 -sign "$ROLE_GITHUB_APP_PRIVATE_KEY_PATH" | base64url)"
-app_jwt="${unsigned_token}.${signature}"
+if [ ! -x "$ROLE_GITHUB_TOKEN_BROKER" ]; then
+  echo "GitHub App token broker is missing or not executable: ${ROLE_GITHUB_TOKEN_BROKER}" >&2
+  exit 1
+fi
 
-installation_token_response="$(curl -fsS \
-  -X POST \
-  -H "Authorization: Bearer ${app_jwt}" \
-  -H "Accept: application/vnd.github+json" \
-  "https://api.github.com/app/installations/${ROLE_GITHUB_APP_INSTALLATION_ID}/access_tokens" \
-)"
-installation_token="$(printf '%s' "$installation_token_response" | jq -r '.token // empty')"
+token_args=(token)
+if [ "${ROLE_GITHUB_APP_FORCE_MINT:-false}" = "true" ]; then
+  token_args+=(--force-refresh)
+fi
 
-if [ -z "$installation_token" ]; then
+# The broker serves a cached installation token when its daemon is running and
+# otherwise mints one in-process (JWT signed without the shell openssl pipeline).
+if ! installation_token="$(
+  ROLE_GITHUB_APP_ID="$ROLE_GITHUB_APP_ID" \
+  ROLE_GITHUB_APP_INSTALLATION_ID="$ROLE_GITHUB_APP_INSTALLATION_ID" \
+  ROLE_GITHUB_APP_PRIVATE_KEY_PATH="$ROLE_GITHUB_APP_PRIVATE_KEY_PATH" \
+  "$ROLE_GITHUB_TOKEN_BROKER" "${token_args[@]}"
+)" || [ -z "$installation_token" ]; then
   echo "Failed to mint GitHub App installation token." >&2
-  printf '%s\n' "$installation_token_response" >&2
   exit 1
 fi
 
@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+Runtime policy verification for role workstations.
+
+Default mode checks a running workstation: the generated runtime access policy,
+the instruction adapters, and the effective Codex config (parsed once with
+tomllib). `--profiles` instead checks every `codex/role-profiles/*.env` overlay
+against the base config in one pass, by applying each overlay the way
+init-workstation.sh does and evaluating the same config rules on the result.
+
+Checks are declared in CONFIG_RULES, POLICY_DOC_RULES, ADAPTER_RULE and
+PROFILE_RULES. The exit code ORs together the failed checks' bits (warnings,
+such as a profile value that init overrides, do not set a bit):
+  0 OK, 1 MISSING_FILE, 2 POLICY_MISMATCH, 4 ADAPTER_MISMATCH
+
+Paths default to the same environment variables as init-workstation.sh:
+  CODEX_HOME, RUNTIME_AGENT_RUNTIME_POLICY_FILE, RUNTIME_AGENTS_ADAPTER_FILE,
+  RUNTIME_COPILOT_INSTRUCTIONS_FILE, RUNTIME_CONTINUE_INSTRUCTIONS_FILE,
+  ROLE_PROFILES_DIR, DEFAULT_CONFIG
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import json
+import os
+import shlex
+import sys
+import tomllib
+from pathlib import Path
+from typing import Any, NamedTuple
+
+EXIT_OK = 0
+EXIT_MISSING_FILE = 1
+EXIT_POLICY_MISMATCH = 2
+EXIT_ADAPTER_MISMATCH = 4
+
+WORKSTATION_DIR = Path(__file__).resolve().parent.parent
+MISSING = object()
+
+
+class ConfigRule(NamedTuple):
+    path: tuple[str, ...]
+    expected: Any
+    label: str
+    # Only evaluated when this table exists (mirrors Codex: the section is optional).
+    only_if_table: tuple[str, ...] | None = None
+
+
+class TextRule(NamedTuple):
+    needles: tuple[str, ...]
+    match: str  # "all" or "any"
+    label: str
+    exit_bit: int
+
+
+class ProfileRule(NamedTuple):
+    variable: str
+    config_path: tuple[str, ...] | None
+    kind: str  # "string" (replace_string_setting) or "raw" (replace_raw_setting)
+    # init-workstation.sh always writes this value, whatever the profile requests.
+    forced: Any = MISSING
+    allowed: tuple[str, ...] | None = None
+
+
+class CheckResult(NamedTuple):
+    scope: str
+    status: str  # "pass", "warn" (reported, no exit bit) or "fail"
+    message: str
+    exit_bit: int = 0
+
+
+CONFIG_RULES = (
+    ConfigRule(("approval_policy",), "never", "Codex approval_policy enforced as 'never'"),
+    ConfigRule(("sandbox_mode",), "danger-full-access", "Codex sandbox_mode enforced as 'danger-full-access'"),
+    ConfigRule(
+        ("sandbox_workspace_write", "writable_roots"),
+        ["/"],
+        "Codex writable_roots fallback enforced as ['/']",
+        only_if_table=("sandbox_workspace_write",),
+    ),
+)
+
+POLICY_DOC_RULES = (
+    TextRule(
+        ("full container-local access",),
+        "all",
+        "Runtime policy documents full container-local access parity",
+        EXIT_POLICY_MISMATCH,
+    ),
+    TextRule(("Codex", "Copilot", "Continue"), "all", "Runtime policy covers Codex, Copilot, Continue", EXIT_POLICY_MISMATCH),
+)
+
+ADAPTER_RULE = TextRule(
+    ("agent-runtime-policy.md", "runtime-access policy"),
+    "any",
+    "references shared runtime policy",
+    EXIT_ADAPTER_MISMATCH,
+)
+
+PROFILE_RULES = (
+    ProfileRule("ROLE_APPROVAL_POLICY", ("approval_policy",), "string", forced="never"),
+    ProfileRule("ROLE_SANDBOX_MODE", ("sandbox_mode",), "string", forced="danger-full-access"),
+    ProfileRule("ROLE_WRITABLE_ROOTS", ("sandbox_workspace_write", "writable_roots"), "raw", forced=["/"]),
+    ProfileRule(
+        "ROLE_MODEL_REASONING_EFFORT",
+        ("model_reasoning_effort",),
+        "string",
+        allowed=("minimal", "low", "medium", "high", "xhigh"),
+    ),
+    ProfileRule("ROLE_MODEL_PERSONALITY", ("model_personality",), "string"),
+    ProfileRule("ROLE_PROJECT_DOC_FALLBACK_FILENAMES", ("project_doc_fallback_filenames",), "raw"),
+    ProfileRule("ROLE_GITHUB_AUTH_MODE", None, "string", allowed=("app", "user")),
+)
+
+
+def lookup(document: dict[str, Any], path: tuple[str, ...]) -> Any:
+    value: Any = document
+    for part in path:
+        if not isinstance(value, dict) or part not in value:
+            return MISSING
+        value = value[part]
+    return value
+
+
+def assign(document: dict[str, Any], path: tuple[str, ...], value: Any) -> None:
+    target = document
+    for part in path[:-1]:
+        target = target[part]
+    target[path[-1]] = value
+
+
+def load_toml(path: Path) -> tuple[dict[str, Any] | None, CheckResult | None]:
+    try:
+        with open(path, "rb") as handle:
+            return tomllib.load(handle), None
+    except FileNotFoundError:
+        return None, CheckResult("codex-config", "fail", f"Codex config file not found: {path}", EXIT_MISSING_FILE)
+    except tomllib.TOMLDecodeError as exc:
+        return None, CheckResult("codex-config", "fail", f"Codex config is not valid TOML ({path}): {exc}", EXIT_POLICY_MISMATCH)
+
+
+def evaluate_config(config: dict[str, Any], scope: str) -> list[CheckResult]:
+    results = []
+    for rule in CONFIG_RULES:
+        if rule.only_if_table and not isinstance(lookup(config, rule.only_if_table), dict):
+            continue
+        actual = lookup(config, rule.path)
+        if actual == rule.expected:
+            results.append(CheckResult(scope, "pass", rule.label))
+        else:
+            shown = "<unset>" if actual is MISSING else json.dumps(actual)
+            results.append(
+                CheckResult(scope, "fail", f"{rule.label} (found {'.'.join(rule.path)} = {shown})", EXIT_POLICY_MISMATCH)
+            )
+    return results
+
+
+def evaluate_text(text: str, rule: TextRule, scope: str, subject: str = "") -> CheckResult:
+    missing = [needle for needle in rule.needles if needle not in text]
+    passed = not missing if rule.match == "all" else len(missing) < len(rule.needles)
+    label = f"{subject} {rule.label}".strip()
+    if passed:
+        return CheckResult(scope, "pass", label)
+    detail = ", ".join(missing) if rule.match == "all" else " or ".join(rule.needles)
+    return CheckResult(scope, "fail", f"{label} (missing: {detail})", rule.exit_bit)
+
+
+def verify_runtime(config_path: Path, policy_path: Path, adapter_paths: list[Path]) -> list[CheckResult]:
+    results: list[CheckResult] = []
+
+    try:
+        policy_text = policy_path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        results.append(CheckResult("runtime-policy", "fail", f"Runtime policy file not found: {policy_path}", EXIT_MISSING_FILE))
+    else:
+        results.append(CheckResult("runtime-policy", "pass", f"Runtime policy file present: {policy_path}"))
+        results.extend(evaluate_text(policy_text, rule, "runtime-policy") for rule in POLICY_DOC_RULES)
+
+    config, error = load_toml(config_path)
+    if error:
+        results.append(error)
+    else:
+        results.append(CheckResult("codex-config", "pass", f"Codex config file present: {config_path}"))
+        results.extend(evaluate_config(config, "codex-config"))
+
+    for adapter_path in adapter_paths:
+        scope = f"adapter:{adapter_path.name}"
+        try:
+            text = adapter_path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            results.append(CheckResult(scope, "fail", f"Adapter file not found: {adapter_path}", EXIT_MISSING_FILE))
+            continue
+        results.append(CheckResult(scope, "pass", f"Adapter file present: {adapter_path.name}"))
+        results.append(evaluate_text(text, ADAPTER_RULE, scope, adapter_path.name))
+    return results
+
+
+def parse_env_file(path: Path) -> dict[str, str]:
+    """KEY=VALUE assignments from a role profile, unquoted as bash would."""
+    values: dict[str, str] = {}
+    for line in path.read_text(encoding="utf-8").splitlines():
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        key, sep, raw = stripped.partition("=")
+        if not sep:
+            continue
+        values[key.strip()] = "".join(shlex.split(raw, comments=True))
+    return values
+
+
+def parse_profile_value(rule: ProfileRule, value: str) -> Any:
+    if rule.kind == "string":
+        return value
+    return tomllib.loads(f"value = {value}")["value"]
+
+
+def verify_profile(path: Path, base_config: dict[str, Any]) -> list[CheckResult]:
+    scope = f"profile:{path.stem}"
+    try:
+        values = parse_env_file(path)
+    except (OSError, ValueError) as exc:
+        return [CheckResult(scope, "fail", f"{path.name}: unreadable role profile ({exc})", EXIT_POLICY_MISMATCH)]
+
+    results: list[CheckResult] = []
+    effective = copy.deepcopy(base_config)
+    for rule in PROFILE_RULES:
+        requested = values.get(rule.variable, "")
+        if requested:
+            try:
+                parsed = parse_profile_value(rule, requested)
+            except tomllib.TOMLDecodeError as exc:
+                results.append(CheckResult(scope, "fail", f"{rule.variable} is not a valid TOML value: {exc}", EXIT_POLICY_MISMATCH))
+                continue
+            if rule.allowed and parsed not in rule.allowed:
+                results.append(
+                    CheckResult(
+                        scope, "fail", f"{rule.variable}={requested!r} (allowed: {', '.join(rule.allowed)})", EXIT_POLICY_MISMATCH
+                    )
+                )
+                continue
+            if rule.forced is not MISSING and parsed != rule.forced:
+                # init-workstation.sh warns and overrides, so this is not a failure.
+                results.append(
+                    CheckResult(
+                        scope,
+                        "warn",
+                        f"{rule.variable}={requested!r} is ignored; init enforces {json.dumps(rule.forced)}",
+                    )
+                )
+        else:
+            parsed = MISSING
+
+        value = rule.forced if rule.forced is not MISSING else parsed
+        if rule.config_path is None or value is MISSING:
+            continue
+        # init-workstation.sh only replaces keys already present in the config.
+        if lookup(effective, rule.config_path) is MISSING:
+            results.append(
+                CheckResult(
+                    scope,
+                    "fail",
+                    f"{rule.variable} targets {'.'.join(rule.config_path)}, which the base config does not define",
+                    EXIT_POLICY_MISMATCH,
+                )
+            )
+            continue
+        assign(effective, rule.config_path, value)
+
+    results.extend(evaluate_config(effective, scope))
+    return results
+
+
+def verify_profiles(profiles_dir: Path, base_config_path: Path) -> list[CheckResult]:
+    base_config, error = load_toml(base_config_path)
+    if error:
+        return [error]
+    profiles = sorted(profiles_dir.glob("*.env"))
+    if not profiles:
+        return [CheckResult("profiles", "fail", f"No role profiles found in {profiles_dir}", EXIT_MISSING_FILE)]
+    results: list[CheckResult] = []
+    for path in profiles:
+        results.extend(verify_profile(path, base_config))
+    return results
+
+
+def default_path(env_name: str, repo_relative: str, image_path: str) -> Path:
+    override = os.getenv(env_name, "").strip()
+    if override:
+        return Path(override)
+    candidate = WORKSTATION_DIR / repo_relative
+    return candidate if candidate.exists() else Path(image_path)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Verify workstation runtime policy and role profile overlays.")
+    parser.add_argument(
+        "--profiles",
+        action="store_true",
+        help="Verify every role profile overlay against the base config instead of the running workstation.",
+    )
+    parser.add_argument(
+        "--config",
+        type=Path,
+        default=Path(os.getenv("CODEX_HOME", "/root/.codex")) / "config.toml",
+        help="Effective Codex config (default: $CODEX_HOME/config.toml).",
+    )
+    parser.add_argument(
+        "--policy-file",
+        type=Path,
+        default=Path(os.getenv("RUNTIME_AGENT_RUNTIME_POLICY_FILE", "/workspace/instructions/agent-runtime-policy.md")),
+    )
+    parser.add_argument(
+        "--adapter",
+        action="append",
+        type=Path,
+        help="Adapter file to check (repeatable; default: the AGENTS, Copilot and Continue adapters).",
+    )
+    parser.add_argument(
+        "--profiles-dir",
+        type=Path,
+        default=default_path("ROLE_PROFILES_DIR", "codex/role-profiles", "/etc/codex/role-profiles"),
+    )
+    parser.add_argument(
+        "--base-config",
+        type=Path,
+        default=default_path("DEFAULT_CONFIG", "codex/config.toml", "/etc/codex/config.toml"),
+    )
+    parser.add_argument("--json", action="store_true", help="Print structured results as JSON.")
+    return parser.parse_args()
+
+
+def report(results: list[CheckResult], exit_code: int, as_json: bool) -> None:
+    if as_json:
+        print(
+            json.dumps(
+                {"exit_code": exit_code, "checks": [result._asdict() for result in results]},
+                indent=2,
+            )
+        )
+        return
+
+    print("=== Runtime Policy Verification ===")
+    group = None
+    for result in results:
+        # Blank line between sections; adapter:/profile: scopes share a section per prefix.
+        section = result.scope.split(":")[0]
+        if group is not None and section != group:
+            print()
+        group = section
+        line = f"{result.status.upper()}: [{result.scope}] {result.message}"
+        print(line, file=sys.stderr if result.status == "fail" else sys.stdout)
+    print()
+    print("=== Verification Summary ===")
+    if exit_code == EXIT_OK:
+        print("SUCCESS: All policy validation checks passed.")
+    else:
+        print(f"FAILURE: Policy validation failed with exit code {exit_code}", file=sys.stderr)
+
+
+def main() -> int:
+    args = parse_args()
+    if args.profiles:
+        results = verify_profiles(args.profiles_dir, args.base_config)
+    else:
+        adapters = args.adapter or [
+            Path(os.getenv("RUNTIME_AGENTS_ADAPTER_FILE", "/workspace/instructions/AGENTS.md")),
+            Path(os.getenv("RUNTIME_COPILOT_INSTRUCTIONS_FILE", "/workspace/instructions/copilot-instructions.md")),
+            Path(os.getenv("RUNTIME_CONTINUE_INSTRUCTIONS_FILE", "/workspace/instructions/continue-instructions.md")),
+        ]
+        results = verify_runtime(args.config, args.policy_file, adapters)
+
+    exit_code = EXIT_OK
+    for result in results:
+        if result.status == "fail":
+            exit_code |= result.exit_bit
+    report(results, exit_code, args.json)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,467 @@
+#!/usr/bin/env python3
+"""
+Audit PR metadata compliance across every governed repository.
+
+Merged PR bodies are fetched in bulk (GraphQL, 100 per page) for each
+repository in 00-os/governed-repos.yml and cached locally as JSONL pages:
+
+  <cache-dir>/<owner>/<repo>/manifest.json
+  <cache-dir>/<owner>/<repo>/pages/page-00001.jsonl
+
+The first online run crawls every merged PR and records a merge-time
+watermark taken when the crawl started. Later runs search for PRs merged at
+or after that watermark (less a margin for search-index lag), so a PR opened
+long ago but merged since the last run is still picked up; overlap is
+deduplicated by PR number. `--offline` re-runs the audit purely from the
+cached corpus.
+
+Bodies are validated in parallel with the role-repo `validate-pr-metadata.py`
+template, and a compliance report is produced per repository and per
+`Primary-Role`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import calendar
+import json
+import os
+import pathlib
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from importlib.machinery import SourceFileLoader
+from types import ModuleType
+from typing import Any, Iterator
+
+import yaml
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parent.parent.parent
+ROLE_REPO_TEMPLATE = REPO_ROOT / "10-templates" / "repo-starters" / "role-repo-template"
+VALIDATOR_TEMPLATE = ROLE_REPO_TEMPLATE / "templates" / "scripts" / "validate-pr-metadata.py.tmpl"
+GITHUB_CLIENT_DIR = ROLE_REPO_TEMPLATE / "scripts"
+
+PAGE_SIZE = 100
+VALIDATION_CHUNK_SIZE = 500
+MISSING_ROLE = "(missing)"
+SCHEMA_VERSION = 1
+# Search results are capped; larger incremental windows fall back to a full crawl.
+SEARCH_RESULT_LIMIT = 1000
+SEARCH_INDEX_LAG_SECONDS = 3600
+
+PR_FIELDS = """
+        number
+        title
+        url
+        mergedAt
+        body
+"""
+
+MERGED_PRS_QUERY = """
+query($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    pullRequests(states: MERGED, first: %d, after: $cursor, orderBy: {field: CREATED_AT, direction: ASC}) {
+      pageInfo {
+        hasNextPage
+        endCursor
+      }
+      nodes {%s      }
+    }
+  }
+}
+""" % (PAGE_SIZE, PR_FIELDS)
+
+MERGED_SINCE_QUERY = """
+query($query: String!, $cursor: String) {
+  search(type: ISSUE, query: $query, first: %d, after: $cursor) {
+    issueCount
+    pageInfo {
+      hasNextPage
+      endCursor
+    }
+    nodes {
+      ... on PullRequest {%s      }
+    }
+  }
+}
+""" % (PAGE_SIZE, PR_FIELDS)
+
+
+def default_cache_dir() -> pathlib.Path:
+    base = os.getenv("XDG_CACHE_HOME", "").strip() or str(pathlib.Path.home() / ".cache")
+    return pathlib.Path(base) / "context-engineering" / "pr-metadata-audit"
+
+
+def load_governed_repos(path: pathlib.Path) -> list[str]:
+    try:
+        with path.open("r", encoding="utf-8") as handle:
+            data = yaml.safe_load(handle)
+    except FileNotFoundError:
+        raise ValueError(f"{path}: file not found")
+    except yaml.YAMLError as exc:
+        raise ValueError(f"{path}: invalid YAML ({exc})")
+
+    repositories = (data or {}).get("repositories")
+    if not isinstance(repositories, list):
+        raise ValueError(f"{path}.repositories: expected list/array")
+    return [item["repo"] for item in repositories if isinstance(item, dict) and isinstance(item.get("repo"), str)]
+
+
+def repo_cache_dir(cache_dir: pathlib.Path, repo: str) -> pathlib.Path:
+    owner, name = repo.split("/", 1)
+    return cache_dir / owner / name
+
+
+def empty_manifest() -> dict[str, Any]:
+    return {"schema_version": SCHEMA_VERSION, "pages": [], "merged_watermark": None}
+
+
+def load_manifest(repo_dir: pathlib.Path) -> dict[str, Any]:
+    try:
+        return json.loads((repo_dir / "manifest.json").read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return empty_manifest()
+
+
+def write_manifest(repo_dir: pathlib.Path, manifest: dict[str, Any]) -> None:
+    tmp_path = repo_dir / "manifest.json.tmp"
+    tmp_path.write_text(json.dumps(manifest, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    os.replace(tmp_path, repo_dir / "manifest.json")
+
+
+def _utc_iso(epoch: float) -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(epoch))
+
+
+def _write_page(
+    pages_dir: pathlib.Path, manifest: dict[str, Any], repo: str, nodes: list[dict[str, Any]]
+) -> None:
+    page_name = f"page-{len(manifest['pages']) + 1:05d}.jsonl"
+    with (pages_dir / page_name).open("w", encoding="utf-8") as handle:
+        for node in nodes:
+            handle.write(json.dumps({"repo": repo, **node}, sort_keys=True))
+            handle.write("\n")
+    manifest["pages"].append({"file": page_name, "count": len(nodes)})
+
+
+def _crawl_merged_prs(
+    client: Any, repo: str, repo_dir: pathlib.Path, manifest: dict[str, Any]
+) -> int:
+    """Full crawl of the merged-PR connection; resumable via `backfill_cursor`."""
+    pages_dir = repo_dir / "pages"
+    owner, name = repo.split("/", 1)
+    manifest.setdefault("backfill_started_at", _utc_iso(time.time()))
+    cursor = manifest.get("backfill_cursor")
+    fetched = 0
+
+    while True:
+        data = client.graphql(MERGED_PRS_QUERY, {"owner": owner, "name": name, "cursor": cursor})
+        connection = (data.get("repository") or {}).get("pullRequests") or {}
+        nodes = connection.get("nodes") or []
+        page_info = connection.get("pageInfo") or {}
+
+        if nodes:
+            _write_page(pages_dir, manifest, repo, nodes)
+            fetched += len(nodes)
+
+        # Advance the stored cursor only after the page is on disk, so an
+        # interrupted crawl resumes without gaps.
+        if page_info.get("endCursor"):
+            cursor = page_info["endCursor"]
+            manifest["backfill_cursor"] = cursor
+        if not page_info.get("hasNextPage"):
+            # Anything merged after the crawl started is caught by the next
+            # incremental search, whatever its creation date.
+            manifest["merged_watermark"] = manifest.pop("backfill_started_at")
+            manifest.pop("backfill_cursor", None)
+        manifest["fetched_at"] = _utc_iso(time.time())
+        write_manifest(repo_dir, manifest)
+
+        if not page_info.get("hasNextPage"):
+            return fetched
+
+
+def _search_merged_since(
+    client: Any, repo: str, repo_dir: pathlib.Path, manifest: dict[str, Any]
+) -> int | None:
+    """Fetch PRs merged at or after the watermark; None if the window is too large to search."""
+    pages_dir = repo_dir / "pages"
+    searched_at = time.time()
+    since = _utc_iso(
+        calendar.timegm(time.strptime(manifest["merged_watermark"], "%Y-%m-%dT%H:%M:%SZ"))
+        - SEARCH_INDEX_LAG_SECONDS
+    )
+    query = f"repo:{repo} is:pr is:merged merged:>={since}"
+    known = {int(record["number"]) for record in iter_page_records(repo_dir, manifest)}
+    cursor = None
+    fetched = 0
+
+    while True:
+        data = client.graphql(MERGED_SINCE_QUERY, {"query": query, "cursor": cursor})
+        search = data.get("search") or {}
+        if cursor is None and int(search.get("issueCount") or 0) > SEARCH_RESULT_LIMIT:
+            return None
+        page_info = search.get("pageInfo") or {}
+        nodes = [
+            node
+            for node in search.get("nodes") or []
+            if node and node.get("number") is not None and int(node["number"]) not in known
+        ]
+        if nodes:
+            _write_page(pages_dir, manifest, repo, nodes)
+            known.update(int(node["number"]) for node in nodes)
+            fetched += len(nodes)
+            write_manifest(repo_dir, manifest)
+
+        if not page_info.get("hasNextPage"):
+            break
+        cursor = page_info.get("endCursor")
+
+    # The watermark moves only once the whole window is cached; an interrupted
+    # search repeats it and dedupes against the pages already written.
+    manifest["merged_watermark"] = _utc_iso(searched_at)
+    manifest["fetched_at"] = _utc_iso(time.time())
+    write_manifest(repo_dir, manifest)
+    return fetched
+
+
+def fetch_repo_pages(client: Any, repo: str, cache_dir: pathlib.Path, refresh: bool) -> int:
+    """Bring the cached corpus up to date; return the number of PRs fetched."""
+    repo_dir = repo_cache_dir(cache_dir, repo)
+    pages_dir = repo_dir / "pages"
+    manifest = load_manifest(repo_dir)
+    if refresh or manifest.get("schema_version") != SCHEMA_VERSION:
+        manifest = empty_manifest()
+        if pages_dir.exists():
+            for page in pages_dir.glob("page-*.jsonl"):
+                page.unlink()
+    pages_dir.mkdir(parents=True, exist_ok=True)
+
+    if manifest.get("merged_watermark"):
+        fetched = _search_merged_since(client, repo, repo_dir, manifest)
+        if fetched is not None:
+            return fetched
+        print(
+            f"More than {SEARCH_RESULT_LIMIT} PRs merged since {manifest['merged_watermark']} in {repo}; "
+            "re-crawling all merged PRs.",
+            file=sys.stderr,
+        )
+        return fetch_repo_pages(client, repo, cache_dir, refresh=True)
+
+    return _crawl_merged_prs(client, repo, repo_dir, manifest)
+
+
+def iter_page_records(repo_dir: pathlib.Path, manifest: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    for page in manifest.get("pages", []):
+        with (repo_dir / "pages" / page["file"]).open("r", encoding="utf-8") as handle:
+            for line in handle:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def iter_cached_records(cache_dir: pathlib.Path, repo: str) -> Iterator[dict[str, Any]]:
+    """Cached PRs, one record per PR number (the most recently fetched copy wins)."""
+    repo_dir = repo_cache_dir(cache_dir, repo)
+    latest: dict[int, dict[str, Any]] = {}
+    for record in iter_page_records(repo_dir, load_manifest(repo_dir)):
+        latest[int(record["number"])] = record
+    yield from latest.values()
+
+
+_VALIDATOR: ModuleType | None = None
+
+
+def load_validator() -> ModuleType:
+    global _VALIDATOR
+    if _VALIDATOR is None:
+        loader = SourceFileLoader("validate_pr_metadata", str(VALIDATOR_TEMPLATE))
+        module = ModuleType(loader.name)
+        module.__file__ = str(VALIDATOR_TEMPLATE)
+        loader.exec_module(module)
+        _VALIDATOR = module
+    return _VALIDATOR
+
+
+def validate_chunk(records: list[tuple[str, int, str]]) -> list[dict[str, Any]]:
+    validator = load_validator()
+    results: list[dict[str, Any]] = []
+    for repo, number, body in records:
+        fields = validator.build_field_index(body)
+        errors = validator.validate(body=body, repo=None, pr_number=None, github_token=None)
+        results.append(
+            {
+                "repo": repo,
+                "number": number,
+                "primary_role": validator.extract_field_value(fields, "Primary-Role") or MISSING_ROLE,
+                "errors": errors,
+            }
+        )
+    return results
+
+
+def chunk_records(records: list[tuple[str, int, str]], size: int) -> Iterator[list[tuple[str, int, str]]]:
+    for start in range(0, len(records), size):
+        yield records[start : start + size]
+
+
+def summarize(results: list[dict[str, Any]], key: str) -> dict[str, dict[str, Any]]:
+    groups: dict[str, dict[str, Any]] = {}
+    for result in results:
+        group = groups.setdefault(
+            result[key], {"total": 0, "compliant": 0, "non_compliant": 0, "errors": Counter()}
+        )
+        group["total"] += 1
+        if result["errors"]:
+            group["non_compliant"] += 1
+            for error in result["errors"]:
+                group["errors"][error] += 1
+        else:
+            group["compliant"] += 1
+
+    for group in groups.values():
+        group["compliance_rate"] = round(group["compliant"] / group["total"], 4) if group["total"] else 0.0
+        group["top_errors"] = [
+            {"error": error, "count": count} for error, count in group.pop("errors").most_common(5)
+        ]
+    return dict(sorted(groups.items()))
+
+
+def render_text(report: dict[str, Any]) -> str:
+    lines = [
+        f"PR metadata audit: {report['total']} merged PRs across {len(report['by_repo'])} repositories "
+        f"({report['compliant']} compliant, {report['total'] - report['compliant']} non-compliant)."
+    ]
+    for title, key in (("Repository", "by_repo"), ("Primary-Role", "by_primary_role")):
+        rows = report[key]
+        width = max([len(title)] + [len(name) for name in rows])
+        lines.append("")
+        lines.append(f"{title:<{width}}  {'total':>7}  {'ok':>7}  {'fail':>7}  {'rate':>7}")
+        for name, group in rows.items():
+            lines.append(
+                f"{name:<{width}}  {group['total']:>7}  {group['compliant']:>7}  "
+                f"{group['non_compliant']:>7}  {group['compliance_rate'] * 100:>6.1f}%"
+            )
+    if report["missing_cache"]:
+        lines.append("")
+        lines.append(f"No cached corpus (skipped): {', '.join(report['missing_cache'])}")
+    return "\n".join(lines)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Audit merged PR metadata compliance across governed repositories."
+    )
+    parser.add_argument(
+        "--registry",
+        default=str(REPO_ROOT / "00-os" / "governed-repos.yml"),
+        help="Path to governed repository registry YAML file.",
+    )
+    parser.add_argument(
+        "--repo",
+        action="append",
+        default=[],
+        help="Limit the audit to OWNER/REPO (repeatable). Defaults to every registry entry.",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=os.getenv("PR_METADATA_AUDIT_CACHE_DIR") or str(default_cache_dir()),
+        help="Root of the cached JSONL corpus.",
+    )
+    parser.add_argument("--offline", action="store_true", help="Use only the cached corpus; no API calls.")
+    parser.add_argument("--refresh", action="store_true", help="Discard cached pages and refetch from the start.")
+    parser.add_argument(
+        "--merged-since",
+        help="Only audit PRs merged on or after this ISO date (for example 2026-01-01).",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Parallel validation workers (default: CPU count).",
+    )
+    parser.add_argument("--format", choices=["text", "json"], default="text")
+    parser.add_argument("--output", help="Write the report to this file instead of stdout.")
+    parser.add_argument(
+        "--include-failures",
+        action="store_true",
+        help="Include per-PR failures in the JSON report.",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    cache_dir = pathlib.Path(args.cache_dir)
+
+    if args.offline and args.refresh:
+        print("--offline and --refresh are mutually exclusive.", file=sys.stderr)
+        return 2
+
+    try:
+        repos = args.repo or load_governed_repos(pathlib.Path(args.registry))
+    except ValueError as exc:
+        print(str(exc), file=sys.stderr)
+        return 2
+
+    if not args.offline:
+        sys.path.insert(0, str(GITHUB_CLIENT_DIR))
+        import github_client
+
+        with github_client.GitHubClient() as client:
+            for repo in repos:
+                try:
+                    fetched = fetch_repo_pages(client, repo, cache_dir, args.refresh)
+                except (github_client.GitHubAPIError, OSError) as exc:
+                    print(f"Failed to fetch merged PRs for {repo}: {exc}", file=sys.stderr)
+                    return 1
+                print(f"Fetched {fetched} new merged PRs for {repo}.", file=sys.stderr)
+
+    records: list[tuple[str, int, str]] = []
+    missing_cache: list[str] = []
+    for repo in repos:
+        if not (repo_cache_dir(cache_dir, repo) / "manifest.json").exists():
+            missing_cache.append(repo)
+            continue
+        for record in iter_cached_records(cache_dir, repo):
+            if args.merged_since and (record.get("mergedAt") or "") < args.merged_since:
+                continue
+            records.append((repo, int(record["number"]), record.get("body") or ""))
+
+    if args.offline and len(missing_cache) == len(repos):
+        print(f"No cached corpus found under {cache_dir}; run once without --offline.", file=sys.stderr)
+        return 1
+
+    chunks = list(chunk_records(records, VALIDATION_CHUNK_SIZE))
+    results: list[dict[str, Any]] = []
+    if args.jobs > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+            for chunk_results in executor.map(validate_chunk, chunks):
+                results.extend(chunk_results)
+    else:
+        for chunk in chunks:
+            results.extend(validate_chunk(chunk))
+
+    report: dict[str, Any] = {
+        "generated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "merged_since": args.merged_since,
+        "total": len(results),
+        "compliant": sum(1 for result in results if not result["errors"]),
+        "missing_cache": missing_cache,
+        "by_repo": summarize(results, "repo"),
+        "by_primary_role": summarize(results, "primary_role"),
+    }
+    if args.include_failures:
+        report["failures"] = [result for result in results if result["errors"]]
+
+    rendered = json.dumps(report, indent=2) if args.format == "json" else render_text(report)
+    if args.output:
+        pathlib.Path(args.output).write_text(rendered + "\n", encoding="utf-8")
+        print(f"Wrote PR metadata audit report: {args.output}")
+    else:
+        print(rendered)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
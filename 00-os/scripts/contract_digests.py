@@ -0,0 +1,144 @@
+"""
+Streaming SHA-256 digests for the governance upstream mirror.
+
+`contracts/governance-contract-lock.json` records `upstream_file_digests`, a
+map of mirror path -> "sha256:<hex>" taken at the pinned `source_commit`.
+Files are hashed with chunked reads (memory-mapped above MMAP_THRESHOLD) and
+results are kept in a stat-keyed cache, so unchanged files are not re-read.
+Used by validate-governance-contract-consumption.py and
+build-agent-job-description.py.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+UPSTREAM_DIR = "contracts/upstream"
+LOCK_DIGESTS_KEY = "upstream_file_digests"
+CHUNK_SIZE = 1024 * 1024
+MMAP_THRESHOLD = 8 * 1024 * 1024
+# Files modified this recently are hashed but not cached: a same-second rewrite
+# could otherwise keep an identical (size, mtime) stamp with new content.
+RACY_WINDOW_SECONDS = 2.0
+
+
+def file_sha256(path: Path) -> str:
+    """Hash a file without loading it whole; returns "sha256:<hex>"."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        size = os.fstat(handle.fileno()).st_size
+        if size >= MMAP_THRESHOLD:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    for offset in range(0, size, CHUNK_SIZE):
+                        digest.update(view[offset : offset + CHUNK_SIZE])
+                finally:
+                    view.release()
+        else:
+            buffer = bytearray(min(CHUNK_SIZE, max(size, 1)))
+            view = memoryview(buffer)
+            while True:
+                read = handle.readinto(buffer)
+                if not read:
+                    break
+                digest.update(view[:read])
+    return f"sha256:{digest.hexdigest()}"
+
+
+def default_cache_path() -> Path:
+    env_dir = os.getenv("CONTRACT_DIGEST_CACHE_DIR")
+    if env_dir:
+        return Path(env_dir) / "digests.json"
+    cache_home = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(cache_home) / "context-engineering" / "contract-digests" / "digests.json"
+
+
+class DigestCache:
+    """Digest cache keyed by (size, mtime_ns, inode); persistence is best-effort."""
+
+    def __init__(self, path: Path | None = None, enabled: bool = True) -> None:
+        self.path = path or default_cache_path()
+        self.enabled = enabled
+        self.stats = {"hits": 0, "misses": 0}
+        self._entries: dict[str, list[Any]] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        if enabled:
+            try:
+                document = json.loads(self.path.read_text(encoding="utf-8"))
+                self._entries = dict(document.get("entries", {}))
+            except (OSError, ValueError, AttributeError):
+                self._entries = {}
+
+    def digest(self, path: Path) -> str:
+        key = str(Path(path).resolve())
+        stat = os.stat(key)
+        stamp = [stat.st_size, stat.st_mtime_ns, stat.st_ino]
+        with self._lock:
+            entry = self._entries.get(key)
+            if self.enabled and entry and entry[:3] == stamp:
+                self.stats["hits"] += 1
+                return entry[3]
+        value = file_sha256(Path(key))
+        with self._lock:
+            self.stats["misses"] += 1
+            if self.enabled and time.time() - stat.st_mtime > RACY_WINDOW_SECONDS:
+                self._entries[key] = stamp + [value]
+                self._dirty = True
+        return value
+
+    def save(self) -> None:
+        with self._lock:
+            if not (self.enabled and self._dirty):
+                return
+            try:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+                tmp.write_text(json.dumps({"version": 1, "entries": self._entries}), encoding="utf-8")
+                tmp.replace(self.path)
+                self._dirty = False
+            except OSError:
+                pass
+
+
+def upstream_files(repo_root: Path) -> list[str]:
+    """Repo-relative POSIX paths of every file in the upstream mirror."""
+    base = repo_root / UPSTREAM_DIR
+    if not base.is_dir():
+        return []
+    return sorted(
+        path.relative_to(repo_root).as_posix() for path in base.rglob("*") if path.is_file()
+    )
+
+
+def compute_upstream_digests(repo_root: Path, cache: DigestCache) -> dict[str, str]:
+    return {rel: cache.digest(repo_root / rel) for rel in upstream_files(repo_root)}
+
+
+def verify_upstream_digests(repo_root: Path, lock: dict[str, Any], cache: DigestCache) -> list[str]:
+    """Return mismatches between the mirror and the lock's recorded digests."""
+    recorded = lock.get(LOCK_DIGESTS_KEY)
+    if not isinstance(recorded, dict) or not recorded:
+        return [f"lock file missing key '{LOCK_DIGESTS_KEY}' (run with --write-digests after syncing the mirror)"]
+
+    problems: list[str] = []
+    for rel, expected in sorted(recorded.items()):
+        path = repo_root / rel
+        if not path.is_file():
+            problems.append(f"upstream mirror file missing: {rel}")
+            continue
+        actual = cache.digest(path)
+        if actual != expected:
+            problems.append(f"upstream mirror digest mismatch for {rel}: lock {expected}, found {actual}")
+    for rel in upstream_files(repo_root):
+        if rel not in recorded:
+            problems.append(f"upstream mirror file not recorded in lock: {rel}")
+    return problems
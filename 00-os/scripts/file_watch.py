@@ -0,0 +1,145 @@
+"""
+Change notification for a fixed set of files.
+
+Uses Linux inotify through ctypes when available and falls back to stat
+polling elsewhere. Parent directories are watched rather than the files
+themselves, so editors that save via write-temp-then-rename are still seen.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Iterable, Protocol
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_CLOEXEC = 0o2000000
+IN_NONBLOCK = 0o4000
+WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+# struct inotify_event { int wd; uint32_t mask, cookie, len; char name[]; }
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class Watcher(Protocol):
+    kind: str
+
+    def wait(self, timeout: float | None) -> set[Path]: ...
+
+    def close(self) -> None: ...
+
+
+class InotifyWatcher:
+    kind = "inotify"
+
+    def __init__(self, paths: Iterable[Path]) -> None:
+        libc_name = ctypes.util.find_library("c")
+        if not libc_name:
+            raise OSError("libc not found")
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("inotify is not available")
+
+        self._paths = {Path(path).resolve() for path in paths}
+        self._fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self._fd < 0:
+            code = ctypes.get_errno()
+            raise OSError(code, f"inotify_init1: {os.strerror(code)}")
+
+        self._dirs: dict[int, Path] = {}
+        for directory in sorted({path.parent for path in self._paths}):
+            wd = libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+            if wd < 0:
+                code = ctypes.get_errno()
+                os.close(self._fd)
+                raise OSError(code, f"inotify_add_watch {directory}: {os.strerror(code)}")
+            self._dirs[wd] = directory
+
+    def wait(self, timeout: float | None) -> set[Path]:
+        """Block up to `timeout` seconds (None = forever); return watched paths that changed."""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return set()
+
+        changed: set[Path] = set()
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                wd, _mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset : offset + length].rstrip(b"\0")
+                offset += length
+                directory = self._dirs.get(wd)
+                if directory is None or not name:
+                    continue
+                path = directory / os.fsdecode(name)
+                if path in self._paths:
+                    changed.add(path)
+        return changed
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+class PollingWatcher:
+    kind = "polling"
+
+    def __init__(self, paths: Iterable[Path], interval: float = 0.25) -> None:
+        self._paths = sorted({Path(path).resolve() for path in paths})
+        self._interval = interval
+        self._stamps = {path: self._stamp(path) for path in self._paths}
+
+    @staticmethod
+    def _stamp(path: Path) -> tuple[int, int, int] | None:
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+    def wait(self, timeout: float | None) -> set[Path]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed: set[Path] = set()
+            for path in self._paths:
+                stamp = self._stamp(path)
+                if stamp != self._stamps[path]:
+                    self._stamps[path] = stamp
+                    changed.add(path)
+            if changed:
+                return changed
+            if deadline is None:
+                time.sleep(self._interval)
+                continue
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return set()
+            time.sleep(min(self._interval, remaining))
+
+    def close(self) -> None:
+        pass
+
+
+def open_watcher(paths: Iterable[Path], force_polling: bool = False, poll_interval: float = 0.25) -> Watcher:
+    """Return an inotify watcher on Linux, else (or when forced) a polling watcher."""
+    paths = list(paths)
+    if not force_polling and sys.platform.startswith("linux"):
+        try:
+            return InotifyWatcher(paths)
+        except OSError:
+            pass
+    return PollingWatcher(paths, poll_interval)
@@ -6,23 +6,34 @@ This script reads 00-os/role-registry.yml and generates role-specific
 wiring in workflows, compose files, and shell scripts.
 
 Usage:
-    python3 00-os/scripts/generate-role-wiring.py [--check]
+    python3 00-os/scripts/generate-role-wiring.py [--check | --watch] [--repo-root PATH]
 
 Options:
-    --check   Verify generated files match committed versions (CI mode)
+    --check       Verify generated files match committed versions (CI mode)
+    --watch       Stay resident and regenerate affected sections on change
+    --repo-root   Repository root to operate on (default: this checkout)
 """
 
 import sys
 import argparse
+import time
+from functools import lru_cache
 from pathlib import Path
 import yaml
 import re
-from typing import Dict, List, Any
+from typing import Callable, Dict, List, Any, NamedTuple, Optional, Tuple
 
+from file_watch import open_watcher
+from repo_index import RepoIndex
 
-def load_registry(repo_root: Path) -> Dict[str, Any]:
+REGISTRY_PATH = "00-os/role-registry.yml"
+
+
+def load_registry(repo_root: Path, index: Optional[RepoIndex] = None) -> Dict[str, Any]:
     """Load the canonical role registry."""
-    registry_path = repo_root / "00-os" / "role-registry.yml"
+    if index is not None:
+        return index.load_yaml(REGISTRY_PATH)
+    registry_path = repo_root / REGISTRY_PATH
     with open(registry_path, 'r') as f:
         return yaml.safe_load(f)
 
@@ -240,17 +251,24 @@ def generate_compose_volumes(roles: List[Dict]) -> str:
     return "\n".join(volumes)
 
 
-def replace_generated_block(content: str, marker: str, new_content: str) -> str:
-    """Replace content between GENERATED:BEGIN and GENERATED:END markers"""
+@lru_cache(maxsize=None)
+def block_pattern(marker: str) -> "re.Pattern[str]":
+    """Compiled matcher for one marker's BEGIN/END pair (group 2 is the body)."""
     begin_marker = f"# GENERATED:BEGIN:{marker}"
     end_marker = f"# GENERATED:END:{marker}"
-    
     # Use simple non-greedy match between exact marker pairs
     # Since marker names are unique, this correctly handles even overlapping prefixes
-    pattern = re.compile(
+    return re.compile(
         rf"({re.escape(begin_marker)})(.*?)({re.escape(end_marker)})",
         re.DOTALL
     )
+
+
+def replace_generated_block(content: str, marker: str, new_content: str) -> str:
+    """Replace content between GENERATED:BEGIN and GENERATED:END markers"""
+    begin_marker = f"# GENERATED:BEGIN:{marker}"
+    end_marker = f"# GENERATED:END:{marker}"
+    pattern = block_pattern(marker)
     
     match = pattern.search(content)
     if not match:
@@ -287,68 +305,233 @@ def update_file_with_generated(
             return False
 
 
+class GeneratedTarget(NamedTuple):
+    label: str
+    path: str
+    marker: str
+    generator: Callable[[List[Dict]], str]
+
+
+# Every generated block, in the order main() reports them.
+TARGETS: List[GeneratedTarget] = [
+    GeneratedTarget("sync matrix", ".github/workflows/sync-role-repos.yml", "ROLE_MATRIX", generate_workflow_sync_matrix),
+    GeneratedTarget("sync choices", ".github/workflows/sync-role-repos.yml", "ROLE_CHOICES", generate_workflow_dispatch_choices),
+    GeneratedTarget("publish matrix", ".github/workflows/publish-role-workstation-images.yml", "ROLE_MATRIX", generate_workflow_publish_matrix),
+    GeneratedTarget("shell menu", ".devcontainer-workstation/scripts/start-role-workstation.sh", "ROLE_MENU", generate_shell_role_menu),
+    GeneratedTarget("shell menu case", ".devcontainer-workstation/scripts/start-role-workstation.sh", "ROLE_MENU_CASE", generate_shell_role_case_menu),
+    GeneratedTarget("shell normalize", ".devcontainer-workstation/scripts/start-role-workstation.sh", "NORMALIZE_ROLE_CASES", generate_shell_normalize_role_cases),
+    GeneratedTarget("shell mapping", ".devcontainer-workstation/scripts/start-role-workstation.sh", "ROLE_MAPPING_CASES", generate_shell_role_mapping_cases),
+    GeneratedTarget("compose services", ".devcontainer-workstation/docker-compose.yml", "SERVICES", generate_compose_services),
+    GeneratedTarget("compose volumes", ".devcontainer-workstation/docker-compose.yml", "VOLUMES", generate_compose_volumes),
+    GeneratedTarget("compose ghcr services", ".devcontainer-workstation/docker-compose.ghcr.yml", "SERVICES", generate_compose_ghcr_services),
+    GeneratedTarget("compose ghcr volumes", ".devcontainer-workstation/docker-compose.ghcr.yml", "VOLUMES", generate_compose_volumes),
+]
+
+
+def check_generated(index: RepoIndex) -> List[str]:
+    """Return labels of generated sections that differ from the registry (read-only)."""
+    roles = load_registry(index.root, index)['roles']
+    rendered: Dict[Callable[[List[Dict]], str], str] = {}
+    failures = []
+    for target in TARGETS:
+        if target.generator not in rendered:
+            rendered[target.generator] = target.generator(roles)
+        content = index.read_text(target.path)
+        if replace_generated_block(content, target.marker, rendered[target.generator]) != content:
+            failures.append(target.label)
+    return failures
+
+
+def run_gate(index: RepoIndex) -> List[str]:
+    return [
+        f"{label}: generated section is out of sync (run: python3 00-os/scripts/generate-role-wiring.py)"
+        for label in check_generated(index)
+    ]
+
+
+# Registry reloads in watch mode use the libyaml parser when it is available.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+WATCH_DEBOUNCE_SECONDS = 0.02
+
+
+def scan_generated_blocks(content: str, markers: List[str]) -> Dict[str, Tuple[int, int, str]]:
+    """Map each marker to (start, end, body) of its generated block in content."""
+    blocks = {}
+    for marker in markers:
+        match = block_pattern(marker).search(content)
+        if not match:
+            raise ValueError(f"Markers not found: # GENERATED:BEGIN:{marker} ... # GENERATED:END:{marker}")
+        blocks[marker] = (match.start(), match.end(), match.group(2))
+    return blocks
+
+
+class WiringWatcher:
+    """Resident registry, rendered sections and target contents for --watch.
+
+    A registry change re-renders every generator (cheap) but only rewrites the
+    markers whose output changed; a target-file change re-checks that file's
+    blocks against the resident rendering and repairs any that were hand-edited.
+    """
+
+    def __init__(self, repo_root: Path):
+        self.repo_root = repo_root
+        self.registry_path = (repo_root / REGISTRY_PATH).resolve()
+        self.targets_by_file: Dict[Path, List[GeneratedTarget]] = {}
+        for target in TARGETS:
+            self.targets_by_file.setdefault((repo_root / target.path).resolve(), []).append(target)
+        self.registry_text: Optional[str] = None
+        self.rendered: Dict[Callable[[List[Dict]], str], str] = {}
+        self.contents: Dict[Path, str] = {}
+
+    @property
+    def watched_paths(self) -> List[Path]:
+        return [self.registry_path, *self.targets_by_file]
+
+    def reload_registry(self) -> List[Callable[[List[Dict]], str]]:
+        """Re-parse the registry; return generators whose output changed."""
+        text = self.registry_path.read_text()
+        if text == self.registry_text:
+            return []
+        roles = yaml.load(text, Loader=YAML_LOADER)['roles']
+        rendered = {}
+        for target in TARGETS:
+            if target.generator not in rendered:
+                rendered[target.generator] = target.generator(roles)
+        changed = [gen for gen, output in rendered.items() if self.rendered.get(gen) != output]
+        self.registry_text = text
+        self.rendered = rendered
+        return changed
+
+    def sync_file(self, path: Path) -> List[str]:
+        """Rewrite stale blocks in one target file; return the markers rewritten."""
+        if path not in self.contents:
+            self.contents[path] = path.read_text()
+        content = self.contents[path]
+        targets = self.targets_by_file[path]
+        blocks = scan_generated_blocks(content, [target.marker for target in targets])
+        stale = [
+            target for target in targets
+            if blocks[target.marker][2] != f"\n{self.rendered[target.generator]}\n"
+        ]
+        if not stale:
+            return []
+        # Splice from the end so earlier offsets stay valid.
+        for target in sorted(stale, key=lambda t: blocks[t.marker][0], reverse=True):
+            start, end, _ = blocks[target.marker]
+            block = (
+                f"# GENERATED:BEGIN:{target.marker}\n"
+                f"{self.rendered[target.generator]}\n"
+                f"# GENERATED:END:{target.marker}"
+            )
+            content = content[:start] + block + content[end:]
+        path.write_text(content)
+        self.contents[path] = content
+        return [target.marker for target in stale]
+
+    def handle(self, changed: set) -> List[str]:
+        """Process a batch of changed paths; return human-readable report lines."""
+        # Refresh edited targets first so registry-driven rewrites splice current content.
+        edited = set()
+        for path in self.targets_by_file:
+            if path in changed:
+                content = path.read_text()
+                if content != self.contents.get(path):  # skip our own writes
+                    self.contents[path] = content
+                    edited.add(path)
+        generators = set(self.reload_registry()) if self.registry_path in changed else set()
+
+        report = []
+        for path, targets in self.targets_by_file.items():
+            if path not in edited and not any(target.generator in generators for target in targets):
+                continue
+            markers = self.sync_file(path)
+            if markers:
+                action = "repaired hand-edited" if path in edited else "regenerated"
+                report.append(f"{action} {', '.join(markers)} in {self._rel(path)}")
+        return report
+
+    def _rel(self, path: Path) -> str:
+        try:
+            return str(path.relative_to(self.repo_root.resolve()))
+        except ValueError:
+            return str(path)
+
+
+def watch(repo_root: Path, force_polling: bool, poll_interval: float) -> int:
+    state = WiringWatcher(repo_root)
+    try:
+        state.reload_registry()
+        report = [
+            f"{', '.join(markers)} in {state._rel(path)}"
+            for path in state.targets_by_file
+            for markers in [state.sync_file(path)]
+            if markers
+        ]
+    except (OSError, ValueError, KeyError, yaml.YAMLError) as exc:
+        print(f"ERROR: {exc}")
+        return 1
+    for line in report:
+        print(f"Updated: {line}")
+
+    watcher = open_watcher(state.watched_paths, force_polling, poll_interval)
+    print(f"Watching {len(state.watched_paths)} files ({watcher.kind}); Ctrl-C to stop")
+    try:
+        while True:
+            changed = watcher.wait(None)
+            # Coalesce the burst of events a single editor save produces.
+            while True:
+                more = watcher.wait(WATCH_DEBOUNCE_SECONDS)
+                if not more:
+                    break
+                changed |= more
+            started = time.perf_counter()
+            stamp = time.strftime("%H:%M:%S")
+            try:
+                report = state.handle(changed)
+            except (OSError, ValueError, KeyError, TypeError, yaml.YAMLError) as exc:
+                print(f"[{stamp}] ERROR: {exc} (keeping last good state)")
+                continue
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            if report:
+                for line in report:
+                    print(f"[{stamp}] {line}")
+                print(f"[{stamp}] in sync ({elapsed_ms:.1f} ms)")
+    except KeyboardInterrupt:
+        return 0
+    finally:
+        watcher.close()
+
+
 def main():
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument('--check', action='store_true',
                         help='Verify generated files match committed versions')
+    parser.add_argument('--watch', action='store_true',
+                        help='Stay resident and regenerate affected sections on change')
+    parser.add_argument('--force-polling', action='store_true',
+                        help='With --watch, poll file stats instead of using inotify')
+    parser.add_argument('--poll-interval', type=float, default=0.25,
+                        help='Polling interval in seconds for --watch fallback')
+    parser.add_argument('--repo-root', type=Path, default=Path(__file__).parent.parent.parent,
+                        help='Repository root to operate on')
     args = parser.parse_args()
     
-    repo_root = Path(__file__).parent.parent.parent
+    repo_root = args.repo_root
+    if args.watch:
+        if args.check:
+            parser.error('--watch cannot be combined with --check')
+        sys.exit(watch(repo_root, args.force_polling, args.poll_interval))
     registry = load_registry(repo_root)
     roles = registry['roles']
     
     print(f"Loaded {len(roles)} roles from registry")
     
     updates = []
-    
-    # Update sync-role-repos.yml workflow
-    sync_workflow = repo_root / ".github" / "workflows" / "sync-role-repos.yml"
-    sync_matrix = generate_workflow_sync_matrix(roles)
-    sync_choices = generate_workflow_dispatch_choices(roles)
-    changed = update_file_with_generated(sync_workflow, "ROLE_MATRIX", sync_matrix, args.check)
-    updates.append(("sync matrix", changed))
-    changed = update_file_with_generated(sync_workflow, "ROLE_CHOICES", sync_choices, args.check)
-    updates.append(("sync choices", changed))
-    
-    # Update publish-role-workstation-images.yml workflow
-    publish_workflow = repo_root / ".github" / "workflows" / "publish-role-workstation-images.yml"
-    publish_matrix = generate_workflow_publish_matrix(roles)
-    changed = update_file_with_generated(publish_workflow, "ROLE_MATRIX", publish_matrix, args.check)
-    updates.append(("publish matrix", changed))
-    
-    # Update start-role-workstation.sh script
-    start_script = repo_root / ".devcontainer-workstation" / "scripts" / "start-role-workstation.sh"
-    menu = generate_shell_role_menu(roles)
-    menu_case = generate_shell_role_case_menu(roles)
-    normalize_cases = generate_shell_normalize_role_cases(roles)
-    mapping_cases = generate_shell_role_mapping_cases(roles)
-    
-    changed = update_file_with_generated(start_script, "ROLE_MENU", menu, args.check)
-    updates.append(("shell menu", changed))
-    changed = update_file_with_generated(start_script, "ROLE_MENU_CASE", menu_case, args.check)
-    updates.append(("shell menu case", changed))
-    changed = update_file_with_generated(start_script, "NORMALIZE_ROLE_CASES", normalize_cases, args.check)
-    updates.append(("shell normalize", changed))
-    changed = update_file_with_generated(start_script, "ROLE_MAPPING_CASES", mapping_cases, args.check)
-    updates.append(("shell mapping", changed))
-    
-    # Update docker-compose.yml
-    compose_file = repo_root / ".devcontainer-workstation" / "docker-compose.yml"
-    services = generate_compose_services(roles)
-    volumes = generate_compose_volumes(roles)
-    
-    changed = update_file_with_generated(compose_file, "SERVICES", services, args.check)
-    updates.append(("compose services", changed))
-    changed = update_file_with_generated(compose_file, "VOLUMES", volumes, args.check)
-    updates.append(("compose volumes", changed))
-
-    # Update docker-compose.ghcr.yml
-    compose_ghcr_file = repo_root / ".devcontainer-workstation" / "docker-compose.ghcr.yml"
-    ghcr_services = generate_compose_ghcr_services(roles)
-    changed = update_file_with_generated(compose_ghcr_file, "SERVICES", ghcr_services, args.check)
-    updates.append(("compose ghcr services", changed))
-    changed = update_file_with_generated(compose_ghcr_file, "VOLUMES", volumes, args.check)
-    updates.append(("compose ghcr volumes", changed))
+    for target in TARGETS:
+        changed = update_file_with_generated(
+            repo_root / target.path, target.marker, target.generator(roles), args.check
+        )
+        updates.append((target.label, changed))
     
     if args.check:
         failures = [name for name, changed in updates if changed]
@@ -0,0 +1,8 @@
+"""
+Synthetic-scale benchmarks for the 00-os tooling.
+
+`generators` writes synthetic repository inputs (role registry, governed-repo
+registry, file trees, job-description specs), `scenarios` times each script's
+entry point against them in a subprocess, and `history` records results and
+flags regressions. Driven by `00-os/scripts/run-perf-benchmarks.py`.
+"""
@@ -0,0 +1,203 @@
+"""
+Synthetic input generators for the benchmark scenarios.
+
+Everything is deterministic for a given size so runs stay comparable across
+commits. `build_synthetic_repo` assembles a repository root that every
+scenario can run against: real contract and generated-target files are copied
+from this checkout, and the scale-dependent inputs are synthesized.
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+ORG = "Bench-Org"
+FAMILIES = ("context-engineering-core", "context-engineering-role-repos", "product-services", "platform")
+STATES = ("autonomous", "transition", "governed")
+MARKER_REPO = f"{ORG}/bench-repo-00000"
+BENCH_ROLE_SLUG = "bench-role-00000"
+
+# Copied verbatim from this checkout into every synthetic repo.
+STATIC_FILES = (
+    "CONTRACT_BOUNDARY.md",
+    "contracts/governance-contract-lock.json",
+    "contracts/upstream/governance-implementation-contract.json",
+    "contracts/upstream/governance.md",
+    "10-templates/github-app-auth-self-heal-protocol.md",
+    ".github/workflows/sync-role-repos.yml",
+    ".github/workflows/publish-role-workstation-images.yml",
+    ".devcontainer-workstation/scripts/start-role-workstation.sh",
+    ".devcontainer-workstation/docker-compose.yml",
+    ".devcontainer-workstation/docker-compose.ghcr.yml",
+)
+
+
+@dataclass(frozen=True)
+class Scale:
+    roles: int
+    repos: int
+    files: int
+    spec_items: int
+    includes: int
+
+
+SCALES: dict[str, Scale] = {
+    "small": Scale(roles=25, repos=100, files=2_000, spec_items=50, includes=4),
+    "medium": Scale(roles=250, repos=1_000, files=20_000, spec_items=500, includes=16),
+    "large": Scale(roles=2_000, repos=5_000, files=100_000, spec_items=2_000, includes=64),
+}
+
+
+def _write(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+def synthetic_role(idx: int) -> dict[str, Any]:
+    slug = f"bench-role-{idx:05d}"
+    token = slug.replace("-", "_")
+    return {
+        "slug": slug,
+        "display_name": f"Bench Role {idx:05d}",
+        "shorthand": f"br{idx:05d}",
+        "repo_name": f"context-engineering-role-{slug}",
+        "git_identity": {
+            "name": f"a-benchrole{idx:05d}[bot]",
+            "email": f"{100000000 + idx}+a-benchrole{idx:05d}[bot]@users.noreply.github.com",
+        },
+        "github_app": {
+            "app_id_secret": f"{token.upper()}_APP_ID",
+            "app_id_value": 3000000 + idx,
+            "private_key_secret": f"{token.upper()}_APP_PRIVATE_KEY",
+            "installation_id_secret": f"{token.upper()}_APP_INSTALLATION_ID",
+            "installation_id_value": 120000000 + idx,
+            "env_prefix": token.upper(),
+        },
+        "compose": {
+            "service_name": f"{slug}-workstation",
+            "profile": None if idx == 0 else slug,
+            "image_suffix": slug,
+            "volume_prefix": token,
+        },
+        "menu_order": idx + 1,
+        "menu_label": slug,
+    }
+
+
+def write_role_registry(path: Path, roles: int) -> None:
+    document = {
+        "metadata": {
+            "version": "1.0",
+            "last_updated": "2026-01-01",
+            "canonical_source": "00-os/role-registry.yml",
+            "generator_script": "00-os/scripts/generate-role-wiring.py",
+        },
+        "roles": [synthetic_role(idx) for idx in range(roles)],
+    }
+    _write(path, yaml.safe_dump(document, sort_keys=False))
+
+
+def write_governed_repos(path: Path, repos: int) -> None:
+    document = {
+        "metadata": {
+            "version": "1.0",
+            "last_updated": "2026-01-01",
+            "canonical_source": "00-os/governed-repos.yml",
+            "governing_policy_ref": "governance.md#repository-governance-adoption-model-ownership-states",
+        },
+        "state_model": {state: {"description": f"Synthetic {state} state."} for state in STATES},
+        "repositories": [
+            {
+                "repo": f"{ORG}/bench-repo-{idx:05d}",
+                "family": FAMILIES[idx % len(FAMILIES)],
+                "state": "governed" if idx == 0 else STATES[idx % len(STATES)],
+                "owner_role": "AI Governance Manager",
+                "marker_path": ".context-engineering/governance.yml",
+                "adoption_issue": f"https://github.com/{ORG}/bench-repo-{idx:05d}/issues/1",
+                "notes": f"Synthetic governed repository {idx}.",
+            }
+            for idx in range(repos)
+        ],
+    }
+    _write(path, yaml.safe_dump(document, sort_keys=False))
+
+
+def write_governance_marker(path: Path) -> None:
+    document = {
+        "schema_version": "1.0",
+        "repository": MARKER_REPO,
+        "governance": {
+            "owner_system": "Context-Engineering-Governance",
+            "owner_repo": f"{ORG}/context-engineering-governance",
+            "state": "governed",
+            "registry_ref": "00-os/governed-repos.yml",
+            "policy_ref": "governance.md#repository-governance-adoption-model-ownership-states",
+        },
+        "controls": {"profile": "governed", "required_reviews": ["Compliance Officer"]},
+        "evidence": {"adoption_issue": f"https://github.com/{MARKER_REPO}/issues/1"},
+        "last_reviewed_utc": "2026-01-01T00:00:00Z",
+    }
+    _write(path, yaml.safe_dump(document, sort_keys=False))
+
+
+def write_file_tree(root: Path, files: int, fanout: int = 32) -> None:
+    """Write `files` small files spread over a three-level directory tree."""
+    for idx in range(files):
+        top, rest = divmod(idx, fanout * fanout)
+        mid, leaf = divmod(rest, fanout)
+        directory = root / f"pkg-{top:04d}" / f"mod-{mid:02d}"
+        directory.mkdir(parents=True, exist_ok=True)
+        (directory / f"file-{leaf:02d}.txt").write_text(f"synthetic file {idx}\n", encoding="utf-8")
+
+
+def write_job_description_inputs(repo_root: Path, role_slug: str, items: int, includes: int) -> None:
+    """Write global/role specs with `items` entries per section plus protocol includes."""
+    sections = (
+        "mission",
+        "responsibilities",
+        "non_responsibilities",
+        "authority_boundaries",
+        "required_workflow",
+        "escalation_triggers",
+        "prohibited_actions",
+        "output_quality_standards",
+    )
+    include_paths = []
+    for idx in range(includes):
+        rel = f"10-templates/bench-protocols/protocol-{idx:04d}.md"
+        body = "\n".join(f"- Protocol {idx} step {step}: follow the synthetic procedure." for step in range(200))
+        _write(repo_root / rel, f"# Protocol {idx}\n\n{body}\n")
+        include_paths.append(rel)
+
+    global_spec = {key: [f"Global {key} requirement {n}." for n in range(items // 2)] for key in sections}
+    global_spec["required_protocol_includes"] = ["10-templates/github-app-auth-self-heal-protocol.md"]
+    role_spec = {key: [f"Role {key} requirement {n}." for n in range(items)] for key in sections}
+    role_spec["required_protocol_includes"] = include_paths
+
+    spec_root = repo_root / "10-templates/job-description-spec"
+    _write(spec_root / "global.json", json.dumps(global_spec, indent=2) + "\n")
+    _write(spec_root / "roles" / f"{role_slug}.json", json.dumps(role_spec, indent=2) + "\n")
+    _write(repo_root / f"00-os/role-charters/{role_slug}.md", f"# {role_slug} charter\n")
+    _write(repo_root / "10-templates/agent-instructions/base.md", "# Base instructions\n")
+    _write(repo_root / f"10-templates/agent-instructions/roles/{role_slug}.md", f"# {role_slug} instructions\n")
+
+
+def build_synthetic_repo(source_root: Path, target: Path, scale: Scale) -> Path:
+    """Assemble a synthetic repository root for `scale` under `target`."""
+    for rel in STATIC_FILES:
+        destination = target / rel
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(source_root / rel, destination)
+
+    write_role_registry(target / "00-os/role-registry.yml", scale.roles)
+    write_governed_repos(target / "00-os/governed-repos.yml", scale.repos)
+    write_governance_marker(target / ".context-engineering/governance.yml")
+    write_file_tree(target / "bench-tree", scale.files)
+    write_job_description_inputs(target, BENCH_ROLE_SLUG, scale.spec_items, scale.includes)
+    return target
@@ -0,0 +1,106 @@
+"""
+Benchmark history file and regression comparison.
+
+History is a single JSON document: {"schema_version": 1, "runs": [...]}.
+Each run records its scale, environment, and per-scenario results; the
+baseline for a scenario is the most recent earlier run at the same scale.
+Only passing runs (every scenario exited zero and `--compare` found no
+regression) are appended, so a regression cannot become its own baseline.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+SCHEMA_VERSION = 1
+
+
+def load_history(path: Path) -> dict[str, Any]:
+    if not path.exists():
+        return {"schema_version": SCHEMA_VERSION, "runs": []}
+    document = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(document, dict) or not isinstance(document.get("runs"), list):
+        raise ValueError(f"{path}: expected an object with a 'runs' list")
+    return document
+
+
+def append_run(path: Path, run: dict[str, Any]) -> None:
+    document = load_history(path)
+    document["runs"].append(run)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps(document, indent=2) + "\n", encoding="utf-8")
+    tmp.replace(path)
+
+
+def find_baseline(history: dict[str, Any], scale_key: str, scenario: str) -> dict[str, Any] | None:
+    for run in reversed(history["runs"]):
+        if run.get("scale_key") != scale_key:
+            continue
+        result = run.get("results", {}).get(scenario)
+        if result and result.get("exit_code") == 0:
+            return {"run": run, "result": result}
+    return None
+
+
+@dataclass
+class Comparison:
+    scenario: str
+    metric: str
+    baseline: float
+    current: float
+    regressed: bool
+
+    @property
+    def change_pct(self) -> float:
+        if not self.baseline:
+            return 0.0
+        return (self.current - self.baseline) / self.baseline * 100
+
+
+def compare(
+    history: dict[str, Any],
+    scale_key: str,
+    results: dict[str, dict[str, Any]],
+    wall_threshold_pct: float,
+    rss_threshold_pct: float,
+    min_wall_delta_ms: float,
+) -> list[Comparison]:
+    """Compare `results` with the latest baseline per scenario.
+
+    A wall-time regression must exceed both the percentage threshold and an
+    absolute floor, so start-up noise on tiny scenarios does not trip it.
+    """
+    comparisons: list[Comparison] = []
+    for scenario, result in results.items():
+        found = find_baseline(history, scale_key, scenario)
+        if found is None:
+            continue
+        baseline = found["result"]
+        wall_before = float(baseline["wall_ms_median"])
+        wall_now = float(result["wall_ms_median"])
+        comparisons.append(
+            Comparison(
+                scenario,
+                "wall_ms_median",
+                wall_before,
+                wall_now,
+                wall_now > wall_before * (1 + wall_threshold_pct / 100)
+                and wall_now - wall_before > min_wall_delta_ms,
+            )
+        )
+        rss_before = float(baseline["peak_rss_kb"])
+        rss_now = float(result["peak_rss_kb"])
+        comparisons.append(
+            Comparison(
+                scenario,
+                "peak_rss_kb",
+                rss_before,
+                rss_now,
+                rss_now > rss_before * (1 + rss_threshold_pct / 100),
+            )
+        )
+    return comparisons
@@ -0,0 +1,173 @@
+"""
+Timed benchmark scenarios.
+
+Each scenario runs one script entry point in a child process against a
+synthetic repository. Wall time comes from perf_counter around the child;
+peak RSS comes from wait4() on the scenario process, reaped by a minimal
+launcher (see measure_once), so neither the driver's memory nor another
+scenario's leaks into the reading.
+"""
+
+from __future__ import annotations
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable
+
+from .generators import BENCH_ROLE_SLUG
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent
+REPO_ROOT = SCRIPTS_DIR.parent.parent
+JOB_DESCRIPTION_BUILDER = REPO_ROOT / "10-templates/repo-starters/role-repo-template/scripts/build-agent-job-description.py"
+
+
+@dataclass(frozen=True)
+class Scenario:
+    name: str
+    description: str
+    # Returns (argv, cwd) for the synthetic repo root.
+    command: Callable[[Path], tuple[list[str], Path]]
+
+
+def _script(name: str) -> str:
+    return str(SCRIPTS_DIR / name)
+
+
+SCENARIOS: dict[str, Scenario] = {
+    scenario.name: scenario
+    for scenario in (
+        Scenario(
+            "role-wiring-check",
+            "generate-role-wiring.py --check over the synthetic role registry",
+            lambda root: ([sys.executable, _script("generate-role-wiring.py"), "--check", "--repo-root", str(root)], root),
+        ),
+        Scenario(
+            "governance-ownership",
+            "validate-governance-ownership.py over the synthetic governed-repos registry",
+            lambda root: ([sys.executable, _script("validate-governance-ownership.py")], root),
+        ),
+        Scenario(
+            "boundary-implementation",
+            "validate-boundary-implementation.py over the synthetic file tree",
+            lambda root: ([sys.executable, _script("validate-boundary-implementation.py")], root),
+        ),
+        Scenario(
+            "governance-contract-consumption",
+            "validate-governance-contract-consumption.py against the copied contract",
+            lambda root: ([sys.executable, _script("validate-governance-contract-consumption.py")], root),
+        ),
+        Scenario(
+            "governance-gates",
+            "run-governance-gates.py (all gates, shared index) over the synthetic repo",
+            lambda root: ([sys.executable, _script("run-governance-gates.py"), "--repo-root", str(root)], root),
+        ),
+        Scenario(
+            "job-description",
+            "build-agent-job-description.py over the synthetic job-description spec",
+            lambda root: (
+                [
+                    sys.executable,
+                    str(JOB_DESCRIPTION_BUILDER),
+                    "--role-slug",
+                    BENCH_ROLE_SLUG,
+                    "--repo-root",
+                    str(root),
+                    "--source-ref",
+                    "benchmark",
+                    "--generated-at-utc",
+                    "2026-01-01T00:00:00Z",
+                ],
+                root,
+            ),
+        ),
+    )
+}
+
+
+def prepare_repo(root: Path) -> None:
+    """Bring generated sections in line with the synthetic registry (untimed)."""
+    subprocess.run(
+        [sys.executable, _script("generate-role-wiring.py"), "--repo-root", str(root)],
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+
+
+# Forks and execs the scenario from a fresh, minimal interpreter, reaps it with
+# wait4(), and writes the child's ru_maxrss to the fd named in argv[1]. The
+# child's signal-level maxrss starts at zero and its pre-exec image is this
+# launcher, so the reading is the scenario's own peak (floored at the
+# launcher's few MiB) rather than the benchmark driver's.
+_RSS_LAUNCHER = """
+import os, sys
+fd = int(sys.argv[1])
+pid = os.fork()
+if pid == 0:
+    os.close(fd)
+    try:
+        os.execvp(sys.argv[2], sys.argv[2:])
+    except OSError as exc:
+        sys.stderr.write(f"{sys.argv[2]}: {exc}\\n")
+    os._exit(127)
+_, status, rusage = os.wait4(pid, 0)
+os.write(fd, str(rusage.ru_maxrss).encode())
+os.close(fd)
+code = os.waitstatus_to_exitcode(status)
+sys.exit(code if code >= 0 else 128 - code)
+"""
+
+
+def _max_rss_kb(ru_maxrss: int) -> int:
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    return ru_maxrss // 1024 if sys.platform == "darwin" else ru_maxrss
+
+
+def measure_once(argv: list[str], cwd: Path) -> dict[str, Any]:
+    """Run argv once; wall time around the launcher, peak RSS of the scenario only.
+
+    wait4() on a child forked straight from this driver would not do: Linux
+    carries the forked image's RSS high-water mark across exec into ru_maxrss,
+    so every scenario would report at least the driver's own RSS.
+    """
+    read_fd, write_fd = os.pipe()
+    started = time.perf_counter()
+    try:
+        proc = subprocess.Popen(
+            [sys.executable, "-I", "-S", "-c", _RSS_LAUNCHER, str(write_fd), *argv],
+            cwd=cwd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            pass_fds=(write_fd,),
+        )
+    finally:
+        os.close(write_fd)
+    _, stderr = proc.communicate()
+    wall_ms = (time.perf_counter() - started) * 1000
+    with os.fdopen(read_fd, "rb") as rss_pipe:
+        reported = rss_pipe.read().strip()
+    return {
+        "wall_ms": round(wall_ms, 2),
+        "peak_rss_kb": _max_rss_kb(int(reported)) if reported else 0,
+        "exit_code": proc.returncode,
+        "stderr": stderr.decode("utf-8", "replace")[-2000:],
+    }
+
+
+def run_scenario(scenario: Scenario, root: Path, repeat: int) -> dict[str, Any]:
+    argv, cwd = scenario.command(root)
+    samples = [measure_once(argv, cwd) for _ in range(repeat)]
+    failed = next((sample for sample in samples if sample["exit_code"] != 0), None)
+    walls = [sample["wall_ms"] for sample in samples]
+    return {
+        "wall_ms_median": round(statistics.median(walls), 2),
+        "wall_ms_min": min(walls),
+        "peak_rss_kb": max(sample["peak_rss_kb"] for sample in samples),
+        "samples_ms": walls,
+        "exit_code": failed["exit_code"] if failed else 0,
+        "stderr_tail": failed["stderr"] if failed else "",
+    }
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Query the role registry and governed-repo registry from workflows and scripts.
+
+Lookups are served from a compiled index (see registry_query.py) that is
+rebuilt only when a registry file changes.
+
+Usage:
+    python3 00-os/scripts/query-registry.py roles --where slug=compliance-officer --select repo_name --format value
+    python3 00-os/scripts/query-registry.py roles --select role_slug=slug --select repo_name --format matrix
+    python3 00-os/scripts/query-registry.py repos --where state=governed --format tsv --select repo --select family
+    REGISTRY_INDEX_PATH="$RUNNER_TEMP/registry-index.json" python3 00-os/scripts/query-registry.py compile
+
+Indexed --where keys:
+    roles: slug, repo_name, shorthand, env_prefix
+    repos: repo, name, family, state, owner_role
+Other keys are dotted record paths (e.g. compose.profile) and are scanned.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any
+
+from registry_query import (
+    COLLECTIONS,
+    RegistryQueryError,
+    compile_index,
+    default_index_path,
+    format_key,
+    load_registry_index,
+    resolve_path,
+    write_index,
+)
+
+FORMATS = ("json", "jsonl", "tsv", "value", "matrix")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Indexed queries over role-registry.yml and governed-repos.yml.")
+    parser.add_argument("collection", choices=[*COLLECTIONS, "compile"], help="Collection to query, or 'compile'.")
+    parser.add_argument(
+        "--repo-root",
+        type=Path,
+        default=Path(__file__).resolve().parent.parent.parent,
+        help="Repository root containing 00-os/ (default: this checkout).",
+    )
+    parser.add_argument(
+        "--index-path",
+        type=Path,
+        help="Compiled index file (default: REGISTRY_INDEX_PATH or ~/.cache/context-engineering/registry-index/).",
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Parse the YAML sources and do not read/write the index.")
+    parser.add_argument(
+        "--where",
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="Filter (repeatable, all must match). Use 'null', 'true', 'false' for those values.",
+    )
+    parser.add_argument(
+        "--select",
+        action="append",
+        default=[],
+        metavar="[NAME=]PATH",
+        help="Output field (repeatable); defaults to whole records. NAME renames the output key.",
+    )
+    parser.add_argument("--format", choices=FORMATS, default="json")
+    parser.add_argument(
+        "--require",
+        action="store_true",
+        help="Exit 1 when no record matches.",
+    )
+    parser.add_argument(
+        "--github-output",
+        metavar="NAME",
+        help="Append NAME=<result> to $GITHUB_OUTPUT instead of printing.",
+    )
+    return parser.parse_args()
+
+
+def parse_where(items: list[str]) -> list[tuple[str, str]]:
+    filters = []
+    for item in items:
+        key, sep, value = item.partition("=")
+        if not sep or not key:
+            raise RegistryQueryError(f"--where expects KEY=VALUE (got '{item}')")
+        filters.append((key, value))
+    return filters
+
+
+def parse_select(items: list[str]) -> list[tuple[str, str]]:
+    fields = []
+    for item in items:
+        name, sep, path = item.partition("=")
+        fields.append((name, path) if sep else (item.split(".")[-1], item))
+    return fields
+
+
+def project(records: list[dict[str, Any]], fields: list[tuple[str, str]]) -> list[Any]:
+    if not fields:
+        return records
+    return [{name: resolve_path(record, path) for name, path in fields} for record in records]
+
+
+def render(rows: list[Any], fields: list[tuple[str, str]], fmt: str) -> str:
+    if fmt == "json":
+        return json.dumps(rows, indent=2)
+    if fmt == "jsonl":
+        return "\n".join(json.dumps(row, separators=(",", ":")) for row in rows)
+    if fmt == "matrix":
+        # Compact single line, ready for fromJSON() in a strategy.matrix.
+        return json.dumps({"include": rows}, separators=(",", ":"))
+    if fmt == "tsv":
+        if not fields:
+            raise RegistryQueryError("--format tsv requires --select")
+        return "\n".join("\t".join(format_key(row[name]) for name, _ in fields) for row in rows)
+    # value
+    if len(rows) != 1 or len(fields) != 1:
+        raise RegistryQueryError(
+            f"--format value needs exactly one match and one --select (got {len(rows)} match(es), {len(fields)} field(s))"
+        )
+    value = rows[0][fields[0][0]]
+    return value if isinstance(value, str) else json.dumps(value)
+
+
+def emit(text: str, output_name: str | None) -> None:
+    if not output_name:
+        print(text)
+        return
+    target = os.getenv("GITHUB_OUTPUT")
+    if not target:
+        raise RegistryQueryError("--github-output requires GITHUB_OUTPUT to be set")
+    with open(target, "a", encoding="utf-8") as handle:
+        if "\n" in text:
+            handle.write(f"{output_name}<<REGISTRY_QUERY_EOF\n{text}\nREGISTRY_QUERY_EOF\n")
+        else:
+            handle.write(f"{output_name}={text}\n")
+
+
+def main() -> int:
+    args = parse_args()
+    try:
+        if args.collection == "compile":
+            index_path = args.index_path or default_index_path(args.repo_root)
+            document = compile_index(args.repo_root)
+            document["repo_root"] = str(args.repo_root.resolve())
+            write_index(document, index_path)
+            print(
+                f"Compiled {len(document['records']['roles'])} roles and "
+                f"{len(document['records']['repos'])} repositories into {index_path}"
+            )
+            return 0
+
+        index = load_registry_index(args.repo_root, args.index_path, use_cache=not args.no_cache)
+        fields = parse_select(args.select)
+        records = index.select(args.collection, parse_where(args.where))
+        if args.require and not records:
+            print(f"ERROR: no {args.collection} record matches {' '.join(args.where)}", file=sys.stderr)
+            return 1
+        emit(render(project(records, fields), fields, args.format), args.github_output)
+    except RegistryQueryError as exc:
+        print(f"ERROR: {exc}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
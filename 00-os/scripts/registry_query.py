@@ -0,0 +1,216 @@
+"""
+Indexed queries over the role registry and the governed-repo registry.
+
+`load_registry_index()` returns a RegistryIndex built from
+`00-os/role-registry.yml` and `00-os/governed-repos.yml`. The compiled form
+(records plus value -> position indexes) is cached as JSON and reused while
+both sources are unchanged (same stat stamp, or same content digest after a
+fresh checkout), so repeated lookups skip PyYAML entirely.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+ROLE_REGISTRY_PATH = "00-os/role-registry.yml"
+GOVERNED_REPOS_PATH = "00-os/governed-repos.yml"
+INDEX_FORMAT_VERSION = 1
+
+# Indexed lookup keys per collection -> dotted path (or derived key function).
+ROLE_INDEXES: dict[str, str] = {
+    "slug": "slug",
+    "repo_name": "repo_name",
+    "shorthand": "shorthand",
+    "env_prefix": "github_app.env_prefix",
+}
+REPO_INDEXES: dict[str, str | Callable[[dict[str, Any]], Any]] = {
+    "repo": "repo",
+    "name": lambda record: str(record.get("repo", "")).split("/")[-1],
+    "family": "family",
+    "state": "state",
+    "owner_role": "owner_role",
+}
+COLLECTIONS = {"roles": ROLE_INDEXES, "repos": REPO_INDEXES}
+
+
+class RegistryQueryError(ValueError):
+    pass
+
+
+def default_index_path(repo_root: Path) -> Path:
+    env_path = os.getenv("REGISTRY_INDEX_PATH")
+    if env_path:
+        return Path(env_path)
+    cache_home = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    root_key = hashlib.sha256(str(repo_root.resolve()).encode("utf-8")).hexdigest()[:16]
+    return Path(cache_home) / "context-engineering" / "registry-index" / f"index-{root_key}.json"
+
+
+def resolve_path(record: Any, path: str) -> Any:
+    """Follow a dotted path through nested mappings; missing keys yield None."""
+    value = record
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def format_key(value: Any) -> str:
+    """String form used for index keys and --where comparisons."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _source_stamp(path: Path) -> dict[str, Any]:
+    stat = path.stat()
+    return {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": hashlib.sha256(path.read_bytes()).hexdigest(),
+    }
+
+
+def _build_indexes(records: list[dict[str, Any]], keys: dict[str, Any]) -> dict[str, dict[str, list[int]]]:
+    indexes: dict[str, dict[str, list[int]]] = {}
+    for name, spec in keys.items():
+        getter = spec if callable(spec) else (lambda record, path=spec: resolve_path(record, path))
+        table: dict[str, list[int]] = {}
+        for position, record in enumerate(records):
+            table.setdefault(format_key(getter(record)), []).append(position)
+        indexes[name] = table
+    return indexes
+
+
+def compile_index(repo_root: Path) -> dict[str, Any]:
+    """Parse both registries and build the compiled index document."""
+    import yaml
+
+    documents = {}
+    sources = {}
+    for rel in (ROLE_REGISTRY_PATH, GOVERNED_REPOS_PATH):
+        path = repo_root / rel
+        try:
+            documents[rel] = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+        except FileNotFoundError as exc:
+            raise RegistryQueryError(f"{rel}: file not found") from exc
+        except yaml.YAMLError as exc:
+            raise RegistryQueryError(f"{rel}: invalid YAML ({exc})") from exc
+        sources[rel] = _source_stamp(path)
+
+    roles = documents[ROLE_REGISTRY_PATH].get("roles") or []
+    repos = documents[GOVERNED_REPOS_PATH].get("repositories") or []
+    if not isinstance(roles, list) or not isinstance(repos, list):
+        raise RegistryQueryError("registry 'roles'/'repositories' must be lists")
+    # Round-trip through JSON so fresh and cached answers carry identical types
+    # (e.g. unquoted YAML dates become strings either way).
+    roles, repos = json.loads(json.dumps([roles, repos], default=str))
+    return {
+        "version": INDEX_FORMAT_VERSION,
+        "sources": sources,
+        "records": {"roles": roles, "repos": repos},
+        "indexes": {"roles": _build_indexes(roles, ROLE_INDEXES), "repos": _build_indexes(repos, REPO_INDEXES)},
+    }
+
+
+def _is_fresh(document: dict[str, Any], repo_root: Path) -> bool:
+    if document.get("version") != INDEX_FORMAT_VERSION:
+        return False
+    for rel in (ROLE_REGISTRY_PATH, GOVERNED_REPOS_PATH):
+        recorded = document.get("sources", {}).get(rel)
+        if not recorded:
+            return False
+        path = repo_root / rel
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        if recorded["size"] == stat.st_size and recorded["mtime_ns"] == stat.st_mtime_ns:
+            continue
+        # A fresh checkout changes mtimes but not content.
+        if recorded["size"] != stat.st_size or hashlib.sha256(path.read_bytes()).hexdigest() != recorded["sha256"]:
+            return False
+    return True
+
+
+def write_index(document: dict[str, Any], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(document, separators=(",", ":")), encoding="utf-8")
+    tmp.replace(path)
+
+
+class RegistryIndex:
+    def __init__(self, document: dict[str, Any], from_cache: bool = False) -> None:
+        self.document = document
+        self.from_cache = from_cache
+
+    def records(self, collection: str) -> list[dict[str, Any]]:
+        return self.document["records"][collection]
+
+    def select(self, collection: str, where: Iterable[tuple[str, str]] = ()) -> list[dict[str, Any]]:
+        """Records matching every (key, value) filter, in registry order.
+
+        Indexed keys are answered from the compiled index; other keys are
+        treated as dotted paths and scanned.
+        """
+        if collection not in COLLECTIONS:
+            raise RegistryQueryError(f"unknown collection '{collection}' (expected: {', '.join(COLLECTIONS)})")
+        records = self.records(collection)
+        indexes = self.document["indexes"][collection]
+        positions: set[int] | None = None
+        scans: list[tuple[str, str]] = []
+        for key, value in where:
+            if key in indexes:
+                matched = set(indexes[key].get(value, []))
+                positions = matched if positions is None else positions & matched
+            else:
+                scans.append((key, value))
+        candidates = range(len(records)) if positions is None else sorted(positions)
+        return [
+            records[position]
+            for position in candidates
+            if all(format_key(resolve_path(records[position], key)) == value for key, value in scans)
+        ]
+
+    def get(self, collection: str, key: str, value: str) -> dict[str, Any]:
+        matches = self.select(collection, [(key, value)])
+        if len(matches) != 1:
+            raise RegistryQueryError(f"expected exactly one {collection} record with {key}={value}, found {len(matches)}")
+        return matches[0]
+
+
+def load_registry_index(
+    repo_root: Path,
+    index_path: Path | None = None,
+    use_cache: bool = True,
+) -> RegistryIndex:
+    """Return the compiled index, rebuilding it only when a source changed."""
+    path = index_path or default_index_path(repo_root)
+    if use_cache:
+        try:
+            document = json.loads(path.read_text(encoding="utf-8"))
+            if (
+                isinstance(document, dict)
+                and document.get("repo_root") == str(repo_root.resolve())
+                and _is_fresh(document, repo_root)
+            ):
+                return RegistryIndex(document, from_cache=True)
+        except (OSError, ValueError, KeyError):
+            pass
+
+    document = compile_index(repo_root)
+    document["repo_root"] = str(repo_root.resolve())
+    if use_cache:
+        try:
+            write_index(document, path)
+        except OSError:
+            pass
+    return RegistryIndex(document)
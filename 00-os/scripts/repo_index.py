@@ -0,0 +1,89 @@
+"""
+Shared repository file index and parsed-file cache for governance gates.
+
+One RepoIndex walks the tree once and memoizes text/JSON/YAML loads, so gates
+run in the same process (see run-governance-gates.py) share a single pass of
+file I/O. Parse failures are cached too and re-raised on every access, which
+keeps each gate's error reporting unchanged.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable
+
+
+class RepoIndex:
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root).resolve()
+        self._files: list[str] | None = None
+        self._file_set: set[str] = set()
+        self._dirs: set[str] = set()
+        self._cache: dict[tuple[str, str], tuple[bool, Any]] = {}
+        self._lock = threading.Lock()
+        self._key_locks: dict[tuple[str, str], threading.Lock] = {}
+
+    def path(self, relative: str | Path) -> Path:
+        return self.root / relative
+
+    def _walk(self) -> None:
+        files: list[str] = []
+        dirs: set[str] = set()
+        for current, dirnames, filenames in os.walk(self.root):
+            rel_dir = os.path.relpath(current, self.root)
+            rel_dir = "" if rel_dir == "." else rel_dir.replace(os.sep, "/")
+            if rel_dir == "":
+                dirnames[:] = [name for name in dirnames if name != ".git"]
+            for name in dirnames:
+                dirs.add(f"{rel_dir}/{name}" if rel_dir else name)
+            for name in filenames:
+                files.append(f"{rel_dir}/{name}" if rel_dir else name)
+        files.sort()
+        self._dirs = dirs
+        self._file_set = set(files)
+        self._files = files
+
+    @property
+    def files(self) -> list[str]:
+        """Sorted POSIX paths of every file under the root, excluding .git/."""
+        with self._lock:
+            if self._files is None:
+                self._walk()
+            return self._files  # type: ignore[return-value]
+
+    def exists(self, relative: str | Path) -> bool:
+        """Answer from the walked index when available, else from the filesystem."""
+        relative = Path(relative).as_posix()
+        if self._files is None:
+            return self.path(relative).exists()
+        return relative in self._file_set or relative in self._dirs
+
+    def _memoize(self, kind: str, relative: str | Path, loader: Callable[[Path], Any]) -> Any:
+        key = (kind, Path(relative).as_posix())
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            if key not in self._cache:
+                try:
+                    self._cache[key] = (True, loader(self.path(key[1])))
+                except Exception as exc:  # noqa: BLE001 - re-raised to each caller
+                    self._cache[key] = (False, exc)
+        ok, value = self._cache[key]
+        if not ok:
+            raise value
+        return value
+
+    def read_text(self, relative: str | Path) -> str:
+        return self._memoize("text", relative, lambda path: path.read_text(encoding="utf-8"))
+
+    def load_json(self, relative: str | Path) -> Any:
+        return self._memoize("json", relative, lambda path: json.loads(self.read_text(relative)))
+
+    def load_yaml(self, relative: str | Path) -> Any:
+        import yaml
+
+        return self._memoize("yaml", relative, lambda path: yaml.safe_load(self.read_text(relative)))
+
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Run the repository governance gates in one process.
+
+Each gate script exposes `run_gate(index) -> list[str]` (empty list = pass).
+Gates share a single RepoIndex, so the tree is walked once and each governed
+file is read and parsed once, and independent gates run concurrently.
+
+Usage:
+    python3 00-os/scripts/run-governance-gates.py [--gate NAME ...] [--sequential]
+        [--json-report PATH] [--junit-report PATH]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+from importlib.machinery import SourceFileLoader
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+from repo_index import RepoIndex  # noqa: E402
+
+GATES: dict[str, str] = {
+    "boundary-implementation": "validate-boundary-implementation.py",
+    "governance-contract-consumption": "validate-governance-contract-consumption.py",
+    "governance-ownership": "validate-governance-ownership.py",
+    "role-wiring": "generate-role-wiring.py",
+}
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Run governance gates against a shared file index.")
+    parser.add_argument(
+        "--repo-root",
+        type=Path,
+        default=SCRIPTS_DIR.parent.parent,
+        help="Repository root to validate (default: this checkout).",
+    )
+    parser.add_argument(
+        "--gate",
+        action="append",
+        choices=sorted(GATES),
+        help="Gate to run; repeat to select several (default: all).",
+    )
+    parser.add_argument("--jobs", type=int, default=len(GATES), help="Maximum gates run concurrently.")
+    parser.add_argument("--sequential", action="store_true", help="Run gates one at a time.")
+    parser.add_argument("--json-report", type=Path, help="Write a JSON report to this path.")
+    parser.add_argument("--junit-report", type=Path, help="Write a JUnit XML report to this path.")
+    return parser.parse_args()
+
+
+def load_gate(name: str) -> ModuleType:
+    path = SCRIPTS_DIR / GATES[name]
+    loader = SourceFileLoader("governance_gate_" + name.replace("-", "_"), str(path))
+    module = ModuleType(loader.name)
+    module.__file__ = str(path)
+    loader.exec_module(module)
+    return module
+
+
+def run_one(name: str, module: ModuleType, index: RepoIndex) -> dict[str, Any]:
+    started = time.perf_counter()
+    try:
+        failures = list(module.run_gate(index))
+        error = None
+    except Exception as exc:  # noqa: BLE001 - reported as a gate error
+        failures = []
+        error = f"{type(exc).__name__}: {exc}"
+    return {
+        "gate": name,
+        "script": f"00-os/scripts/{GATES[name]}",
+        "passed": error is None and not failures,
+        "failures": failures,
+        "error": error,
+        "wall_ms": round((time.perf_counter() - started) * 1000, 2),
+    }
+
+
+def write_junit(path: Path, results: list[dict[str, Any]], total_ms: float) -> None:
+    suite = ET.Element(
+        "testsuite",
+        name="governance-gates",
+        tests=str(len(results)),
+        failures=str(sum(1 for result in results if result["failures"])),
+        errors=str(sum(1 for result in results if result["error"])),
+        time=f"{total_ms / 1000:.3f}",
+    )
+    for result in results:
+        case = ET.SubElement(
+            suite,
+            "testcase",
+            classname="governance-gates",
+            name=result["gate"],
+            time=f"{result['wall_ms'] / 1000:.3f}",
+        )
+        if result["error"]:
+            ET.SubElement(case, "error", message=result["error"])
+        elif result["failures"]:
+            node = ET.SubElement(case, "failure", message=f"{len(result['failures'])} violation(s)")
+            node.text = "\n".join(result["failures"])
+    path.parent.mkdir(parents=True, exist_ok=True)
+    ET.ElementTree(suite).write(path, encoding="utf-8", xml_declaration=True)
+
+
+def main() -> int:
+    args = parse_args()
+    names = args.gate or list(GATES)
+    index = RepoIndex(args.repo_root)
+
+    # Import gate modules up front; only gate execution runs in the pool.
+    modules = {name: load_gate(name) for name in names}
+    started = time.perf_counter()
+    # Walk once up front so concurrent gates never race to build the index.
+    index.files
+    jobs = 1 if args.sequential else max(1, min(args.jobs, len(names)))
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        results = list(pool.map(lambda name: run_one(name, modules[name], index), names))
+    total_ms = round((time.perf_counter() - started) * 1000, 2)
+
+    for result in results:
+        status = "PASS" if result["passed"] else "FAIL"
+        print(f"{status}: {result['gate']} ({result['wall_ms']:.0f} ms)")
+        if result["error"]:
+            print(f"  - error: {result['error']}")
+        for failure in result["failures"]:
+            print(f"  - {failure}")
+
+    failed = [result["gate"] for result in results if not result["passed"]]
+    if args.json_report:
+        args.json_report.parent.mkdir(parents=True, exist_ok=True)
+        report = {
+            "repo_root": str(index.root),
+            "indexed_files": len(index.files),
+            "jobs": jobs,
+            "wall_ms": total_ms,
+            "passed": not failed,
+            "gates": results,
+        }
+        args.json_report.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    if args.junit_report:
+        write_junit(args.junit_report, results, total_ms)
+
+    if failed:
+        print(f"ERROR: {len(failed)} of {len(results)} governance gate(s) failed: {', '.join(failed)}")
+        return 1
+    print(f"SUCCESS: {len(results)} governance gate(s) passed in {total_ms:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Run synthetic-scale benchmarks for the 00-os tooling.
+
+Builds a synthetic repository (role registry, governed-repo registry, file
+tree, job-description spec) at the requested scale, times each scenario's
+entry point in a child process, records wall time and peak RSS to a JSON
+history file, and optionally fails when a scenario regresses against the most
+recent earlier run at the same scale.
+
+Usage:
+    python3 00-os/scripts/run-perf-benchmarks.py [--scale small|medium|large]
+        [--scenario NAME ...] [--repeat N] [--history PATH] [--compare]
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from perf_benchmarks import generators, history, scenarios
+
+
+def default_history_path() -> Path:
+    env_path = os.getenv("PERF_BENCHMARK_HISTORY")
+    if env_path:
+        return Path(env_path)
+    cache_home = os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(cache_home) / "context-engineering" / "perf-benchmarks" / "history.json"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Synthetic-scale benchmarks and perf-regression gate.")
+    parser.add_argument("--scale", choices=sorted(generators.SCALES), default="small")
+    parser.add_argument("--roles", type=int, help="Override the scale's role count.")
+    parser.add_argument("--repos", type=int, help="Override the scale's governed-repo count.")
+    parser.add_argument("--files", type=int, help="Override the scale's file-tree size.")
+    parser.add_argument("--spec-items", type=int, help="Override the scale's items per job-description section.")
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=sorted(scenarios.SCENARIOS),
+        help="Scenario to run; repeat to select several (default: all).",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per scenario (median is recorded).")
+    parser.add_argument(
+        "--history",
+        type=Path,
+        default=default_history_path(),
+        help="JSON history file (default: PERF_BENCHMARK_HISTORY or ~/.cache/context-engineering/perf-benchmarks/history.json).",
+    )
+    parser.add_argument("--no-record", action="store_true", help="Do not append this run to the history file (failed runs are never appended).")
+    parser.add_argument(
+        "--compare",
+        action="store_true",
+        help="Compare against the latest earlier run at the same scale and exit 1 on regression.",
+    )
+    parser.add_argument("--threshold-pct", type=float, default=25.0, help="Allowed wall-time increase (percent).")
+    parser.add_argument("--rss-threshold-pct", type=float, default=25.0, help="Allowed peak-RSS increase (percent).")
+    parser.add_argument(
+        "--min-delta-ms",
+        type=float,
+        default=20.0,
+        help="Ignore wall-time increases smaller than this many milliseconds.",
+    )
+    parser.add_argument("--workdir", type=Path, help="Build the synthetic repo here and keep it (default: temp dir).")
+    parser.add_argument("--list", action="store_true", help="List scenarios and scales, then exit.")
+    return parser.parse_args()
+
+
+def resolve_scale(args: argparse.Namespace) -> generators.Scale:
+    overrides = {
+        field: value
+        for field, value in (
+            ("roles", args.roles),
+            ("repos", args.repos),
+            ("files", args.files),
+            ("spec_items", args.spec_items),
+        )
+        if value is not None
+    }
+    return dataclasses.replace(generators.SCALES[args.scale], **overrides)
+
+
+def scale_key(scale: generators.Scale) -> str:
+    return ",".join(f"{name}={value}" for name, value in dataclasses.asdict(scale).items())
+
+
+def git_commit() -> str:
+    result = subprocess.run(
+        ["git", "-C", str(scenarios.REPO_ROOT), "rev-parse", "--short", "HEAD"],
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    return result.stdout.strip() or "unknown"
+
+
+def print_comparisons(comparisons: list[history.Comparison]) -> None:
+    for item in comparisons:
+        status = "REGRESSION" if item.regressed else "ok"
+        print(
+            f"  {item.scenario:<34} {item.metric:<15} "
+            f"{item.baseline:>12.1f} -> {item.current:>12.1f} ({item.change_pct:+6.1f}%) {status}"
+        )
+
+
+def main() -> int:
+    args = parse_args()
+
+    if args.list:
+        for name, scenario in scenarios.SCENARIOS.items():
+            print(f"{name:<34} {scenario.description}")
+        for name, scale in generators.SCALES.items():
+            print(f"scale {name:<8} {scale_key(scale)}")
+        return 0
+
+    if args.repeat < 1:
+        print("ERROR: --repeat must be at least 1", file=sys.stderr)
+        return 2
+
+    scale = resolve_scale(args)
+    key = scale_key(scale)
+    names = args.scenario or list(scenarios.SCENARIOS)
+
+    try:
+        past = history.load_history(args.history)
+    except (OSError, ValueError) as exc:
+        print(f"ERROR: cannot read history: {exc}", file=sys.stderr)
+        return 2
+
+    workdir = args.workdir or Path(tempfile.mkdtemp(prefix="perf-benchmarks-"))
+    try:
+        started = time.perf_counter()
+        if args.workdir and workdir.exists():
+            shutil.rmtree(workdir)
+        generators.build_synthetic_repo(scenarios.REPO_ROOT, workdir, scale)
+        scenarios.prepare_repo(workdir)
+        print(f"Synthetic repo ({key}) built in {time.perf_counter() - started:.1f}s at {workdir}")
+
+        results: dict[str, dict[str, Any]] = {}
+        for name in names:
+            result = scenarios.run_scenario(scenarios.SCENARIOS[name], workdir, args.repeat)
+            results[name] = result
+            status = "ok" if result["exit_code"] == 0 else f"exit {result['exit_code']}"
+            print(
+                f"{name:<34} median {result['wall_ms_median']:>9.1f} ms  "
+                f"min {result['wall_ms_min']:>9.1f} ms  peak RSS {result['peak_rss_kb'] / 1024:>8.1f} MiB  {status}"
+            )
+            if result["exit_code"] != 0 and result["stderr_tail"]:
+                print(f"  stderr: {result['stderr_tail'].strip()}")
+    finally:
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    exit_code = 0
+    failed = [name for name, result in results.items() if result["exit_code"] != 0]
+    if failed:
+        print(f"ERROR: {len(failed)} scenario(s) exited non-zero: {', '.join(failed)}")
+        exit_code = 1
+
+    if args.compare:
+        comparisons = history.compare(
+            past, key, results, args.threshold_pct, args.rss_threshold_pct, args.min_delta_ms
+        )
+        if not comparisons:
+            print("No baseline at this scale in history; nothing to compare.")
+        else:
+            print("Comparison against latest baseline:")
+            print_comparisons(comparisons)
+            regressed = sorted({item.scenario for item in comparisons if item.regressed})
+            if regressed:
+                print(f"ERROR: {len(regressed)} scenario(s) regressed: {', '.join(regressed)}")
+                exit_code = 1
+
+    if exit_code != 0 and not args.no_record:
+        # Recording a failing run would make it the next baseline, so a single
+        # regression would be accepted by every later --compare.
+        print(f"Not recording failed run; {args.history} keeps the last passing baseline.")
+    elif not args.no_record:
+        history.append_run(
+            args.history,
+            {
+                "recorded_at_utc": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+                "git_commit": git_commit(),
+                "scale": args.scale,
+                "scale_key": key,
+                "repeat": args.repeat,
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "results": results,
+            },
+        )
+        print(f"Recorded run in {args.history}")
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,6 +4,8 @@ import fnmatch
 import sys
 from pathlib import Path
 
+from repo_index import RepoIndex
+
 RULES = [
     (
         "BND-IMP-001",
@@ -44,34 +46,26 @@ RULES = [
 ]
 
 
-def list_repo_files() -> list[str]:
-    files: list[str] = []
-    for path in Path(".").rglob("*"):
-        if not path.is_file():
-            continue
-        relative = path.as_posix()
-        if relative.startswith("./"):
-            relative = relative[2:]
-        if relative.startswith(".git/"):
-            continue
-        files.append(relative)
-    return sorted(files)
-
-
-def main() -> int:
-    files = list_repo_files()
+def run_gate(index: RepoIndex) -> list[str]:
+    """Return boundary violations for the indexed tree (empty when clean)."""
     violations: list[str] = []
 
-    for file_path in files:
+    for file_path in index.files:
         for rule_id, pattern, message, remediation in RULES:
             if fnmatch.fnmatch(file_path, pattern):
                 violations.append(
                     f"{rule_id} error {file_path} {message} | remediation: {remediation}"
                 )
 
+    return sorted(violations)
+
+
+def main() -> int:
+    violations = run_gate(RepoIndex(Path(".")))
+
     if violations:
         print("Implementation boundary validation failed:", file=sys.stderr)
-        for violation in sorted(violations):
+        for violation in violations:
             print(f"- {violation}", file=sys.stderr)
         return 1
 
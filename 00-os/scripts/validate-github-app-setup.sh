@@ -62,6 +62,19 @@ echo "=== GitHub App Setup Validation for ${ROLE_SLUG} ==="
 echo "Organization: ${ORG}"
 echo ""
 
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+
+# Prefer the registry's declared secret names and repo name; fall back to the
+# naming convention for roles not yet in the registry (or without PyYAML).
+registry_row="$(
+  python3 "${SCRIPT_DIR}/query-registry.py" roles \
+    --where "slug=${ROLE_SLUG}" \
+    --select github_app.app_id_secret \
+    --select github_app.private_key_secret \
+    --select repo_name \
+    --format tsv 2>/dev/null || true
+)"
+
 # Determine expected secret names based on role slug naming convention.
 # Convention:
 #   <role-slug> -> <ROLE_SLUG_UPPER_SNAKE>_APP_ID / _APP_PRIVATE_KEY
@@ -78,11 +91,18 @@ fi
 
 APP_ID_SECRET="${role_secret_prefix}_APP_ID"
 PRIVATE_KEY_SECRET="${role_secret_prefix}_APP_PRIVATE_KEY"
+registry_repo=""
+if [ -n "$registry_row" ]; then
+  IFS=$'\t' read -r APP_ID_SECRET PRIVATE_KEY_SECRET registry_repo <<<"$registry_row"
+  echo "Registry entry found for ${ROLE_SLUG} (secrets: ${APP_ID_SECRET}, ${PRIVATE_KEY_SECRET})"
+else
+  echo "⚠️  ${ROLE_SLUG} not resolved from 00-os/role-registry.yml; using naming convention"
+fi
 
 validation_errors=0
 validation_warnings=0
 context_repo="Context-Engineering"
-role_repo="context-engineering-role-${ROLE_SLUG}"
+role_repo="${registry_repo:-context-engineering-role-${ROLE_SLUG}}"
 role_slug_compact="$(
   printf '%s' "$ROLE_SLUG" \
     | tr '[:upper:]' '[:lower:]' \
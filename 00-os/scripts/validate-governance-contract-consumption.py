@@ -1,10 +1,19 @@
 #!/usr/bin/env python3
 
+import argparse
 import json
 import re
 import sys
 from pathlib import Path
 
+from contract_digests import (
+    LOCK_DIGESTS_KEY,
+    DigestCache,
+    compute_upstream_digests,
+    verify_upstream_digests,
+)
+from repo_index import RepoIndex
+
 UPSTREAM_CONTRACT_PATH = Path("contracts/upstream/governance-implementation-contract.json")
 UPSTREAM_GOVERNANCE_INPUT_PATH = Path("contracts/upstream/governance.md")
 LOCK_PATH = Path("contracts/governance-contract-lock.json")
@@ -23,11 +32,11 @@ def fail(message: str) -> int:
     return 1
 
 
-def load_json(path: Path, label: str):
-    if not path.exists():
+def load_json(index: RepoIndex, path: Path, label: str):
+    if not index.exists(path):
         raise RuntimeError(f"missing {label}: {path}")
     try:
-        return json.loads(path.read_text(encoding="utf-8"))
+        return index.load_json(path)
     except json.JSONDecodeError as exc:
         raise RuntimeError(f"invalid JSON in {label} ({path}): {exc}") from exc
 
@@ -39,74 +48,122 @@ def parse_semver(version: str, label: str):
     return tuple(int(part) for part in match.groups())
 
 
-def main() -> int:
+def check(index: RepoIndex, cache: DigestCache | None = None) -> str | None:
+    """Return the first contract consumption failure, or None when compatible."""
     try:
-        upstream = load_json(UPSTREAM_CONTRACT_PATH, "upstream contract")
-        lock = load_json(LOCK_PATH, "lock file")
+        upstream = load_json(index, UPSTREAM_CONTRACT_PATH, "upstream contract")
+        lock = load_json(index, LOCK_PATH, "lock file")
     except RuntimeError as exc:
-        return fail(str(exc))
+        return str(exc)
 
-    if not UPSTREAM_GOVERNANCE_INPUT_PATH.exists():
-        return fail(
+    if not index.exists(UPSTREAM_GOVERNANCE_INPUT_PATH):
+        return (
             f"missing governance input mirror: {UPSTREAM_GOVERNANCE_INPUT_PATH} "
             "(sync from context-engineering-governance before role sync runs)"
         )
 
     for key in ("contract_id", "version", "compatibility", "governance_authoritative_paths"):
         if key not in upstream:
-            return fail(f"upstream contract missing key '{key}'")
+            return f"upstream contract missing key '{key}'"
 
     for key in ("contract_version", "supported_major", "source_commit"):
         if key not in lock:
-            return fail(f"lock file missing key '{key}'")
+            return f"lock file missing key '{key}'"
 
     upstream_version = upstream.get("version")
     lock_version = lock.get("contract_version")
 
     if not isinstance(upstream_version, str):
-        return fail("upstream contract 'version' must be a string")
+        return "upstream contract 'version' must be a string"
     if not isinstance(lock_version, str):
-        return fail("lock 'contract_version' must be a string")
+        return "lock 'contract_version' must be a string"
 
     try:
         upstream_semver = parse_semver(upstream_version, "upstream version")
         lock_semver = parse_semver(lock_version, "lock contract_version")
     except RuntimeError as exc:
-        return fail(str(exc))
+        return str(exc)
 
     if upstream_version != lock_version:
-        return fail(
+        return (
             f"lock contract_version '{lock_version}' does not match upstream version '{upstream_version}'"
         )
 
     supported_major = lock.get("supported_major")
     if not isinstance(supported_major, int) or supported_major < 0:
-        return fail("lock 'supported_major' must be a non-negative integer")
+        return "lock 'supported_major' must be a non-negative integer"
 
     if upstream_semver[0] != supported_major:
-        return fail(
+        return (
             f"upstream major version {upstream_semver[0]} is incompatible with supported_major {supported_major}"
         )
 
     compatibility = upstream.get("compatibility", {})
     if not isinstance(compatibility, dict):
-        return fail("upstream 'compatibility' must be an object")
+        return "upstream 'compatibility' must be an object"
 
     declared_major = compatibility.get("supported_major_for_current_impl")
     if declared_major != supported_major:
-        return fail(
+        return (
             "lock supported_major does not match upstream compatibility.supported_major_for_current_impl"
         )
 
-    if not CONTRACT_BOUNDARY_PATH.exists():
-        return fail("missing CONTRACT_BOUNDARY.md")
+    if not index.exists(CONTRACT_BOUNDARY_PATH):
+        return "missing CONTRACT_BOUNDARY.md"
 
     for blocked in BOUNDARY_BLOCKED_PATHS:
-        if blocked.exists():
-            return fail(
+        if index.exists(blocked):
+            return (
                 f"boundary violation: '{blocked.as_posix()}' must not exist in implementation repository"
             )
 
+    problems = verify_upstream_digests(index.root, lock, cache or DigestCache(enabled=False))
+    if problems:
+        return "; ".join(problems)
+
+    return None
+
+
+def write_digests(index: RepoIndex, cache: DigestCache) -> None:
+    """Record current upstream mirror digests in the lock file."""
+    lock_path = index.path(LOCK_PATH)
+    lock = json.loads(lock_path.read_text(encoding="utf-8"))
+    lock[LOCK_DIGESTS_KEY] = compute_upstream_digests(index.root, cache)
+    lock_path.write_text(json.dumps(lock, indent=2) + "\n", encoding="utf-8")
+    print(f"Recorded {len(lock[LOCK_DIGESTS_KEY])} upstream digest(s) in {LOCK_PATH}.")
+
+
+def run_gate(index: RepoIndex) -> list[str]:
+    cache = DigestCache()
+    failure = check(index, cache)
+    cache.save()
+    return [failure] if failure else []
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Validate governance contract consumption and upstream mirror integrity.")
+    parser.add_argument(
+        "--write-digests",
+        action="store_true",
+        help="Record digests of contracts/upstream/ in the lock file (after syncing the mirror at source_commit).",
+    )
+    parser.add_argument("--no-digest-cache", action="store_true", help="Hash every mirror file, ignoring the stat cache.")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    index = RepoIndex(Path("."))
+    cache = DigestCache(enabled=not args.no_digest_cache)
+    if args.write_digests:
+        write_digests(index, cache)
+        index = RepoIndex(Path("."))
+
+    failure = check(index, cache)
+    cache.save()
+    if failure:
+        return fail(failure)
+
     print("Governance contract consumption validation passed.")
     return 0
 
@@ -20,12 +20,20 @@ from typing import Any
 
 import yaml
 
+from repo_index import RepoIndex
+
 ALLOWED_STATES = {"autonomous", "transition", "governed"}
 REPO_PATTERN = re.compile(r"^[A-Za-z0-9_.-]+/[A-Za-z0-9_.-]+$")
 
 
-def load_yaml(path: pathlib.Path) -> Any:
+DEFAULT_REGISTRY_PATH = "00-os/governed-repos.yml"
+DEFAULT_MARKER_PATH = ".context-engineering/governance.yml"
+
+
+def load_yaml(path: pathlib.Path, index: RepoIndex | None = None) -> Any:
     try:
+        if index is not None:
+            return index.load_yaml(path)
         with path.open("r", encoding="utf-8") as handle:
             return yaml.safe_load(handle)
     except FileNotFoundError:
@@ -217,33 +225,32 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--registry",
-        default="00-os/governed-repos.yml",
+        default=DEFAULT_REGISTRY_PATH,
         help="Path to governed repository registry YAML file.",
     )
     parser.add_argument(
         "--marker",
-        default=".context-engineering/governance.yml",
+        default=DEFAULT_MARKER_PATH,
         help="Path to local repository governance marker YAML file.",
     )
     return parser.parse_args()
 
 
-def main() -> int:
-    args = parse_args()
-
-    registry_path = pathlib.Path(args.registry)
-    marker_path = pathlib.Path(args.marker)
-
+def collect_errors(
+    registry_path: pathlib.Path,
+    marker_path: pathlib.Path,
+    index: RepoIndex | None = None,
+) -> list[str]:
     errors: list[str] = []
 
     try:
-        registry_data = load_yaml(registry_path)
+        registry_data = load_yaml(registry_path, index)
     except ValueError as exc:
         errors.append(str(exc))
         registry_data = None
 
     try:
-        marker_data = load_yaml(marker_path)
+        marker_data = load_yaml(marker_path, index)
     except ValueError as exc:
         errors.append(str(exc))
         marker_data = None
@@ -261,6 +268,21 @@ def main() -> int:
             errors,
         )
 
+    return errors
+
+
+def run_gate(index: RepoIndex) -> list[str]:
+    return collect_errors(pathlib.Path(DEFAULT_REGISTRY_PATH), pathlib.Path(DEFAULT_MARKER_PATH), index)
+
+
+def main() -> int:
+    args = parse_args()
+
+    registry_path = pathlib.Path(args.registry)
+    marker_path = pathlib.Path(args.marker)
+
+    errors = collect_errors(registry_path, marker_path)
+
     if errors:
         print("Governance ownership validation failed:")
         for entry in errors:
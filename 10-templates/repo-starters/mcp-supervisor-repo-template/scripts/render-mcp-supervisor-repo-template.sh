@@ -115,6 +115,7 @@ render_template "${TEMPLATE_ROOT}/templates/.env.example.tmpl" "${OUTPUT_DIR}/.e
 render_template "${TEMPLATE_ROOT}/templates/requirements.txt.tmpl" "${OUTPUT_DIR}/requirements.txt"
 render_template "${TEMPLATE_ROOT}/templates/.gitignore.tmpl" "${OUTPUT_DIR}/.gitignore"
 render_template "${TEMPLATE_ROOT}/templates/src/supervisor_mcp_server.py.tmpl" "${OUTPUT_DIR}/src/supervisor_mcp_server.py"
+render_template "${TEMPLATE_ROOT}/templates/src/supervisor_audit_sink.py.tmpl" "${OUTPUT_DIR}/src/supervisor_audit_sink.py"
 
 cp "${CONTRACT_ROOT}/ask-codex-supervisor.request.schema.json" "${OUTPUT_DIR}/contracts/"
 cp "${CONTRACT_ROOT}/ask-codex-supervisor.response.schema.json" "${OUTPUT_DIR}/contracts/"
@@ -0,0 +1,262 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+usage() {
+  cat <<'USAGE'
+Usage:
+  benchmark-role-repo-checkout.sh \
+    [--commits <count>] \
+    [--bulk-files <count>] \
+    [--runs <count>] \
+    [--role-slug <role-slug>] \
+    [--work-dir <work-dir>] \
+    [--keep]
+
+Benchmarks the role-repo sync checkout strategies against a synthetic local
+bare repository (served over file:// so shallow and partial clone filters
+apply exactly as they do against GitHub).
+
+Scenarios:
+  full          Legacy full-history single-branch clone + full checkout
+  partial       Shallow, blobless clone + managed-file diff + sparse checkout
+  mirror-cold   First run with --mirror-dir (mirror created from scratch)
+  mirror-warm   Later run with --mirror-dir after one upstream commit
+
+Optional:
+  --commits     Synthetic history depth (default: 400)
+  --bulk-files  Non-managed files rewritten across history (default: 200)
+  --runs        Timed runs per scenario; the median is reported (default: 3)
+  --role-slug   Role whose managed files are synced (default: compliance-officer,
+                the role with the most managed files)
+  --work-dir    Benchmark workspace root (default: mktemp)
+  --keep        Keep the benchmark workspace after completion
+USAGE
+}
+
+SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
+MANAGED_FILES_MANIFEST="${SCRIPT_DIR}/role-repo-managed-files.txt"
+
+# shellcheck source=role-repo-git.sh
+source "${SCRIPT_DIR}/role-repo-git.sh"
+
+COMMITS="400"
+BULK_FILES="200"
+RUNS="3"
+ROLE_SLUG="compliance-officer"
+WORK_DIR=""
+KEEP="false"
+
+while [ "$#" -gt 0 ]; do
+  case "$1" in
+    --commits)
+      COMMITS="$2"
+      shift 2
+      ;;
+    --bulk-files)
+      BULK_FILES="$2"
+      shift 2
+      ;;
+    --runs)
+      RUNS="$2"
+      shift 2
+      ;;
+    --role-slug)
+      ROLE_SLUG="$2"
+      shift 2
+      ;;
+    --work-dir)
+      WORK_DIR="$2"
+      shift 2
+      ;;
+    --keep)
+      KEEP="true"
+      shift
+      ;;
+    -h|--help)
+      usage
+      exit 0
+      ;;
+    *)
+      echo "Unknown argument: $1" >&2
+      usage
+      exit 1
+      ;;
+  esac
+done
+
+for cmd in git python3; do
+  if ! command -v "$cmd" >/dev/null 2>&1; then
+    echo "Missing required command: $cmd" >&2
+    exit 1
+  fi
+done
+
+if [ -z "$WORK_DIR" ]; then
+  WORK_DIR="$(mktemp -d "/tmp/role-repo-checkout-bench-XXXXXX")"
+fi
+mkdir -p "$WORK_DIR"
+WORK_DIR="$(cd "$WORK_DIR" && pwd)"
+
+if [ "$KEEP" != "true" ]; then
+  trap 'rm -rf "$WORK_DIR"' EXIT
+fi
+
+export GIT_AUTHOR_NAME="role-repo-bench"
+export GIT_AUTHOR_EMAIL="role-repo-bench@example.invalid"
+export GIT_COMMITTER_NAME="$GIT_AUTHOR_NAME"
+export GIT_COMMITTER_EMAIL="$GIT_AUTHOR_EMAIL"
+
+mapfile -t managed_files < <(role_repo_managed_files "$MANAGED_FILES_MANIFEST" "$ROLE_SLUG")
+
+REMOTE_DIR="${WORK_DIR}/remote.git"
+REMOTE_URL="file://${REMOTE_DIR}"
+RENDER_DIR="${WORK_DIR}/rendered"
+
+echo "Building synthetic role repo: ${COMMITS} commits, ${BULK_FILES} bulk files..."
+
+git init --quiet --bare --initial-branch=main "$REMOTE_DIR"
+git -C "$REMOTE_DIR" config uploadpack.allowFilter true
+git -C "$REMOTE_DIR" config uploadpack.allowAnySHA1InWant true
+
+python3 - "$COMMITS" "$BULK_FILES" "${managed_files[@]}" <<'PY' | git -C "$REMOTE_DIR" fast-import --quiet
+import random
+import sys
+
+commits = int(sys.argv[1])
+bulk_files = int(sys.argv[2])
+managed = sys.argv[3:]
+rng = random.Random(20260226)
+out = sys.stdout.buffer
+
+
+def blob(text: str) -> None:
+    data = text.encode("utf-8")
+    out.write(b"data %d\n" % len(data))
+    out.write(data)
+    out.write(b"\n")
+
+
+def noise(lines: int) -> str:
+    return "".join(f"{rng.getrandbits(128):032x}\n" for _ in range(lines))
+
+
+for idx in range(commits):
+    out.write(b"commit refs/heads/main\n")
+    out.write(b"committer role-repo-bench <role-repo-bench@example.invalid> %d +0000\n" % (1700000000 + idx))
+    blob(f"history commit {idx}\n")
+    touched = range(bulk_files) if idx == 0 else rng.sample(range(bulk_files), max(1, bulk_files // 10))
+    for file_idx in touched:
+        out.write(f"M 100644 inline docs/history/{file_idx:05d}.md\n".encode("utf-8"))
+        blob(noise(64))
+    if idx == 0 or idx == commits - 1:
+        for path in managed:
+            mode = "100755" if path.endswith((".sh", ".py")) else "100644"
+            out.write(f"M {mode} inline {path}\n".encode("utf-8"))
+            blob(f"managed {path} revision {idx}\n")
+out.write(b"done\n")
+PY
+
+mkdir -p "$RENDER_DIR"
+for file in "${managed_files[@]}"; do
+  mkdir -p "$(dirname "${RENDER_DIR}/${file}")"
+  printf 'managed %s revision rendered\n' "$file" > "${RENDER_DIR}/${file}"
+done
+
+now_ms() {
+  python3 -c 'import time; print(int(time.monotonic() * 1000))'
+}
+
+dir_kib() {
+  du -sk "$1" | awk '{print $1}'
+}
+
+median() {
+  printf '%s\n' "$@" | sort -n | awk '{ values[NR] = $1 } END { print values[int((NR + 1) / 2)] }'
+}
+
+scenario_full() {
+  local target="$1"
+  git clone --quiet "$REMOTE_URL" "$target" --branch main --single-branch
+  git -C "$target" diff --quiet -- "${managed_files[@]}" || true
+}
+
+scenario_partial() {
+  local target="$1"
+  clone_role_repo_partial "$REMOTE_URL" main "$target" 2>/dev/null
+  if managed_files_changed "$target" HEAD "$RENDER_DIR" "${managed_files[@]}"; then
+    checkout_managed_files "$target" "${managed_files[@]}"
+  fi
+}
+
+scenario_mirror() {
+  local target="$1"
+  local mirror="$2"
+  refresh_role_repo_mirror "$mirror" "$REMOTE_URL" main 2>/dev/null
+  if managed_files_changed "$mirror" main "$RENDER_DIR" "${managed_files[@]}"; then
+    add_role_repo_worktree "$mirror" main "$target" 2>/dev/null
+    checkout_managed_files "$target" "${managed_files[@]}"
+    git -C "$mirror" worktree remove --force "$target"
+  fi
+}
+
+push_upstream_commit() {
+  local scratch="${WORK_DIR}/scratch"
+  rm -rf "$scratch"
+  git clone --quiet --depth 1 --branch main "$REMOTE_URL" "$scratch"
+  printf 'upstream change %s\n' "$1" >> "${scratch}/docs/history/00000.md"
+  git -C "$scratch" commit --quiet -am "Upstream change $1"
+  git -C "$scratch" push --quiet origin HEAD:main
+  rm -rf "$scratch"
+}
+
+declare -A SCENARIO_MS=()
+declare -A SCENARIO_KIB=()
+
+run_scenario() {
+  local name="$1"
+  local -a timings=()
+  local run start end target mirror kib
+
+  for run in $(seq 1 "$RUNS"); do
+    target="${WORK_DIR}/targets/${name}-${run}"
+    mirror="${WORK_DIR}/mirrors/${name}-${run}.git"
+    rm -rf "$target"
+
+    case "$name" in
+      mirror-warm)
+        scenario_mirror "${target}-prime" "$mirror"
+        push_upstream_commit "${name}-${run}"
+        ;;
+    esac
+
+    start="$(now_ms)"
+    case "$name" in
+      full) scenario_full "$target" ;;
+      partial) scenario_partial "$target" ;;
+      mirror-cold|mirror-warm) scenario_mirror "$target" "$mirror" ;;
+    esac
+    end="$(now_ms)"
+    timings+=("$((end - start))")
+
+    case "$name" in
+      full|partial) kib="$(dir_kib "${target}/.git")" ;;
+      *) kib="$(dir_kib "$mirror")" ;;
+    esac
+  done
+
+  SCENARIO_MS["$name"]="$(median "${timings[@]}")"
+  SCENARIO_KIB["$name"]="$kib"
+}
+
+for scenario in full partial mirror-cold mirror-warm; do
+  echo "Running scenario: ${scenario} (${RUNS} runs)"
+  run_scenario "$scenario"
+done
+
+echo
+printf '%-12s %12s %14s\n' "scenario" "median_ms" "git_dir_kib"
+for scenario in full partial mirror-cold mirror-warm; do
+  printf '%-12s %12s %14s\n' "$scenario" "${SCENARIO_MS[$scenario]}" "${SCENARIO_KIB[$scenario]}"
+done
+echo
+echo "git_dir_kib approximates transferred objects (clone .git or mirror size after the run)."
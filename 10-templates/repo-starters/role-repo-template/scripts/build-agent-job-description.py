@@ -101,6 +101,44 @@ def merge_specs(global_spec: Dict[str, List[str]], role_spec: Dict[str, List[str
     return merged
 
 
+def load_contract_digests(script_dir: Path):
+    """Import the shared digest module from this implementation checkout, if present."""
+    scripts_dir = script_dir.parents[3] / "00-os" / "scripts"
+    if not (scripts_dir / "contract_digests.py").is_file():
+        return None
+    if str(scripts_dir) not in sys.path:
+        sys.path.insert(0, str(scripts_dir))
+    import contract_digests  # pylint: disable=import-outside-toplevel
+
+    return contract_digests
+
+
+def verify_governance_digest(
+    digests_module, repo_root: Path, governance_file: Path, contract_lock: Dict[str, object]
+) -> str:
+    """Check the governance mirror against the lock's recorded digest; return the digest.
+
+    A lock without a recorded digest for the mirror is an error, so dropping
+    the entry cannot silently disable the check.
+    """
+    cache = digests_module.DigestCache()
+    actual = cache.digest(governance_file)
+    cache.save()
+    recorded = contract_lock.get(digests_module.LOCK_DIGESTS_KEY)
+    rel = governance_file.relative_to(repo_root).as_posix()
+    if not isinstance(recorded, dict) or rel not in recorded:
+        raise ValueError(
+            f"Contract lock has no {digests_module.LOCK_DIGESTS_KEY} entry for {rel}; "
+            "re-sync the governance contract to record it"
+        )
+    if recorded[rel] != actual:
+        raise ValueError(
+            f"Governance mirror {rel} does not match contract lock digest "
+            f"(lock {recorded[rel]}, found {actual})"
+        )
+    return actual
+
+
 def require_file(path: Path) -> None:
     if not path.is_file():
         raise FileNotFoundError(f"Required source file missing: {path}")
@@ -166,6 +204,16 @@ def main() -> int:
         require_file(base_instructions_file)
         require_file(role_instructions_file)
         contract_lock = load_contract_lock(contract_lock_file)
+        digests_module = load_contract_digests(script_dir)
+        if digests_module is not None:
+            governance_digest = verify_governance_digest(digests_module, repo_root, governance_file, contract_lock)
+        else:
+            print(
+                "Warning: 00-os/scripts/contract_digests.py not found; "
+                f"governance mirror digest not verified against {contract_lock_file.name}.",
+                file=sys.stderr,
+            )
+            governance_digest = ""
         global_spec = load_json(global_spec_path)
         role_spec = load_json(role_spec_path)
         merged = merge_specs(global_spec, role_spec)
@@ -206,6 +254,8 @@ def main() -> int:
     lines.append(f"  - `10-templates/agent-instructions/roles/{role_slug}.md`")
     lines.append("  - `contracts/upstream/governance.md`")
     lines.append("  - `contracts/governance-contract-lock.json`")
+    if governance_digest:
+        lines.append(f"- Governance input digest (`contracts/upstream/governance.md`): `{governance_digest}`")
     lines.append(f"- Builder: `10-templates/repo-starters/role-repo-template/scripts/{Path(__file__).name}`")
     lines.append("")
 
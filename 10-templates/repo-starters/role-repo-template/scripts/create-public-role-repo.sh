@@ -135,6 +135,7 @@ run_publishability_preflight() {
     ".github/workflows/governance-pr-gates.yml"
     ".vscode/settings.json"
     "scripts/validate-pr-metadata.py"
+    "scripts/github_client.py"
   )
   local -a scan_paths=()
   local -a missing=()
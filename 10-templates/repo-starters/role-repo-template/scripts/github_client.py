@@ -0,0 +1,662 @@
+#!/usr/bin/env python3
+"""Shared GitHub API client for role-repo sync and PR metadata tooling.
+
+Rendered verbatim into role repositories as `scripts/github_client.py`, so it
+must stay standard-library only.
+
+- Pooled keep-alive HTTPS connections, one idle pool per host.
+- Rate-limit aware retries (`x-ratelimit-*`, `retry-after`, secondary limits)
+  with exponential backoff for transient server errors. Connection failures
+  and 5xx responses are only retried for idempotent requests (REST reads and
+  GraphQL queries), so a mutation is never sent twice.
+- ETag-conditional on-disk cache for REST GETs; 304 responses do not count
+  against the primary rate limit.
+- Aliased GraphQL batching so lookups across several repositories and pull
+  requests cost a single request when one token can read them all (role sync
+  jobs hold a per-repo token, so `pr-upsert` looks up one repository).
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import http.client
+import json
+import os
+import socket
+import stat
+import subprocess
+import sys
+import threading
+import time
+import urllib.parse
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+DEFAULT_API_URL = "https://api.github.com"
+DEFAULT_TIMEOUT_SECONDS = 20.0
+DEFAULT_MAX_RETRIES = 4
+BROKER_TIMEOUT_SECONDS = 15.0
+MAX_RATE_LIMIT_WAIT_SECONDS = 900.0
+GRAPHQL_BATCH_SIZE = 50
+USER_AGENT = "context-engineering-github-client"
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+PULL_REQUEST_FIELDS = "id number url state isDraft mergeStateStatus"
+
+
+class GitHubAPIError(RuntimeError):
+    def __init__(self, message: str, status: Optional[int] = None) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def broker_socket_dir_is_private(socket_path: str) -> bool:
+    """True when the socket directory is a real directory owned by us with no group/other access."""
+    try:
+        info = os.lstat(os.path.dirname(os.path.abspath(socket_path)))
+    except OSError:
+        return False
+    return stat.S_ISDIR(info.st_mode) and info.st_uid == os.getuid() and not info.st_mode & 0o077
+
+
+def broker_token() -> str:
+    """Installation token from a role workstation token broker, if one is running."""
+    socket_path = os.getenv("ROLE_GITHUB_TOKEN_BROKER_SOCKET", "").strip()
+    if not socket_path and hasattr(os, "getuid"):
+        socket_path = f"/tmp/role-github-token-broker-{os.getuid()}/broker.sock"
+    if not socket_path or not os.path.exists(socket_path):
+        return ""
+    # Anyone can pre-create a path under /tmp; only trust a directory that is
+    # private to this user, as the broker itself requires.
+    if not broker_socket_dir_is_private(socket_path):
+        print(f"Warning: ignoring token broker socket in an untrusted directory: {socket_path}", file=sys.stderr)
+        return ""
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.settimeout(BROKER_TIMEOUT_SECONDS)
+            conn.connect(socket_path)
+            conn.sendall(b'{"op": "token"}\n')
+            with conn.makefile("rb") as reader:
+                response = json.loads(reader.readline() or b"{}")
+    except (OSError, ValueError):
+        return ""
+    return str(response.get("token") or "") if response.get("ok") else ""
+
+
+def resolve_token(explicit: Optional[str] = None) -> str:
+    for candidate in (explicit, os.getenv("GH_TOKEN"), os.getenv("GITHUB_TOKEN")):
+        if candidate and candidate.strip():
+            return candidate.strip()
+
+    token = broker_token()
+    if token:
+        return token
+
+    try:
+        completed = subprocess.run(
+            ["gh", "auth", "token", "--hostname", "github.com"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+            check=False,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return ""
+    if completed.returncode != 0:
+        return ""
+    return completed.stdout.strip()
+
+
+def default_cache_dir() -> Path:
+    override = os.getenv("GITHUB_CLIENT_CACHE_DIR", "").strip()
+    if override:
+        return Path(override)
+    base = os.getenv("XDG_CACHE_HOME", "").strip() or str(Path.home() / ".cache")
+    return Path(base) / "context-engineering" / "github-client"
+
+
+ConnectionKey = Tuple[str, str, int]
+
+
+class ConnectionPool:
+    """Idle keep-alive connections keyed by (scheme, host, port)."""
+
+    def __init__(self, timeout: float) -> None:
+        self._timeout = timeout
+        self._idle: Dict[ConnectionKey, List[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, key: ConnectionKey) -> http.client.HTTPConnection:
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop()
+        scheme, host, port = key
+        if scheme == "https":
+            return http.client.HTTPSConnection(host, port, timeout=self._timeout)
+        return http.client.HTTPConnection(host, port, timeout=self._timeout)
+
+    def release(self, key: ConnectionKey, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            self._idle.setdefault(key, []).append(conn)
+
+    def close(self) -> None:
+        with self._lock:
+            for conns in self._idle.values():
+                for conn in conns:
+                    conn.close()
+            self._idle.clear()
+
+
+class EtagCache:
+    """On-disk `ETag` + body cache for conditional REST GETs."""
+
+    def __init__(self, directory: Path) -> None:
+        self._directory = directory
+
+    def _path(self, url: str) -> Path:
+        return self._directory / f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json"
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        try:
+            entry = json.loads(self._path(url).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or "etag" not in entry:
+            return None
+        return entry
+
+    def put(self, url: str, etag: str, body: Any) -> None:
+        try:
+            self._directory.mkdir(parents=True, exist_ok=True)
+            path = self._path(url)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(json.dumps({"url": url, "etag": etag, "body": body}), encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+
+class GitHubClient:
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        api_url: Optional[str] = None,
+        graphql_url: Optional[str] = None,
+        cache_dir: Optional[Path] = None,
+        use_cache: bool = True,
+        timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.token = resolve_token(token)
+        self.api_url = (api_url or os.getenv("GITHUB_API_URL") or DEFAULT_API_URL).rstrip("/")
+        self.graphql_url = graphql_url or os.getenv("GITHUB_GRAPHQL_URL") or f"{self.api_url}/graphql"
+        self.max_retries = max_retries
+        self.stats: Dict[str, int] = {"requests": 0, "not_modified": 0, "retries": 0}
+        self._sleep = sleep
+        self._pool = ConnectionPool(timeout)
+        self._cache = EtagCache(cache_dir or default_cache_dir()) if use_cache else None
+        self._rate_lock = threading.Lock()
+        self._rate_remaining: Optional[int] = None
+        self._rate_reset: Optional[float] = None
+
+    def close(self) -> None:
+        self._pool.close()
+
+    def __enter__(self) -> "GitHubClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _url(self, path: str) -> str:
+        if path.startswith(("http://", "https://")):
+            return path
+        return f"{self.api_url}/{path.lstrip('/')}"
+
+    def _headers(self, extra: Optional[Dict[str, str]]) -> Dict[str, str]:
+        headers = {
+            "Accept": "application/vnd.github+json",
+            "User-Agent": USER_AGENT,
+            "X-GitHub-Api-Version": "2022-11-28",
+        }
+        if self.token:
+            headers["Authorization"] = f"Bearer {self.token}"
+        if extra:
+            headers.update(extra)
+        return headers
+
+    def _send(
+        self, method: str, url: str, body: Optional[bytes], headers: Dict[str, str], idempotent: bool
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        parsed = urllib.parse.urlsplit(url)
+        scheme = parsed.scheme or "https"
+        port = parsed.port or (443 if scheme == "https" else 80)
+        key: ConnectionKey = (scheme, parsed.hostname or "", port)
+        target = parsed.path or "/"
+        if parsed.query:
+            target = f"{target}?{parsed.query}"
+
+        # A pooled connection may have been closed by the server while idle;
+        # retry once on a fresh connection before surfacing the error. Once a
+        # non-idempotent request has been written the server may have acted on
+        # it, so only failures while sending are retried for those.
+        for attempt in range(2):
+            conn = self._pool.acquire(key)
+            sent = False
+            try:
+                conn.request(method, target, body=body, headers=headers)
+                sent = True
+                response = conn.getresponse()
+                data = response.read()
+            except (http.client.HTTPException, OSError) as exc:
+                conn.close()
+                if attempt or (sent and not idempotent):
+                    raise GitHubAPIError(f"{method} {url} failed: {exc}") from exc
+                continue
+
+            response_headers = {name.lower(): value for name, value in response.getheaders()}
+            if response.will_close:
+                conn.close()
+            else:
+                self._pool.release(key, conn)
+            self.stats["requests"] += 1
+            return response.status, response_headers, data
+
+        raise GitHubAPIError(f"{method} {url} failed: connection unavailable")
+
+    def _observe_rate_limit(self, headers: Dict[str, str]) -> None:
+        remaining = headers.get("x-ratelimit-remaining")
+        reset = headers.get("x-ratelimit-reset")
+        with self._rate_lock:
+            if remaining is not None and remaining.isdigit():
+                self._rate_remaining = int(remaining)
+            if reset is not None and reset.isdigit():
+                self._rate_reset = float(reset)
+
+    def _wait_for_primary_reset(self) -> None:
+        with self._rate_lock:
+            remaining = self._rate_remaining
+            reset = self._rate_reset
+        if remaining != 0 or reset is None:
+            return
+        delay = reset - time.time() + 1
+        if 0 < delay <= MAX_RATE_LIMIT_WAIT_SECONDS:
+            self._sleep(delay)
+        with self._rate_lock:
+            self._rate_remaining = None
+
+    def _rate_limit_delay(self, status: int, headers: Dict[str, str], data: bytes, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying a rate-limited response, or None when not rate-limited."""
+        retry_after = headers.get("retry-after", "")
+        if retry_after.isdigit():
+            return min(float(retry_after), MAX_RATE_LIMIT_WAIT_SECONDS)
+
+        if headers.get("x-ratelimit-remaining") == "0":
+            reset = headers.get("x-ratelimit-reset", "")
+            if reset.isdigit():
+                return min(max(float(reset) - time.time() + 1, 1.0), MAX_RATE_LIMIT_WAIT_SECONDS)
+
+        if status == 429 or b"secondary rate limit" in data.lower():
+            return min(60.0 * (2 ** attempt), MAX_RATE_LIMIT_WAIT_SECONDS)
+
+        return None
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        payload: Any = None,
+        headers: Optional[Dict[str, str]] = None,
+        cacheable: bool = False,
+        idempotent: Optional[bool] = None,
+    ) -> Any:
+        url = self._url(path)
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+        body = json.dumps(payload).encode("utf-8") if payload is not None else None
+        cache_entry = self._cache.get(url) if (cacheable and self._cache and method == "GET") else None
+
+        for attempt in range(self.max_retries + 1):
+            request_headers = self._headers(headers)
+            if body is not None:
+                request_headers["Content-Type"] = "application/json"
+            if cache_entry is not None:
+                request_headers["If-None-Match"] = cache_entry["etag"]
+
+            self._wait_for_primary_reset()
+            status, response_headers, data = self._send(method, url, body, request_headers, idempotent)
+            self._observe_rate_limit(response_headers)
+
+            if status == 304 and cache_entry is not None:
+                self.stats["not_modified"] += 1
+                return cache_entry.get("body")
+
+            if status in (403, 429):
+                delay = self._rate_limit_delay(status, response_headers, data, attempt)
+                if delay is not None and attempt < self.max_retries:
+                    self.stats["retries"] += 1
+                    self._sleep(delay)
+                    continue
+
+            if status >= 500 and idempotent and attempt < self.max_retries:
+                self.stats["retries"] += 1
+                self._sleep(min(2.0 ** attempt, 30.0))
+                continue
+
+            if status >= 400:
+                detail = data.decode("utf-8", errors="replace").strip()[:500]
+                raise GitHubAPIError(f"{method} {url} failed with HTTP {status}: {detail}", status)
+
+            document = json.loads(data) if data else None
+            etag = response_headers.get("etag")
+            if cacheable and self._cache and method == "GET" and etag:
+                self._cache.put(url, etag, document)
+            return document
+
+        raise GitHubAPIError(f"{method} {url} failed after {self.max_retries} retries")
+
+    def get(self, path: str) -> Any:
+        return self.request("GET", path, cacheable=True)
+
+    def graphql(
+        self,
+        query: str,
+        variables: Optional[Dict[str, Any]] = None,
+        allow_not_found: bool = False,
+        optional_fields: Sequence[str] = (),
+    ) -> Dict[str, Any]:
+        """Run a GraphQL document and return `data`.
+
+        NOT_FOUND errors are ignored when `allow_not_found` is set (the aliased
+        field resolves to null), and errors whose top-level path is listed in
+        `optional_fields` are treated as best-effort.
+        """
+        payload = {"query": query, "variables": variables or {}}
+        is_mutation = query.lstrip().startswith("mutation")
+
+        for attempt in range(self.max_retries + 1):
+            document = self.request("POST", self.graphql_url, payload, idempotent=not is_mutation) or {}
+            errors = document.get("errors") or []
+
+            if any(error.get("type") == "RATE_LIMITED" for error in errors) and attempt < self.max_retries:
+                self.stats["retries"] += 1
+                self._sleep(min(60.0 * (2 ** attempt), MAX_RATE_LIMIT_WAIT_SECONDS))
+                continue
+
+            fatal = [
+                error
+                for error in errors
+                if not (allow_not_found and error.get("type") == "NOT_FOUND")
+                and not ((error.get("path") or [None])[0] in optional_fields)
+            ]
+            if fatal:
+                raise GitHubAPIError(f"GraphQL errors: {fatal}")
+            return document.get("data") or {}
+
+        raise GitHubAPIError("GraphQL request remained rate limited after retries")
+
+
+def split_repo(repo: str) -> Tuple[str, str]:
+    owner, _, name = repo.partition("/")
+    if not owner or not name:
+        raise ValueError(f"Expected OWNER/REPO, got '{repo}'")
+    return owner, name
+
+
+def chunked(items: Sequence[str], size: int) -> Iterable[Sequence[str]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def batch_repository_lookup(
+    client: GitHubClient,
+    repos: Sequence[str],
+    head_ref: Optional[str] = None,
+    base_ref: Optional[str] = None,
+    labels: Sequence[str] = (),
+) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Resolve many repositories with one aliased query per batch.
+
+    For each repository the result carries its node id, the first open pull
+    request for `head_ref` -> `base_ref` (when `head_ref` is given) and the
+    node ids of any `labels` that exist (`missing_labels` lists the rest).
+    Missing repositories map to None.
+    """
+    results: Dict[str, Optional[Dict[str, Any]]] = {}
+    unique_repos = list(dict.fromkeys(repos))
+
+    for batch in chunked(unique_repos, GRAPHQL_BATCH_SIZE):
+        declarations: List[str] = []
+        variables: Dict[str, Any] = {}
+        selections: List[str] = []
+
+        label_selection = ""
+        for label_idx, label in enumerate(labels):
+            declarations.append(f"$label{label_idx}: String!")
+            variables[f"label{label_idx}"] = label
+            label_selection += f" label{label_idx}: label(name: $label{label_idx}) {{ id name }}"
+
+        pr_selection = ""
+        if head_ref:
+            declarations.append("$head: String!")
+            variables["head"] = head_ref
+            base_arg = ""
+            if base_ref:
+                declarations.append("$base: String!")
+                variables["base"] = base_ref
+                base_arg = ", baseRefName: $base"
+            pr_selection = (
+                f" pullRequests(headRefName: $head{base_arg}, states: [OPEN], first: 1)"
+                f" {{ nodes {{ {PULL_REQUEST_FIELDS} }} }}"
+            )
+
+        for idx, repo in enumerate(batch):
+            owner, name = split_repo(repo)
+            declarations.extend([f"$owner{idx}: String!", f"$name{idx}: String!"])
+            variables[f"owner{idx}"] = owner
+            variables[f"name{idx}"] = name
+            selections.append(
+                f"r{idx}: repository(owner: $owner{idx}, name: $name{idx}) "
+                f"{{ id nameWithOwner{pr_selection}{label_selection} }}"
+            )
+
+        query = f"query({', '.join(declarations)}) {{ {' '.join(selections)} }}"
+        data = client.graphql(query, variables, allow_not_found=True)
+
+        for idx, repo in enumerate(batch):
+            node = data.get(f"r{idx}")
+            if node is None:
+                results[repo] = None
+                continue
+            pull_requests = (node.get("pullRequests") or {}).get("nodes") or []
+            label_ids = [
+                node[f"label{label_idx}"]["id"]
+                for label_idx in range(len(labels))
+                if node.get(f"label{label_idx}")
+            ]
+            missing_labels = [
+                label for label_idx, label in enumerate(labels) if not node.get(f"label{label_idx}")
+            ]
+            results[repo] = {
+                "id": node.get("id"),
+                "name_with_owner": node.get("nameWithOwner"),
+                "pull_request": pull_requests[0] if pull_requests else None,
+                "label_ids": label_ids,
+                "missing_labels": missing_labels,
+            }
+
+    return results
+
+
+def upsert_pull_request(
+    client: GitHubClient,
+    repo: str,
+    head_ref: str,
+    base_ref: str,
+    title: str,
+    body: str,
+    labels: Sequence[str] = (),
+) -> Dict[str, Any]:
+    """Create or update the open PR for head -> base and apply labels (best effort).
+
+    Costs two GraphQL requests on update and three on create, and the mutation
+    responses already carry the state needed for auto-merge decisions. Labels
+    that do not exist yet in the repository are added through the REST issue
+    labels endpoint, which creates them, costing one more request.
+    """
+    lookup = batch_repository_lookup(client, [repo], head_ref, base_ref, labels)[repo]
+    if lookup is None:
+        raise GitHubAPIError(f"Target repo does not exist or is inaccessible: {repo}")
+
+    label_ids = lookup["label_ids"]
+    existing = lookup["pull_request"]
+
+    if existing is not None:
+        declarations = "$pr: ID!, $title: String!, $body: String!"
+        label_mutation = ""
+        variables: Dict[str, Any] = {"pr": existing["id"], "title": title, "body": body}
+        if label_ids:
+            declarations += ", $labels: [ID!]!"
+            variables["labels"] = label_ids
+            label_mutation = " label: addLabelsToLabelable(input: {labelableId: $pr, labelIds: $labels}) { clientMutationId }"
+        data = client.graphql(
+            f"mutation({declarations}) {{"
+            " update: updatePullRequest(input: {pullRequestId: $pr, title: $title, body: $body})"
+            f" {{ pullRequest {{ {PULL_REQUEST_FIELDS} }} }}"
+            f"{label_mutation} }}",
+            variables,
+            optional_fields=("label",),
+        )
+        pull_request = data["update"]["pullRequest"]
+        apply_missing_labels(client, repo, pull_request["number"], lookup["missing_labels"])
+        return pull_request
+
+    try:
+        data = client.graphql(
+            "mutation($repo: ID!, $head: String!, $base: String!, $title: String!, $body: String!) {"
+            " create: createPullRequest(input: {repositoryId: $repo, headRefName: $head,"
+            " baseRefName: $base, title: $title, body: $body})"
+            f" {{ pullRequest {{ {PULL_REQUEST_FIELDS} }} }} }}",
+            {"repo": lookup["id"], "head": head_ref, "base": base_ref, "title": title, "body": body},
+        )
+        pull_request = data["create"]["pullRequest"]
+    except GitHubAPIError:
+        # Another run may have opened the PR between lookup and create.
+        retry = batch_repository_lookup(client, [repo], head_ref, base_ref)[repo]
+        if retry is None or retry["pull_request"] is None:
+            raise
+        pull_request = retry["pull_request"]
+
+    if label_ids:
+        client.graphql(
+            "mutation($pr: ID!, $labels: [ID!]!) {"
+            " label: addLabelsToLabelable(input: {labelableId: $pr, labelIds: $labels}) { clientMutationId } }",
+            {"pr": pull_request["id"], "labels": label_ids},
+            optional_fields=("label",),
+        )
+    apply_missing_labels(client, repo, pull_request["number"], lookup["missing_labels"])
+    return pull_request
+
+
+def apply_missing_labels(client: GitHubClient, repo: str, number: int, labels: Sequence[str]) -> None:
+    """Add labels the lookup could not resolve; the REST endpoint creates missing ones.
+
+    Failures only warn, so a repo without label permissions still gets its PR.
+    """
+    if not labels:
+        return
+    try:
+        # Adding labels is a set union, so a resend after a dropped connection is harmless.
+        client.request("POST", f"repos/{repo}/issues/{number}/labels", {"labels": list(labels)}, idempotent=True)
+    except GitHubAPIError as exc:
+        print(
+            f"Warning: could not apply labels {', '.join(labels)} to {repo}#{number}: {exc}",
+            file=sys.stderr,
+        )
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Shared GitHub API client for role-repo tooling.")
+    parser.add_argument("--no-cache", action="store_true", help="Disable the ETag request cache.")
+    parser.add_argument("--stats", action="store_true", help="Print request statistics to stderr.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    get_parser = subparsers.add_parser("get", help="ETag-cached REST GET; prints the JSON response.")
+    get_parser.add_argument("path", help="REST path, for example repos/OWNER/REPO.")
+
+    view_parser = subparsers.add_parser(
+        "repo-view", help="Resolve one or more repositories in a single batched query."
+    )
+    view_parser.add_argument("--repo", action="append", required=True, help="OWNER/REPO (repeatable).")
+
+    upsert_parser = subparsers.add_parser(
+        "pr-upsert", help="Create or update the open PR for a head branch and apply labels."
+    )
+    upsert_parser.add_argument("--repo", required=True, help="OWNER/REPO.")
+    upsert_parser.add_argument("--head", required=True, help="Head branch name.")
+    upsert_parser.add_argument("--base", required=True, help="Base branch name.")
+    upsert_parser.add_argument("--title", required=True)
+    upsert_parser.add_argument("--body-file", required=True)
+    upsert_parser.add_argument("--label", action="append", default=[], help="Label name (repeatable).")
+    upsert_parser.add_argument(
+        "--format",
+        choices=["json", "fields"],
+        default="json",
+        help="fields prints NUMBER|STATE|IS_DRAFT|MERGE_STATE_STATUS for shell callers.",
+    )
+
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    client = GitHubClient(use_cache=not args.no_cache)
+    exit_code = 0
+
+    try:
+        if args.command == "get":
+            print(json.dumps(client.get(args.path), indent=2, sort_keys=True))
+        elif args.command == "repo-view":
+            results = batch_repository_lookup(client, args.repo)
+            for repo in args.repo:
+                if results.get(repo) is None:
+                    print(f"Target repo does not exist or is inaccessible: {repo}", file=sys.stderr)
+                    exit_code = 1
+                else:
+                    print(results[repo]["name_with_owner"])
+        elif args.command == "pr-upsert":
+            with open(args.body_file, "r", encoding="utf-8") as handle:
+                body = handle.read()
+            pull_request = upsert_pull_request(
+                client,
+                repo=args.repo,
+                head_ref=args.head,
+                base_ref=args.base,
+                title=args.title,
+                body=body,
+                labels=args.label,
+            )
+            if args.format == "fields":
+                print(
+                    f"{pull_request['number']}|{pull_request['state']}|"
+                    f"{str(bool(pull_request['isDraft'])).lower()}|{pull_request.get('mergeStateStatus') or ''}"
+                )
+            else:
+                print(json.dumps(pull_request, indent=2, sort_keys=True))
+    except (GitHubAPIError, OSError, ValueError) as exc:
+        print(f"GitHub API request failed: {exc}", file=sys.stderr)
+        exit_code = 1
+    finally:
+        if args.stats:
+            print(f"GitHub client stats: {json.dumps(client.stats, sort_keys=True)}", file=sys.stderr)
+        client.close()
+
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
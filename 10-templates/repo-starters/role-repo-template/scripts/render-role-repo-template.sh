@@ -163,6 +163,8 @@ render_template "${TEMPLATE_ROOT}/templates/.github/workflows/governance-pr-gate
 render_template "${TEMPLATE_ROOT}/templates/README.md.tmpl" "${OUTPUT_DIR}/README.md"
 render_template "${TEMPLATE_ROOT}/templates/.vscode/settings.json.tmpl" "${OUTPUT_DIR}/.vscode/settings.json"
 render_template "${TEMPLATE_ROOT}/templates/scripts/validate-pr-metadata.py.tmpl" "${OUTPUT_DIR}/scripts/validate-pr-metadata.py"
+# Shared with sync tooling; copied verbatim so both sides run the same client.
+cp "${SCRIPT_DIR}/github_client.py" "${OUTPUT_DIR}/scripts/github_client.py"
 render_template "${TEMPLATE_ROOT}/templates/scripts/bootstrap-governance-labels.sh.tmpl" "${OUTPUT_DIR}/scripts/bootstrap-governance-labels.sh"
 render_template "${TEMPLATE_ROOT}/templates/scripts/gh-safe-comment.sh.tmpl" "${OUTPUT_DIR}/scripts/gh-safe-comment.sh"
 render_template "${TEMPLATE_ROOT}/templates/scripts/request-pr-review.sh.tmpl" "${OUTPUT_DIR}/scripts/request-pr-review.sh"
@@ -188,6 +190,7 @@ if [ "$ROLE_SLUG" = "compliance-officer" ]; then
 fi
 
 chmod +x "${OUTPUT_DIR}/scripts/validate-pr-metadata.py"
+chmod +x "${OUTPUT_DIR}/scripts/github_client.py"
 chmod +x "${OUTPUT_DIR}/scripts/bootstrap-governance-labels.sh"
 chmod +x "${OUTPUT_DIR}/scripts/gh-safe-comment.sh"
 chmod +x "${OUTPUT_DIR}/scripts/request-pr-review.sh"
@@ -0,0 +1,123 @@
+#!/usr/bin/env bash
+# Shared git helpers for role-repo sync tooling.
+#
+# Sourced by sync-role-repo.sh, benchmark-role-repo-checkout.sh, and
+# scan-role-repo-drift.py.
+# Functions only; sourcing this file has no side effects.
+
+# role_repo_managed_files <manifest> <role-slug>
+#
+# Prints the managed file paths for a role, one per line, in manifest order.
+# Manifest lines are "<path> [role-slug...]"; '#' starts a comment.
+role_repo_managed_files() {
+  local manifest="$1"
+  local role_slug="$2"
+  local path scope line
+
+  while read -r line || [ -n "$line" ]; do
+    line="${line%%#*}"
+    read -r path scope <<<"$line"
+    [ -n "$path" ] || continue
+    if [ -z "$scope" ] || [[ " ${scope} " == *" ${role_slug} "* ]]; then
+      printf '%s\n' "$path"
+    fi
+  done <"$manifest"
+}
+
+# role_repo_mirror_path <mirror-root> <owner> <repo-name>
+role_repo_mirror_path() {
+  printf '%s/%s/%s.git' "$1" "$2" "$3"
+}
+
+# refresh_role_repo_mirror <mirror-path> <remote-url> <branch>
+#
+# Creates a blobless bare mirror on first use, then refreshes the requested
+# branch with an incremental fetch. Blobs are fetched lazily, so only the
+# managed files that are actually checked out are ever downloaded.
+refresh_role_repo_mirror() {
+  local mirror="$1"
+  local remote_url="$2"
+  local branch="$3"
+
+  if [ ! -d "$mirror" ]; then
+    mkdir -p "$(dirname "$mirror")"
+    git clone --bare --filter=blob:none --single-branch --branch "$branch" "$remote_url" "$mirror" >/dev/null
+  else
+    git -C "$mirror" remote set-url origin "$remote_url"
+  fi
+
+  git -C "$mirror" worktree prune
+  git -C "$mirror" fetch --prune --filter=blob:none origin "+refs/heads/${branch}:refs/heads/${branch}" >/dev/null
+}
+
+# clone_role_repo_partial <remote-url> <branch> <target-dir>
+#
+# Shallow, blobless, no-checkout clone. Pair with checkout_managed_files.
+clone_role_repo_partial() {
+  git clone --depth 1 --filter=blob:none --no-checkout --single-branch --branch "$2" "$1" "$3" >/dev/null
+}
+
+# add_role_repo_worktree <mirror-path> <ref> <target-dir>
+#
+# Adds a detached, unpopulated worktree of the mirror. Pair with checkout_managed_files.
+add_role_repo_worktree() {
+  local target_dir
+
+  mkdir -p "$3"
+  target_dir="$(cd "$3" && pwd)"
+  git -C "$1" worktree add --no-checkout --detach "$target_dir" "$2" >/dev/null
+}
+
+# checkout_managed_files <work-tree> <file>...
+#
+# Restricts the checkout to the given paths (anchored, non-cone sparse
+# patterns) and populates the index from HEAD. Paths not yet present in the
+# tree are allowed so new managed files can be added.
+checkout_managed_files() {
+  local work_tree="$1"
+  shift
+
+  printf '/%s\n' "$@" | git -C "$work_tree" sparse-checkout set --no-cone --stdin
+  git -C "$work_tree" reset --hard --quiet
+}
+
+# managed_files_changed <git-dir> <ref> <source-dir> <file>...
+#
+# Returns 0 when any file under <source-dir> differs from the blob recorded
+# at <ref>, or is missing from <ref>. Only tree objects are read and the
+# rendered files are hashed in one batch, so no blobs are fetched and no
+# working tree is needed.
+managed_files_changed() {
+  local git_dir="$1"
+  local ref="$2"
+  local source_dir
+  source_dir="$(cd "$3" && pwd)"
+  shift 3
+
+  local -A tree_blobs=()
+  local meta path mode type sha
+  while IFS=$'\t' read -r meta path; do
+    read -r mode type sha <<<"$meta"
+    if [ "$type" = "blob" ]; then
+      tree_blobs["$path"]="$sha"
+    fi
+  done < <(git -C "$git_dir" ls-tree "$ref" -- "$@")
+
+  local -a rendered_blobs=()
+  mapfile -t rendered_blobs < <(
+    for path in "$@"; do
+      printf '%s/%s\n' "$source_dir" "$path"
+    done | git -C "$git_dir" hash-object --stdin-paths
+  )
+
+  local idx=0
+  local file
+  for file in "$@"; do
+    if [ "${tree_blobs[$file]:-}" != "${rendered_blobs[$idx]}" ]; then
+      return 0
+    fi
+    idx=$((idx + 1))
+  done
+
+  return 1
+}
@@ -0,0 +1,430 @@
+#!/usr/bin/env python3
+"""Report which role repos have drifted from a fresh local render.
+
+Roles come from the role registry (00-os/role-registry.yml via
+registry_query.py). For every role, concurrently:
+
+- the role repo's blobless bare mirror is refreshed with the same layout and
+  helper as `sync-role-repo.sh --mirror-dir` (role-repo-git.sh);
+- the role repo template is rendered locally at the expected source ref;
+- the managed files (role-repo-managed-files.txt) are compared by reading the
+  mirror's tree and only the differing blobs through one `git cat-file --batch`
+  process, so no working tree or checkout is created.
+
+Per-render lines (`Source ref`, `Generated at (UTC)`, `Source-Ref`,
+`Generated-At-UTC`) are normalized before hashing, so a file that differs only
+by its sync stamp is reported as stale rather than drifted.
+
+Statuses: in-sync, stale-ref (content matches, AGENTS.md Source-Ref is not the
+expected ref, so the publish freshness check would fail), drift (managed
+content or Governance-Contract-Version differs, or files are missing), error.
+
+Exit codes: 0 every role in sync, 1 usage or setup error, 2 at least one role
+is stale, drifted, or could not be scanned.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parents[3]
+RENDER_SCRIPT = SCRIPT_DIR / "render-role-repo-template.sh"
+GIT_HELPERS = SCRIPT_DIR / "role-repo-git.sh"
+MANAGED_FILES_MANIFEST = SCRIPT_DIR / "role-repo-managed-files.txt"
+DEFAULT_OWNER = "Josh-Phillips-LLC"
+DEFAULT_REMOTE_URL_TEMPLATE = "https://github.com/{owner}/{repo}.git"
+
+# Lines stamped per render; their values are masked before content hashing.
+VOLATILE_LINE_PATTERNS = [
+    re.compile(rb"^(- Source ref: `)[^`\n]*(`)", re.M),
+    re.compile(rb"^(- Generated at \(UTC\): `)[^`\n]*(`)", re.M),
+    re.compile(rb"^(Source-Ref: )[^\n]*()", re.M),
+    re.compile(rb"^(Generated-At-UTC: )[^\n]*()", re.M),
+]
+SOURCE_REF_HEADER = re.compile(r"^Source-Ref: *(\S+)", re.M)
+SOURCE_REF_MARKER = re.compile(r"^- Source ref: `([^`]+)`", re.M)
+CONTRACT_VERSION_HEADER = re.compile(r"^Governance-Contract-Version: *(\S+)", re.M)
+
+STATUS_ORDER = {"error": 0, "drift": 1, "stale-ref": 2, "in-sync": 3}
+
+
+def err(msg: str) -> None:
+    print(f"Error: {msg}", file=sys.stderr)
+
+
+def load_managed_files(manifest: Path, role_slug: str) -> List[str]:
+    """Mirror of role_repo_managed_files in role-repo-git.sh."""
+    files: List[str] = []
+    for raw_line in manifest.read_text(encoding="utf-8").splitlines():
+        parts = raw_line.split("#", 1)[0].split()
+        if not parts:
+            continue
+        if len(parts) == 1 or role_slug in parts[1:]:
+            files.append(parts[0])
+    return files
+
+
+def load_roles(repo_root: Path, slugs: List[str]) -> List[Dict[str, Any]]:
+    scripts_dir = repo_root / "00-os" / "scripts"
+    if str(scripts_dir) not in sys.path:
+        sys.path.insert(0, str(scripts_dir))
+    import registry_query  # pylint: disable=import-outside-toplevel
+
+    roles = registry_query.load_registry_index(repo_root).records("roles")
+    if not slugs:
+        return roles
+    known = {role["slug"]: role for role in roles}
+    unknown = [slug for slug in slugs if slug not in known]
+    if unknown:
+        raise ValueError(f"Unknown role slug(s): {', '.join(unknown)}")
+    return [known[slug] for slug in slugs]
+
+
+def normalized_digest(content: bytes) -> str:
+    for pattern in VOLATILE_LINE_PATTERNS:
+        content = pattern.sub(rb"\1<volatile>\2", content)
+    return hashlib.sha256(content).hexdigest()
+
+
+def header_value(pattern: re.Pattern[str], content: bytes) -> str:
+    match = pattern.search(content.decode("utf-8", errors="replace"))
+    return match.group(1) if match else ""
+
+
+def agents_source_ref(content: bytes) -> str:
+    return header_value(SOURCE_REF_HEADER, content) or header_value(SOURCE_REF_MARKER, content)
+
+
+def run(cmd: List[str], **kwargs: Any) -> subprocess.CompletedProcess:
+    return subprocess.run(cmd, check=True, capture_output=True, **kwargs)
+
+
+def mirror_path(mirror_root: Path, owner: str, repo_name: str) -> Path:
+    """Same layout as role_repo_mirror_path in role-repo-git.sh."""
+    return mirror_root / owner / f"{repo_name}.git"
+
+
+def refresh_mirror(mirror: Path, remote_url: str, branch: str) -> None:
+    run(
+        [
+            "bash",
+            "-c",
+            'set -euo pipefail; source "$1"; refresh_role_repo_mirror "$2" "$3" "$4"',
+            "refresh-role-repo-mirror",
+            str(GIT_HELPERS),
+            str(mirror),
+            remote_url,
+            branch,
+        ]
+    )
+
+
+def render_role_repo(role: Dict[str, Any], source_ref: str, output_dir: Path) -> None:
+    run(
+        [
+            str(RENDER_SCRIPT),
+            "--role-slug",
+            role["slug"],
+            "--repo-name",
+            role["repo_name"],
+            "--output-dir",
+            str(output_dir),
+            "--source-ref",
+            source_ref,
+        ]
+    )
+
+
+def tree_blobs(mirror: Path, ref: str, files: List[str]) -> Dict[str, str]:
+    listing = run(["git", "-C", str(mirror), "ls-tree", "-z", ref, "--", *files]).stdout
+    blobs: Dict[str, str] = {}
+    for entry in listing.split(b"\0"):
+        if not entry:
+            continue
+        meta, path = entry.split(b"\t", 1)
+        _mode, obj_type, sha = meta.decode().split()
+        if obj_type == "blob":
+            blobs[path.decode("utf-8")] = sha
+    return blobs
+
+
+def rendered_blobs(mirror: Path, render_dir: Path, files: List[str]) -> Dict[str, str]:
+    paths = "".join(f"{render_dir / path}\n" for path in files)
+    output = run(
+        ["git", "-C", str(mirror), "hash-object", "--stdin-paths"],
+        input=paths.encode("utf-8"),
+    ).stdout.decode().split()
+    return dict(zip(files, output))
+
+
+def present_objects(mirror: Path, shas: List[str]) -> List[str]:
+    """Objects already in the mirror; lazy fetching is disabled for the check."""
+    env = {**os.environ, "GIT_NO_LAZY_FETCH": "1"}
+    present: List[str] = []
+    for sha in shas:
+        check = subprocess.run(["git", "-C", str(mirror), "cat-file", "-e", sha], capture_output=True, env=env)
+        if check.returncode == 0:
+            present.append(sha)
+    return present
+
+
+def prefetch_blobs(mirror: Path, shas: List[str]) -> None:
+    """Fetch the needed blobs in one round trip instead of one lazy fetch each."""
+    try:
+        run(
+            [
+                "git",
+                "-C",
+                str(mirror),
+                "-c",
+                "fetch.negotiationAlgorithm=noop",
+                "fetch",
+                "--no-tags",
+                "--no-write-fetch-head",
+                "--filter=blob:none",
+                "origin",
+                *shas,
+            ]
+        )
+    except subprocess.CalledProcessError:
+        # cat-file falls back to lazy per-object fetches.
+        pass
+
+
+def read_blobs(mirror: Path, shas: List[str], offline: bool) -> Dict[str, bytes]:
+    """Read many blobs through a single `git cat-file --batch` process."""
+    if offline:
+        shas = present_objects(mirror, shas)
+    if not shas:
+        return {}
+    output = run(
+        ["git", "-C", str(mirror), "cat-file", "--batch"],
+        input="".join(f"{sha}\n" for sha in shas).encode(),
+    ).stdout
+
+    contents: Dict[str, bytes] = {}
+    pos = 0
+    while pos < len(output):
+        header_end = output.index(b"\n", pos)
+        header = output[pos:header_end].decode().split()
+        pos = header_end + 1
+        if len(header) != 3:
+            continue
+        sha, _obj_type, size = header
+        contents[sha] = output[pos : pos + int(size)]
+        pos += int(size) + 1
+    return contents
+
+
+@dataclass
+class RoleDrift:
+    role_slug: str
+    repo: str
+    status: str = "in-sync"
+    source_ref: str = ""
+    expected_source_ref: str = ""
+    contract_version: str = ""
+    expected_contract_version: str = ""
+    managed_files: int = 0
+    stale_files: List[str] = field(default_factory=list)
+    drifted_files: List[str] = field(default_factory=list)
+    missing_files: List[str] = field(default_factory=list)
+    unavailable_files: List[str] = field(default_factory=list)
+    error: str = ""
+
+
+def scan_role(role: Dict[str, Any], args: argparse.Namespace, work_root: Path) -> RoleDrift:
+    repo_name = role["repo_name"]
+    result = RoleDrift(
+        role_slug=role["slug"],
+        repo=f"{args.owner}/{repo_name}",
+        expected_source_ref=args.source_ref,
+    )
+    mirror = mirror_path(args.mirror_dir, args.owner, repo_name)
+    render_dir = work_root / role["slug"]
+
+    try:
+        if not args.offline:
+            remote_url = args.remote_url_template.format(owner=args.owner, repo=repo_name)
+            refresh_mirror(mirror, remote_url, args.base_branch)
+        elif not mirror.is_dir():
+            raise RuntimeError(f"mirror not found: {mirror}")
+        render_role_repo(role, args.source_ref, render_dir)
+
+        files = load_managed_files(args.manifest, role["slug"])
+        result.managed_files = len(files)
+        remote = tree_blobs(mirror, args.base_branch, files)
+        local = rendered_blobs(mirror, render_dir, files)
+
+        result.missing_files = [path for path in files if path not in remote]
+        differing = [path for path in files if path in remote and remote[path] != local[path]]
+        needed = sorted({remote[path] for path in differing})
+        if needed and not args.offline:
+            prefetch_blobs(mirror, needed)
+        blobs = read_blobs(mirror, needed, args.offline)
+
+        for path in differing:
+            content = blobs.get(remote[path])
+            if content is None:
+                result.unavailable_files.append(path)
+            elif normalized_digest(content) == normalized_digest((render_dir / path).read_bytes()):
+                result.stale_files.append(path)
+            else:
+                result.drifted_files.append(path)
+
+        rendered_agents = (render_dir / "AGENTS.md").read_bytes()
+        result.expected_contract_version = header_value(CONTRACT_VERSION_HEADER, rendered_agents)
+        if "AGENTS.md" in remote:
+            repo_agents = blobs.get(remote["AGENTS.md"], rendered_agents)
+            result.source_ref = agents_source_ref(repo_agents)
+            result.contract_version = header_value(CONTRACT_VERSION_HEADER, repo_agents)
+    except (subprocess.CalledProcessError, OSError, RuntimeError, ValueError) as exc:
+        result.status = "error"
+        stderr = getattr(exc, "stderr", b"") or b""
+        detail = stderr.decode("utf-8", errors="replace").strip().splitlines()
+        fatal = [line for line in detail if line.startswith("fatal:")]
+        result.error = (fatal or detail or [str(exc)])[0]
+        return result
+
+    if (
+        result.drifted_files
+        or result.missing_files
+        or result.unavailable_files
+        or result.contract_version != result.expected_contract_version
+    ):
+        result.status = "drift"
+    elif result.source_ref != result.expected_source_ref:
+        result.status = "stale-ref"
+    return result
+
+
+def summarize_paths(paths: List[str], limit: int = 3) -> str:
+    shown = ", ".join(paths[:limit])
+    if len(paths) > limit:
+        shown += f" (+{len(paths) - limit} more)"
+    return shown
+
+
+def table_rows(results: List[RoleDrift]) -> List[List[str]]:
+    rows = [["ROLE", "STATUS", "SOURCE-REF", "CONTRACT", "FILES", "DETAIL"]]
+    for result in results:
+        if result.status == "error":
+            rows.append([result.role_slug, result.status, "-", "-", "-", result.error])
+            continue
+
+        source_ref = result.source_ref or "(none)"
+        if result.source_ref != result.expected_source_ref:
+            source_ref += f" -> {result.expected_source_ref}"
+        contract = result.contract_version or "(none)"
+        if result.contract_version != result.expected_contract_version:
+            contract += f" -> {result.expected_contract_version}"
+
+        detail_paths = result.drifted_files + result.missing_files + result.unavailable_files
+        counts = [f"{result.managed_files - len(detail_paths)}/{result.managed_files} ok"]
+        for label, paths in (
+            ("drift", result.drifted_files),
+            ("missing", result.missing_files),
+            ("unavailable", result.unavailable_files),
+        ):
+            if paths:
+                counts.append(f"{len(paths)} {label}")
+        files = ", ".join(counts)
+
+        rows.append([result.role_slug, result.status, source_ref, contract, files, summarize_paths(detail_paths)])
+    return rows
+
+
+def print_table(rows: List[List[str]]) -> None:
+    widths = [max(len(row[idx]) for row in rows) for idx in range(len(rows[0]) - 1)]
+    for row in rows:
+        cells = [cell.ljust(width) for cell, width in zip(row, widths)]
+        print("  ".join([*cells, row[-1]]).rstrip())
+
+
+def default_source_ref(repo_root: Path) -> str:
+    try:
+        return run(["git", "-C", str(repo_root), "rev-parse", "--short", "HEAD"]).stdout.decode().strip()
+    except (subprocess.CalledProcessError, OSError):
+        return "unknown"
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Scan role repos for drift from a fresh local render.")
+    parser.add_argument(
+        "--owner",
+        default=os.getenv("ROLE_REPO_OWNER", DEFAULT_OWNER),
+        help=f"Role repo owner (default: ROLE_REPO_OWNER or {DEFAULT_OWNER}).",
+    )
+    parser.add_argument(
+        "--mirror-dir",
+        type=Path,
+        default=Path(os.environ["ROLE_REPO_MIRROR_DIR"]) if os.getenv("ROLE_REPO_MIRROR_DIR") else None,
+        help="Bare-mirror cache root shared with sync-role-repo.sh (default: ROLE_REPO_MIRROR_DIR).",
+    )
+    parser.add_argument("--role", action="append", default=[], help="Limit the scan to this role slug (repeatable).")
+    parser.add_argument("--base-branch", default="main", help="Role repo branch to compare (default: main).")
+    parser.add_argument("--source-ref", help="Expected Source-Ref (default: short HEAD of this checkout).")
+    parser.add_argument("--jobs", type=int, default=8, help="Roles scanned concurrently (default: 8).")
+    parser.add_argument("--offline", action="store_true", help="Use mirrors as they are; no fetches.")
+    parser.add_argument(
+        "--remote-url-template",
+        default=os.getenv("ROLE_REPO_REMOTE_URL_TEMPLATE", DEFAULT_REMOTE_URL_TEMPLATE),
+        help="Remote URL with {owner} and {repo} placeholders (default: GitHub HTTPS).",
+    )
+    parser.add_argument("--format", choices=["table", "json", "slugs"], default="table")
+    parser.add_argument("--repo-root", type=Path, default=REPO_ROOT, help=argparse.SUPPRESS)
+    parser.add_argument("--manifest", type=Path, default=MANAGED_FILES_MANIFEST, help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+    if args.mirror_dir is None:
+        err("--mirror-dir (or ROLE_REPO_MIRROR_DIR) is required.")
+        return 1
+    if args.jobs < 1:
+        err("--jobs must be at least 1.")
+        return 1
+    args.mirror_dir = args.mirror_dir.resolve()
+    if not args.source_ref:
+        args.source_ref = default_source_ref(args.repo_root)
+
+    try:
+        roles = load_roles(args.repo_root, args.role)
+    except Exception as exc:  # pylint: disable=broad-except
+        err(str(exc))
+        return 1
+
+    with tempfile.TemporaryDirectory(prefix="role-repo-drift-") as work_dir:
+        with ThreadPoolExecutor(max_workers=min(args.jobs, len(roles) or 1)) as pool:
+            results = list(pool.map(lambda role: scan_role(role, args, Path(work_dir)), roles))
+
+    results.sort(key=lambda result: (STATUS_ORDER[result.status], result.role_slug))
+    stale = [result for result in results if result.status != "in-sync"]
+
+    if args.format == "json":
+        print(json.dumps([asdict(result) for result in results], indent=2))
+    elif args.format == "slugs":
+        for result in stale:
+            print(result.role_slug)
+    else:
+        print_table(table_rows(results))
+        print(f"\n{len(stale)} of {len(results)} role repo(s) need sync (expected Source-Ref {args.source_ref}).")
+
+    return 2 if stale else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Local GraphQL stub for exercising role-repo tooling without GitHub.
+
+Replay mode serves responses from a fixture file; record mode forwards each
+request to an upstream endpoint and appends the exchange to the fixture.
+
+Fixture format:
+
+    {"responses": [{"match": {<variable>: <value>, ...}, "response": {...}}]}
+
+A request is answered by the first entry whose `match` items are all present
+in the request variables. Point tools at the stub with `--graphql-url` or
+`GITHUB_GRAPHQL_URL=http://127.0.0.1:<port>/graphql`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import threading
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Serve or record GraphQL fixtures for local testing.")
+    parser.add_argument("--fixture", required=True, help="Fixture JSON file to replay from or record into.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=0, help="Listen port (default: ephemeral).")
+    parser.add_argument(
+        "--record-upstream",
+        help="Forward requests to this GraphQL URL and append responses to the fixture.",
+    )
+    parser.add_argument(
+        "--record-token",
+        help="Token for the upstream endpoint when recording (defaults to GH_TOKEN/GITHUB_TOKEN).",
+    )
+    return parser.parse_args()
+
+
+def load_fixture(path: Path) -> List[Dict[str, Any]]:
+    if not path.exists():
+        return []
+    document = json.loads(path.read_text(encoding="utf-8"))
+    return list(document.get("responses", []))
+
+
+def find_response(entries: List[Dict[str, Any]], variables: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    for entry in entries:
+        match = entry.get("match") or {}
+        if all(variables.get(key) == value for key, value in match.items()):
+            return entry.get("response")
+    return None
+
+
+def main() -> int:
+    args = parse_args()
+    fixture_path = Path(args.fixture)
+    entries = load_fixture(fixture_path)
+    lock = threading.Lock()
+    record_token = args.record_token
+    if args.record_upstream and not record_token:
+        record_token = os.getenv("GH_TOKEN") or os.getenv("GITHUB_TOKEN") or ""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, format: str, *args: Any) -> None:
+            print(f"graphql-fixture: {format % args}", file=sys.stderr)
+
+        def _reply(self, status: int, document: Dict[str, Any]) -> None:
+            body = json.dumps(document).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_POST(self) -> None:
+            length = int(self.headers.get("Content-Length", "0"))
+            payload = json.loads(self.rfile.read(length) or b"{}")
+            variables = payload.get("variables") or {}
+
+            if args.record_upstream:
+                request = urllib.request.Request(
+                    args.record_upstream,
+                    data=json.dumps(payload).encode("utf-8"),
+                    headers={
+                        "Authorization": f"Bearer {record_token}",
+                        "Content-Type": "application/json",
+                        "Accept": "application/json",
+                    },
+                )
+                with urllib.request.urlopen(request, timeout=30) as response:
+                    document = json.load(response)
+                with lock:
+                    entries.append({"match": variables, "response": document})
+                    fixture_path.parent.mkdir(parents=True, exist_ok=True)
+                    fixture_path.write_text(
+                        json.dumps({"responses": entries}, indent=2) + "\n", encoding="utf-8"
+                    )
+                self._reply(200, document)
+                return
+
+            with lock:
+                document = find_response(entries, variables)
+            if document is None:
+                self._reply(200, {"errors": [{"message": f"No fixture entry matches variables: {variables}"}]})
+                return
+            self._reply(200, document)
+
+    server = ThreadingHTTPServer((args.host, args.port), Handler)
+    host, port = server.server_address[:2]
+    print(f"http://{host}:{port}/graphql", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
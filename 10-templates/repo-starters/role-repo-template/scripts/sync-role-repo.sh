@@ -12,6 +12,8 @@ Usage:
     [--base-branch <base-branch>] \
     [--source-ref <source-ref>] \
     [--work-dir <work-dir>] \
+    [--mirror-dir <mirror-dir>] \
+    [--clone-mode <partial|full>] \
     [--sync-branch <sync-branch>] \
     [--pr-title <pr-title>] \
     [--auto-merge] \
@@ -30,6 +32,8 @@ Optional:
   --base-branch   Defaults to: main
   --source-ref    Defaults to current git short SHA in source repo
   --work-dir      Temporary workspace root
+  --mirror-dir    Persistent bare-mirror cache root (defaults to: $ROLE_REPO_MIRROR_DIR)
+  --clone-mode    partial (default: shallow, blobless, sparse) or full (legacy full-history clone)
   --sync-branch   Defaults to: sync/role-repo/<role-slug>
   --pr-title      Defaults to role sync title
   --auto-merge    Best-effort request GitHub auto-merge on the sync PR
@@ -41,32 +45,21 @@ Optional:
 Notes:
   - Requires gh + git + python3
   - Requires authenticated gh session with write access to target role repo
-  - Managed files synced into target role repo root:
-    - AGENTS.md
-    - README.md
-    - .github/copilot-instructions.md
-    - .github/pull_request_template.md
-    - .github/workflows/governance-pr-gates.yml
-    - .vscode/settings.json
-    - scripts/bootstrap-governance-labels.sh
-    - scripts/gh-safe-comment.sh
-    - scripts/request-pr-review.sh
-    - scripts/validate-pr-metadata.py
-    - handbook/README.md
-    - handbook/sops/README.md
-    - handbook/sops/general-process-improvement-loop.md
-    - handbook/runbooks/README.md
-    - handbook/runbooks/general-governance-label-bootstrap.md
-    - handbook/runbooks/general-github-commenting.md
-    - handbook/runbooks/general-reviewer-request-preflight.md
-    - handbook/templates/README.md
-    - handbook/templates/general-efficiency-opportunity.md
-    - handbook/references/README.md
+  - With --mirror-dir, each role repo is kept as a blobless bare mirror under
+    <mirror-dir>/<owner>/<repo-name>.git, refreshed by incremental fetch, and
+    checked out as a sparse worktree limited to the managed files
+  - Managed files synced into target role repo root are listed in
+    scripts/role-repo-managed-files.txt (shared with scan-role-repo-drift.py)
 USAGE
 }
 
 SCRIPT_DIR="$(cd "$(dirname "${BASH_SOURCE[0]}")" && pwd)"
 RENDER_SCRIPT="${SCRIPT_DIR}/render-role-repo-template.sh"
+GITHUB_CLIENT="${SCRIPT_DIR}/github_client.py"
+MANAGED_FILES_MANIFEST="${SCRIPT_DIR}/role-repo-managed-files.txt"
+
+# shellcheck source=role-repo-git.sh
+source "${SCRIPT_DIR}/role-repo-git.sh"
 
 ROLE_SLUG=""
 ROLE_NAME=""
@@ -75,6 +68,8 @@ REPO_NAME=""
 BASE_BRANCH="main"
 SOURCE_REF=""
 WORK_DIR=""
+MIRROR_DIR="${ROLE_REPO_MIRROR_DIR:-}"
+CLONE_MODE="partial"
 SYNC_BRANCH=""
 PR_TITLE=""
 CREATE_PR="true"
@@ -113,6 +108,14 @@ while [ "$#" -gt 0 ]; do
       WORK_DIR="$2"
       shift 2
       ;;
+    --mirror-dir)
+      MIRROR_DIR="$2"
+      shift 2
+      ;;
+    --clone-mode)
+      CLONE_MODE="$2"
+      shift 2
+      ;;
     --sync-branch)
       SYNC_BRANCH="$2"
       shift 2
@@ -159,6 +162,14 @@ if [ -z "$ROLE_SLUG" ] || [ -z "$OWNER" ]; then
   exit 1
 fi
 
+case "$CLONE_MODE" in
+  partial|full) ;;
+  *)
+    echo "Invalid --clone-mode: $CLONE_MODE (expected partial or full)" >&2
+    exit 1
+    ;;
+esac
+
 if [ ! -x "$RENDER_SCRIPT" ]; then
   echo "Renderer script not found or not executable: $RENDER_SCRIPT" >&2
   exit 1
@@ -171,39 +182,13 @@ for cmd in gh git python3; do
   fi
 done
 
-managed_files=(
-  "AGENTS.md"
-  "README.md"
-  ".github/copilot-instructions.md"
-  ".github/pull_request_template.md"
-  ".github/workflows/governance-pr-gates.yml"
-  ".vscode/settings.json"
-  "scripts/bootstrap-governance-labels.sh"
-  "scripts/gh-safe-comment.sh"
-  "scripts/request-pr-review.sh"
-  "scripts/validate-pr-metadata.py"
-  "handbook/README.md"
-  "handbook/sops/README.md"
-  "handbook/sops/general-process-improvement-loop.md"
-  "handbook/runbooks/README.md"
-  "handbook/runbooks/general-governance-label-bootstrap.md"
-  "handbook/runbooks/general-github-commenting.md"
-  "handbook/runbooks/general-reviewer-request-preflight.md"
-  "handbook/templates/README.md"
-  "handbook/templates/general-efficiency-opportunity.md"
-  "handbook/references/README.md"
-)
-
-if [ "$ROLE_SLUG" = "compliance-officer" ]; then
-  managed_files+=(
-    "scripts/co-pr-review.sh"
-    "scripts/co-pr-review-report.sh"
-    "handbook/runbooks/compliance-pr-review-wrapper.md"
-    "handbook/runbooks/compliance-rereview-after-changes.md"
-    "handbook/templates/compliance-pr-review-report.md"
-  )
+if [ ! -f "$MANAGED_FILES_MANIFEST" ]; then
+  echo "Managed files manifest not found: $MANAGED_FILES_MANIFEST" >&2
+  exit 1
 fi
 
+mapfile -t managed_files < <(role_repo_managed_files "$MANAGED_FILES_MANIFEST" "$ROLE_SLUG")
+
 run_publishability_preflight() {
   local target_dir="$1"
   local -a scan_paths=()
@@ -292,7 +277,7 @@ if [ -z "$SOURCE_REF" ]; then
   fi
 fi
 
-if ! gh repo view "$FULL_REPO" >/dev/null 2>&1; then
+if ! python3 "$GITHUB_CLIENT" get "repos/${FULL_REPO}" >/dev/null 2>&1; then
   echo "Target repo does not exist or is inaccessible: $FULL_REPO" >&2
   exit 1
 fi
@@ -305,6 +290,7 @@ RENDER_DIR="${WORK_DIR}/rendered"
 TARGET_DIR="${WORK_DIR}/target"
 
 mkdir -p "$RENDER_DIR" "$TARGET_DIR"
+TARGET_DIR="$(cd "$TARGET_DIR" && pwd)"
 
 render_args=(
   --role-slug "$ROLE_SLUG"
@@ -328,16 +314,42 @@ if [ "$PREFLIGHT_ONLY" = "true" ]; then
   exit 0
 fi
 
-git clone "https://github.com/${FULL_REPO}.git" "$TARGET_DIR" --branch "$BASE_BRANCH" --single-branch >/dev/null
+REMOTE_URL="https://github.com/${FULL_REPO}.git"
+
+if [ -n "$MIRROR_DIR" ]; then
+  MIRROR_PATH="$(role_repo_mirror_path "$MIRROR_DIR" "$OWNER" "$REPO_NAME")"
+  refresh_role_repo_mirror "$MIRROR_PATH" "$REMOTE_URL" "$BASE_BRANCH"
+
+  if ! managed_files_changed "$MIRROR_PATH" "$BASE_BRANCH" "$RENDER_DIR" "${managed_files[@]}"; then
+    echo "No role-repo sync changes detected for ${FULL_REPO} (${ROLE_SLUG})."
+    exit 0
+  fi
+
+  # The worktree is registered in the shared mirror; always unregister it so the
+  # sync branch is not left checked out for the next run.
+  add_role_repo_worktree "$MIRROR_PATH" "$BASE_BRANCH" "$TARGET_DIR"
+  trap 'git -C "$MIRROR_PATH" worktree remove --force "$TARGET_DIR" >/dev/null 2>&1 || true' EXIT
+  checkout_managed_files "$TARGET_DIR" "${managed_files[@]}"
+elif [ "$CLONE_MODE" = "partial" ]; then
+  clone_role_repo_partial "$REMOTE_URL" "$BASE_BRANCH" "$TARGET_DIR"
+
+  if ! managed_files_changed "$TARGET_DIR" HEAD "$RENDER_DIR" "${managed_files[@]}"; then
+    echo "No role-repo sync changes detected for ${FULL_REPO} (${ROLE_SLUG})."
+    exit 0
+  fi
+
+  checkout_managed_files "$TARGET_DIR" "${managed_files[@]}"
+else
+  git clone "$REMOTE_URL" "$TARGET_DIR" --branch "$BASE_BRANCH" --single-branch >/dev/null
+fi
 
-mkdir -p "$TARGET_DIR/.github" "$TARGET_DIR/.vscode"
-mkdir -p "$TARGET_DIR/handbook/sops" "$TARGET_DIR/handbook/runbooks" "$TARGET_DIR/handbook/templates" "$TARGET_DIR/handbook/references"
 for file in "${managed_files[@]}"; do
   mkdir -p "$(dirname "$TARGET_DIR/$file")"
   cp "$RENDER_DIR/$file" "$TARGET_DIR/$file"
 done
 
-if git -C "$TARGET_DIR" diff --quiet -- "${managed_files[@]}"; then
+if git -C "$TARGET_DIR" diff --quiet -- "${managed_files[@]}" \
+  && [ -z "$(git -C "$TARGET_DIR" ls-files --others --exclude-standard -- "${managed_files[@]}")" ]; then
   echo "No role-repo sync changes detected for ${FULL_REPO} (${ROLE_SLUG})."
   exit 0
 fi
@@ -400,91 +412,54 @@ Generated via:
 - \`10-templates/repo-starters/role-repo-template/scripts/build-agent-job-description.py\`
 PRBODY
 
-existing_pr="$(gh api "repos/${FULL_REPO}/pulls?state=open&head=${OWNER}:${SYNC_BRANCH}&base=${BASE_BRANCH}" --jq '.[0].number' 2>/dev/null || true)"
-
-if [ -z "$existing_pr" ] || [ "$existing_pr" = "null" ]; then
-  existing_pr="$(gh api "repos/${FULL_REPO}/pulls?state=open&head=${SYNC_BRANCH}&base=${BASE_BRANCH}" --jq '.[0].number' 2>/dev/null || true)"
-fi
-
-pr_body="$(cat "$PR_BODY_FILE")"
-
-if [ -n "$existing_pr" ] && [ "$existing_pr" != "null" ]; then
-  gh api --method PATCH "repos/${FULL_REPO}/pulls/${existing_pr}" -f title="$PR_TITLE" -f body="$pr_body" >/dev/null
-  pr_number="$existing_pr"
-else
-  create_err_file="$(mktemp "/tmp/${ROLE_SLUG}-pr-create-XXXXXX.err")"
-  if pr_number="$(
-    gh api --method POST "repos/${FULL_REPO}/pulls" \
-      -f title="$PR_TITLE" \
-      -f head="$SYNC_BRANCH" \
-      -f base="$BASE_BRANCH" \
-      -f body="$pr_body" \
-      --jq '.number' 2>"$create_err_file"
-  )"; then
-    true
-  else
-    existing_pr="$(gh api "repos/${FULL_REPO}/pulls?state=open&head=${OWNER}:${SYNC_BRANCH}&base=${BASE_BRANCH}" --jq '.[0].number' 2>/dev/null || true)"
-    if [ -z "$existing_pr" ] || [ "$existing_pr" = "null" ]; then
-      existing_pr="$(gh api "repos/${FULL_REPO}/pulls?state=open&head=${SYNC_BRANCH}&base=${BASE_BRANCH}" --jq '.[0].number' 2>/dev/null || true)"
-    fi
-    if [ -n "$existing_pr" ] && [ "$existing_pr" != "null" ]; then
-      pr_number="$existing_pr"
-    else
-      cat "$create_err_file" >&2
-      exit 1
-    fi
-  fi
+# One aliased lookup for this repo (repo id, open sync PR, label ids) plus one
+# mutation replaces the separate PR list/create/patch/label/metadata REST round
+# trips. It is per repo: each workflow matrix job only holds a token for its own
+# role repo, so lookups are not batched across roles.
+pr_err_file="$(mktemp "/tmp/${ROLE_SLUG}-pr-upsert-XXXXXX.err")"
+if ! pr_fields="$(
+  python3 "$GITHUB_CLIENT" pr-upsert \
+    --repo "$FULL_REPO" \
+    --head "$SYNC_BRANCH" \
+    --base "$BASE_BRANCH" \
+    --title "$PR_TITLE" \
+    --body-file "$PR_BODY_FILE" \
+    --label "role:implementation-specialist" \
+    --label "status:needs-review" \
+    --format fields 2>"$pr_err_file"
+)"; then
+  cat "$pr_err_file" >&2
+  rm -f "$pr_err_file"
+  exit 1
 fi
+rm -f "$pr_err_file"
 
-# Best-effort labeling. If labels are missing in target repos, do not fail sync.
-gh api --method POST "repos/${FULL_REPO}/issues/${pr_number}/labels" \
-  -f labels[]="role:implementation-specialist" \
-  -f labels[]="status:needs-review" >/dev/null 2>&1 || true
+IFS='|' read -r pr_number pr_state_value pr_draft_value pr_merge_state <<<"$pr_fields"
 
 if [ "$AUTO_MERGE" = "true" ]; then
-  pr_meta_file="$(mktemp "/tmp/${ROLE_SLUG}-pr-meta-XXXXXX.json")"
-  if gh api "repos/${FULL_REPO}/pulls/${pr_number}" >"$pr_meta_file" 2>/dev/null; then
-    pr_state="$(python3 - <<'PY' "$pr_meta_file"
-import json
-import sys
-
-with open(sys.argv[1], "r", encoding="utf-8") as f:
-    data = json.load(f)
-
-state = data.get("state", "")
-is_draft = bool(data.get("draft", False))
-merge_state = (data.get("mergeable_state", "") or "").upper()
-print(f"{state.upper()}|{str(is_draft).lower()}|{merge_state}")
-PY
-)"
-    IFS='|' read -r pr_state_value pr_draft_value pr_merge_state <<<"$pr_state"
-    mergeable="false"
-    case "$pr_merge_state" in
-      CLEAN|HAS_HOOKS|UNSTABLE)
-        mergeable="true"
-        ;;
-    esac
-
-    if [ "$pr_state_value" != "OPEN" ]; then
-      echo "Auto-merge skipped for ${FULL_REPO} PR #${pr_number}: PR state is ${pr_state_value}."
-    elif [ "$pr_draft_value" = "true" ]; then
-      echo "Auto-merge skipped for ${FULL_REPO} PR #${pr_number}: PR is draft."
-    elif [ "$mergeable" != "true" ]; then
-      echo "Auto-merge skipped for ${FULL_REPO} PR #${pr_number}: mergeStateStatus=${pr_merge_state}."
+  mergeable="false"
+  case "$pr_merge_state" in
+    CLEAN|HAS_HOOKS|UNSTABLE)
+      mergeable="true"
+      ;;
+  esac
+
+  if [ "$pr_state_value" != "OPEN" ]; then
+    echo "Auto-merge skipped for ${FULL_REPO} PR #${pr_number}: PR state is ${pr_state_value}."
+  elif [ "$pr_draft_value" = "true" ]; then
+    echo "Auto-merge skipped for ${FULL_REPO} PR #${pr_number}: PR is draft."
+  elif [ "$mergeable" != "true" ]; then
+    echo "Auto-merge skipped for ${FULL_REPO} PR #${pr_number}: mergeStateStatus=${pr_merge_state}."
+  else
+    merge_err_file="$(mktemp "/tmp/${ROLE_SLUG}-pr-merge-XXXXXX.err")"
+    if gh pr merge --repo "$FULL_REPO" "$pr_number" --auto --squash --delete-branch >/dev/null 2>"$merge_err_file"; then
+      echo "Auto-merge enabled for ${FULL_REPO} PR #${pr_number}."
     else
-      merge_err_file="$(mktemp "/tmp/${ROLE_SLUG}-pr-merge-XXXXXX.err")"
-      if gh pr merge --repo "$FULL_REPO" "$pr_number" --auto --squash --delete-branch >/dev/null 2>"$merge_err_file"; then
-        echo "Auto-merge enabled for ${FULL_REPO} PR #${pr_number}."
-      else
-        merge_err_msg="$(tr '\n' ' ' < "$merge_err_file" | sed -E 's/[[:space:]]+/ /g')"
-        echo "Auto-merge request failed (non-fatal) for ${FULL_REPO} PR #${pr_number}: ${merge_err_msg}"
-      fi
-      rm -f "$merge_err_file"
+      merge_err_msg="$(tr '\n' ' ' < "$merge_err_file" | sed -E 's/[[:space:]]+/ /g')"
+      echo "Auto-merge request failed (non-fatal) for ${FULL_REPO} PR #${pr_number}: ${merge_err_msg}"
     fi
-  else
-    echo "Auto-merge skipped for ${FULL_REPO} PR #${pr_number}: unable to query PR metadata."
+    rm -f "$merge_err_file"
   fi
-  rm -f "$pr_meta_file"
 fi
 
 echo "Synced role repo and opened/updated PR: https://github.com/${FULL_REPO}/pull/${pr_number}"